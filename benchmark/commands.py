@@ -0,0 +1,95 @@
+"""
+Benchmark of the issuing of commands.
+
+Compare the former conflict check of a new command, a scan of every scheduled command, with the per-entity index
+of the CommandScheduler, as N villagers are issued a move command every tick.
+Run it from the root of the repository with: python -m benchmark.commands
+"""
+
+import time
+
+from controller.command_controller import CommandController
+from controller.network_controller import NullNetworkController
+from model.commands.command import Command
+from model.commands.command_scheduler import CommandScheduler
+from model.entity import Entity
+from model.player.player import Player
+from model.units.villager import Villager
+from util.coordinate import Coordinate
+from util.map import Map
+from util.state_manager import Process
+
+UNITS = [250, 500, 1000, 2000, 4000]
+TICKS = 20
+
+
+class ScanningScheduler(CommandScheduler):
+    """A scheduler finding the commands of an entity by scanning every scheduled command, as the shared list did."""
+
+    def get_commands(self, entity: Entity) -> list[Command]:
+        return [command for command in self if command.get_entity() == entity]
+
+
+def setup(units: int, scheduler: CommandScheduler) -> tuple[CommandController, list]:
+    """
+    Place villagers on every other column of a map, each one walking back and forth between two tiles.
+
+    :param units: The number of villagers.
+    :type units: int
+    :param scheduler: The scheduler of the commands.
+    :type scheduler: CommandScheduler
+    :return: The command manager of the player and the villagers with the two tiles they walk between.
+    :rtype: tuple[CommandController, list]
+    """
+    size = 2 * int(units**0.5) + 2
+    game_map = Map(size)
+    player = Player("player", "blue")
+    player.set_max_population(units)
+    # A conversion coefficient of 0 makes the moves last a single tick, so that every villager moves every tick
+    manager = CommandController(game_map, player, 0, scheduler, NullNetworkController())
+    walkers = []
+    for index in range(units):
+        y, x = divmod(index, size // 2)
+        villager = Villager()
+        coordinate = Coordinate.of(2 * x, y)
+        game_map.add(villager, coordinate)
+        villager.set_coordinate(coordinate)
+        villager.set_player(player)
+        walkers.append((villager, coordinate, Coordinate.of(2 * x + 1, y)))
+    return manager, walkers
+
+
+def play(manager: CommandController, walkers: list) -> int:
+    """
+    Issue a move command to every villager, then run the commands, for TICKS ticks.
+
+    :return: The number of commands issued.
+    :rtype: int
+    """
+    scheduler = manager.get_command_list()
+    issued = 0
+    for _ in range(TICKS):
+        for villager, start, end in walkers:
+            target = end if villager.get_coordinate() is start else start
+            manager.command(villager, Process.MOVE, target)
+            issued += 1
+        scheduler.run(lambda command: command.run_command())
+    return issued
+
+
+def main() -> None:
+    """Issue the commands of every number of villagers with both schedulers and print the commands issued per second."""
+    schedulers = {"scan": ScanningScheduler, "index": CommandScheduler}
+    print(f"{'units':>6}" + "".join(f"{name:>14}" for name in schedulers))
+    for units in UNITS:
+        rates = []
+        for scheduler in schedulers.values():
+            manager, walkers = setup(units, scheduler())
+            start = time.perf_counter()
+            issued = play(manager, walkers)
+            rates.append(issued / (time.perf_counter() - start))
+        print(f"{units:>6}" + "".join(f"{rate:>14,.0f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark of the Coordinate class.
+
+Compare the slotted, interned coordinates with a replica of the former dictionary-based class on the operations
+the map relies on: creating the coordinates of the tiles, hashing them in dictionary lookups and stepping to a neighbour.
+Run it from the root of the repository with: python -m benchmark.coordinate
+"""
+
+import time
+import tracemalloc
+
+from util.coordinate import Coordinate
+
+SIZES = [120, 240, 480]
+LOOKUPS = 200_000
+
+
+class LegacyCoordinate:
+    """The former Coordinate: attributes in a dictionary and a tuple built on every hash."""
+
+    def __init__(self, x: int, y: int):
+        self.__x = x
+        self.__y = y
+
+    def get_x(self) -> int:
+        return self.__x
+
+    def get_y(self) -> int:
+        return self.__y
+
+    def __hash__(self) -> int:
+        return hash((self.get_x(), self.get_y()))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LegacyCoordinate):
+            return False
+        return self.get_x() == other.get_x() and self.get_y() == other.get_y()
+
+    def __add__(self, other: "LegacyCoordinate") -> "LegacyCoordinate":
+        return LegacyCoordinate(
+            self.get_x() + other.get_x(), self.get_y() + other.get_y()
+        )
+
+
+def allocation(factory, size: int) -> tuple[float, float]:
+    """
+    Create the coordinates of every tile of a map twice, as the game loop does, and measure the memory kept.
+
+    :param factory: The function creating a coordinate from (x, y).
+    :type factory: Callable[[int, int], object]
+    :param size: The size of the map.
+    :type size: int
+    :return: The elapsed time in milliseconds and the memory kept in MiB.
+    :rtype: tuple[float, float]
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = [factory(x, y) for _ in range(2) for y in range(size) for x in range(size)]
+    elapsed = (time.perf_counter() - start) * 1000
+    memory = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+    del kept
+    return elapsed, memory
+
+
+def hashing(factory, size: int) -> float:
+    """
+    Look up coordinates in a dictionary keyed by the coordinates of every tile.
+
+    :param factory: The function creating a coordinate from (x, y).
+    :type factory: Callable[[int, int], object]
+    :param size: The size of the map.
+    :type size: int
+    :return: The elapsed time in milliseconds.
+    :rtype: float
+    """
+    table = {factory(x, y): None for y in range(size) for x in range(size)}
+    keys = [factory(i % size, (i * 7) % size) for i in range(LOOKUPS)]
+    start = time.perf_counter()
+    for key in keys:
+        table.get(key)
+    return (time.perf_counter() - start) * 1000
+
+
+def stepping(factory, size: int) -> float:
+    """
+    Step a coordinate to its right neighbour many times.
+
+    :param factory: The function creating a coordinate from (x, y).
+    :type factory: Callable[[int, int], object]
+    :param size: The size of the map.
+    :type size: int
+    :return: The elapsed time in milliseconds.
+    :rtype: float
+    """
+    step = factory(1, 0)
+    start = time.perf_counter()
+    for i in range(LOOKUPS):
+        factory(i % (size - 1), 0) + step
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    """Print the time and memory of every operation for both classes and every size."""
+    factories = {"legacy": LegacyCoordinate, "interned": Coordinate.of}
+    print(
+        f"{'size':>5}{'class':>10}{'create ms':>12}{'kept MiB':>10}"
+        f"{'lookup ms':>12}{'step ms':>10}"
+    )
+    for size in SIZES:
+        for name, factory in factories.items():
+            elapsed, memory = allocation(factory, size)
+            print(
+                f"{size:>5}{name:>10}{elapsed:>12.1f}{memory:>10.1f}"
+                f"{hashing(factory, size):>12.1f}{stepping(factory, size):>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
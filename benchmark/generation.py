@@ -0,0 +1,86 @@
+"""
+Benchmark of the placement of the resources when a map is generated.
+
+Compare the former placement, one random tile at a time retried until it is free, with Map.bulk_place,
+for the resources of every map type filling an empty map.
+Then record the time taken by the MapGenerator to generate every map type, and to load it back from its cache.
+Run it from the root of the repository with: python -m benchmark.generation
+"""
+
+import random
+import tempfile
+
+from benchmark.map_storage import measure
+from model.resources.gold import Gold
+from model.resources.wood import Wood
+from util.coordinate import Coordinate
+from util.map import Map
+from util.map_generator import MapGenerator
+from util.state_manager import MapSize, MapType, StartingCondition
+
+SIZES = [size.value for size in MapSize if size.value <= MapSize.LARGE.value]
+RESOURCES = {
+    MapType.RICH: [(Wood, 0.05), (Gold, 0.005)],
+    MapType.GOLD_CENTER: [(Wood, 0.05)],
+}
+
+
+def place_retry(game_map: Map, resources: list[tuple], rng: random.Random) -> None:
+    """Place every resource on a random tile, picking again until the tile is free."""
+    size = game_map.get_size()
+    for resource_class, share in resources:
+        for _ in range(int(size**2 * share)):
+            resource = resource_class()
+            while True:
+                coordinate = Coordinate(
+                    rng.randint(0, size - 1), rng.randint(0, size - 1)
+                )
+                if game_map.check_placement(resource, coordinate):
+                    break
+            game_map.add(resource, coordinate)
+            resource.set_coordinate(coordinate)
+
+
+def place_bulk(game_map: Map, resources: list[tuple], rng: random.Random) -> None:
+    """Place the resources of each kind with a single call to Map.bulk_place."""
+    size = game_map.get_size()
+    for resource_class, share in resources:
+        game_map.bulk_place(resource_class, int(size**2 * share), rng)
+
+
+BENCHMARKS = {"retry": place_retry, "bulk_place": place_bulk}
+GENERATED_TYPES = [MapType.RICH, MapType.GOLD_CENTER, MapType.CLUSTERED]
+
+
+def main() -> None:
+    """Generate the resources of every map type for every size with both methods and print the time in milliseconds."""
+    print(
+        f"{'size':>5} {'map type':<12}" + "".join(f"{name:>12}" for name in BENCHMARKS)
+    )
+    for size in SIZES:
+        for map_type, resources in RESOURCES.items():
+            timings = [
+                measure(benchmark, Map(size), resources, random.Random(size))
+                for benchmark in BENCHMARKS.values()
+            ]
+            print(
+                f"{size:>5} {map_type.name:<12}"
+                + "".join(f"{t:>12.1f}" for t in timings)
+            )
+    print()
+    print(f"{'size':>5} {'map type':<12}{'generate':>12}{'cached':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        for map_size in MapSize:
+            for map_type in GENERATED_TYPES:
+                generator = MapGenerator(
+                    0, map_type, map_size, StartingCondition.LEAN, directory
+                )
+                timings = [measure(generator.generate) for _ in range(2)]
+                print(
+                    f"{map_size.value:>5} {map_type.name:<12}"
+                    + "".join(f"{t:>12.1f}" for t in timings)
+                )
+
+
+if __name__ == "__main__":
+    main()
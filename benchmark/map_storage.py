@@ -0,0 +1,163 @@
+"""
+Benchmark of the Map storage backends.
+
+Compare the dictionary storage with the grid storage on the operations the game loop relies on.
+Run it from the root of the repository with: python -m benchmark.map_storage
+"""
+
+import random
+import time
+
+from model.buildings.town_center import TownCenter
+from model.resources.wood import Wood
+from model.units.villager import Villager
+from util.coordinate import Coordinate
+from util.map import Map
+from util.storage.chunked_storage import ChunkedStorage
+from util.storage.dict_storage import DictStorage
+from util.storage.grid_storage import GridStorage
+from util.storage.map_storage import MapStorage
+
+SIZES = [120, 240, 480]
+STORAGES = [DictStorage, GridStorage, ChunkedStorage]
+LOOKUPS = 200_000
+SPARSE_SIZE = 2000
+SPARSE_EXTENT = 480
+
+
+def populate(
+    size: int, storage: type[MapStorage], seed: int = 0, extent: int = None
+) -> Map:
+    """
+    Create a map filled like a RICH map: 5% of wood and some town centers.
+    The objects can be kept in the top left corner of the map, to model a very large and mostly empty world.
+
+    :param size: The size of the map.
+    :type size: int
+    :param storage: The storage backend class.
+    :type storage: type[MapStorage]
+    :param seed: The seed of the random generator.
+    :type seed: int
+    :param extent: The size of the populated corner, None for the whole map.
+    :type extent: int
+    :return: The populated map.
+    :rtype: Map
+    """
+    rng = random.Random(seed)
+    game_map = Map(size, storage)
+    extent = size if extent is None else extent
+    wood = Wood()
+    for _ in range(int(extent**2 * 0.05)):
+        coordinate = Coordinate(rng.randrange(extent), rng.randrange(extent))
+        if game_map.check_placement(wood, coordinate):
+            game_map.add(wood, coordinate)
+    for _ in range(extent // 10):
+        town_center = TownCenter()
+        coordinate = Coordinate(rng.randrange(extent), rng.randrange(extent))
+        if game_map.check_placement(town_center, coordinate):
+            game_map.add(town_center, coordinate)
+    return game_map
+
+
+def measure(function, *args) -> float:
+    """
+    Measure the time taken by a function call.
+
+    :param function: The function to call.
+    :type function: Callable
+    :return: The elapsed time in milliseconds.
+    :rtype: float
+    """
+    start = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def bench_get(game_map: Map, coordinates: list[Coordinate]) -> None:
+    """Look up many tiles through Map.get."""
+    for coordinate in coordinates:
+        game_map.get(coordinate)
+
+
+def bench_get_xy(game_map: Map, coordinates: list[Coordinate]) -> None:
+    """Look up many tiles through Map.get_xy."""
+    for coordinate in coordinates:
+        game_map.get_xy(coordinate.get_x(), coordinate.get_y())
+
+
+def bench_placement(game_map: Map, coordinates: list[Coordinate]) -> None:
+    """Check the placement of a town center on many tiles."""
+    town_center = TownCenter()
+    for coordinate in coordinates[: len(coordinates) // 10]:
+        game_map.check_placement(town_center, coordinate)
+
+
+def bench_moves(game_map: Map, coordinates: list[Coordinate]) -> None:
+    """Add villagers and walk them one tile to the right and back."""
+    villagers = []
+    for coordinate in coordinates[:1000]:
+        villager = Villager()
+        if game_map.check_placement(villager, coordinate):
+            game_map.add(villager, coordinate)
+            villager.set_coordinate(coordinate)
+            villagers.append(villager)
+    for step in (1, -1):
+        for villager in villagers:
+            target = villager.get_coordinate() + Coordinate(step, 0)
+            if game_map.check_placement(villager, target):
+                game_map.move(villager, target)
+                villager.set_coordinate(target)
+    for villager in villagers:
+        game_map.remove(villager.get_coordinate())
+
+
+def bench_capture(game_map: Map, coordinates: list[Coordinate]) -> None:
+    """Copy the map, as the AI loop does every refresh."""
+    for _ in range(10):
+        game_map.capture()
+
+
+def bench_get_map(game_map: Map, coordinates: list[Coordinate]) -> None:
+    """List the objects of the map, as the 2.5D view does every frame."""
+    game_map.get_map()
+
+
+def bench_view(game_map: Map, coordinates: list[Coordinate]) -> None:
+    """Cut 100 terminal viewports out of the map."""
+    for coordinate in coordinates[:100]:
+        game_map.get_from_to(coordinate, coordinate + Coordinate(40, 20))
+
+
+BENCHMARKS = {
+    "get": bench_get,
+    "get_xy": bench_get_xy,
+    "check_placement": bench_placement,
+    "add/move/remove": bench_moves,
+    "capture x10": bench_capture,
+    "get_map": bench_get_map,
+    "view x100": bench_view,
+}
+
+
+def main() -> None:
+    """Run every benchmark for every size and storage and print a table in milliseconds."""
+    print(
+        f"{'size':>5} {'benchmark':<16}"
+        + "".join(f"{s.__name__:>16}" for s in STORAGES)
+    )
+    # The last row is a very large and mostly empty map, where the chunked storage skips the empty chunks
+    for size, extent in [(size, None) for size in SIZES] + [
+        (SPARSE_SIZE, SPARSE_EXTENT)
+    ]:
+        rng = random.Random(size)
+        coordinates = [
+            Coordinate(rng.randrange(size), rng.randrange(size)) for _ in range(LOOKUPS)
+        ]
+        maps = {storage: populate(size, storage, 0, extent) for storage in STORAGES}
+        for name, benchmark in BENCHMARKS.items():
+            timings = [measure(benchmark, maps[s], coordinates) for s in STORAGES]
+            print(f"{size:>5} {name:<16}" + "".join(f"{t:>16.1f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
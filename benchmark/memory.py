@@ -0,0 +1,48 @@
+"""
+Benchmark of the memory of the game objects.
+
+Measure with tracemalloc the memory allocated per object when many units, buildings and resources are created,
+as at the population cap of several players.
+Run it from the root of the repository with: python -m benchmark.memory
+"""
+
+import tracemalloc
+
+from model.buildings.house import House
+from model.buildings.town_center import TownCenter
+from model.resources.wood import Wood
+from model.units.archer import Archer
+from model.units.villager import Villager
+
+OBJECTS = 10000
+CLASSES = [Villager, Archer, House, TownCenter, Wood]
+
+
+def measure_memory(object_class: type) -> float:
+    """
+    Measure the memory allocated per object when OBJECTS objects of a class are created.
+
+    :param object_class: The class of the objects.
+    :type object_class: type
+    :return: The memory per object, in bytes.
+    :rtype: float
+    """
+    object_class()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    objects = [object_class() for _ in range(OBJECTS)]
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del objects
+    return used / OBJECTS
+
+
+def main() -> None:
+    """Print the memory per object of every class."""
+    print(f"{'class':>12}{'bytes':>10}")
+    for object_class in CLASSES:
+        print(f"{object_class.__name__:>12}{measure_memory(object_class):>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
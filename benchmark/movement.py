@@ -0,0 +1,86 @@
+"""
+Benchmark of the moves of the units on the map.
+
+Compare the former move of a unit, an adjacency check followed by a removal and an addition, with Map.step,
+which swaps the two tiles in place, on villagers walking back and forth across a populated map.
+Run it from the root of the repository with: python -m benchmark.movement
+"""
+
+from benchmark.map_storage import measure, populate
+from model.units.villager import Villager
+from util.coordinate import Coordinate
+from util.map import Map
+from util.storage.grid_storage import GridStorage
+
+SIZES = [120, 240, 480]
+UNITS = 200
+STEPS = 50_000
+
+
+def move_legacy(game_map: Map, unit: Villager, coordinate: Coordinate) -> None:
+    """Move a unit like Map.move did before the fast path of the units of size 1."""
+    if not unit.get_coordinate().is_adjacent(coordinate):
+        raise ValueError("Not adjacent.")
+    if not game_map.check_placement(unit, coordinate):
+        raise ValueError("Not available.")
+    if game_map.get(unit.get_coordinate()):
+        game_map.remove(unit.get_coordinate())
+    game_map.add(unit, coordinate)
+
+
+def move_step(game_map: Map, unit: Villager, coordinate: Coordinate) -> None:
+    """Move a unit with Map.step."""
+    game_map.step(unit, coordinate)
+
+
+BENCHMARKS = {"legacy": move_legacy, "step": move_step}
+
+
+def place_units(game_map: Map) -> list[tuple[Villager, Coordinate, Coordinate]]:
+    """
+    Place villagers on empty tiles whose right neighbour is empty too, so that each one can walk back and forth.
+
+    :param game_map: The populated map.
+    :type game_map: Map
+    :return: The villagers with the two tiles they walk between.
+    :rtype: list[tuple[Villager, Coordinate, Coordinate]]
+    """
+    size = game_map.get_size()
+    walkable = game_map.get_walkable()
+    walkers = []
+    for index in range(0, size * size - 1, 7):
+        if len(walkers) == UNITS:
+            break
+        y, x = divmod(index, size)
+        if x + 1 < size and walkable[index] and walkable[index + 1]:
+            unit = Villager()
+            coordinate = Coordinate.of(x, y)
+            game_map.add(unit, coordinate)
+            unit.set_coordinate(coordinate)
+            walkers.append((unit, coordinate, Coordinate.of(x + 1, y)))
+    return walkers
+
+
+def walk(move, game_map: Map, walkers: list) -> None:
+    """Step the villagers in turn between their two tiles, STEPS moves in total."""
+    for step in range(STEPS):
+        unit, start, end = walkers[step % len(walkers)]
+        target = end if unit.get_coordinate() is start else start
+        move(game_map, unit, target)
+        unit.set_coordinate(target)
+
+
+def main() -> None:
+    """Walk the villagers of every size of map with both moves and print the units stepped per second."""
+    print(f"{'size':>5}" + "".join(f"{name:>14}" for name in BENCHMARKS))
+    for size in SIZES:
+        rates = []
+        for move in BENCHMARKS.values():
+            game_map = populate(size, GridStorage)
+            walkers = place_units(game_map)
+            rates.append(STEPS / measure(walk, move, game_map, walkers) * 1000)
+        print(f"{size:>5}" + "".join(f"{rate:>14,.0f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark of the pathfinders.
+
+Compare the pathfinding package, which the Map used to rely on, with the project Pathfinder in A* and Jump Point Search modes, and the hierarchical pathfinding of the Map.
+Run it from the root of the repository with: python -m benchmark.pathfinding
+"""
+
+import random
+
+from pathfinding.core.diagonal_movement import DiagonalMovement
+from pathfinding.core.grid import Grid
+from pathfinding.finder.a_star import AStarFinder
+
+from benchmark.map_storage import measure, populate
+from util.coordinate import Coordinate
+from util.map import Map
+from util.pathfinder import Pathfinder
+from util.storage.grid_storage import GridStorage
+
+SIZES = [120, 240, 480]
+QUERIES = 5
+
+
+def pick_queries(game_map: Map, count: int, seed: int) -> list[tuple]:
+    """
+    Pick pairs of empty tiles, far enough from each other to make the search meaningful.
+
+    :param game_map: The map to pick the tiles from.
+    :type game_map: Map
+    :param count: The number of pairs.
+    :type count: int
+    :param seed: The seed of the random generator.
+    :type seed: int
+    :return: The list of ((x, y), (x, y)) pairs.
+    :rtype: list[tuple]
+    """
+    rng = random.Random(seed)
+    size = game_map.get_size()
+    queries = []
+    while len(queries) < count:
+        start = (rng.randrange(size), rng.randrange(size))
+        end = (rng.randrange(size), rng.randrange(size))
+        far = abs(start[0] - end[0]) + abs(start[1] - end[1]) > size // 2
+        if far and game_map.get_xy(*start) is None and game_map.get_xy(*end) is None:
+            queries.append((start, end))
+    return queries
+
+
+def bench_library(game_map: Map, queries: list[tuple]) -> None:
+    """Build a Grid from the walkability matrix and run AStarFinder for every query."""
+    size = game_map.get_size()
+    walkable = game_map.get_walkable()
+    for start, end in queries:
+        matrix = [list(walkable[y * size : (y + 1) * size]) for y in range(size)]
+        grid = Grid(matrix=matrix)
+        finder = AStarFinder(diagonal_movement=DiagonalMovement.always)
+        finder.find_path(grid.node(*start), grid.node(*end), grid)
+
+
+def bench_a_star(game_map: Map, queries: list[tuple]) -> None:
+    """Run the project Pathfinder in A* mode for every query."""
+    pathfinder = Pathfinder.get_instance(game_map.get_size())
+    for start, end in queries:
+        pathfinder.find_path(game_map.get_walkable(), start, end, jump_point=False)
+
+
+def bench_jump_point(game_map: Map, queries: list[tuple]) -> None:
+    """Run the project Pathfinder in Jump Point Search mode for every query."""
+    pathfinder = Pathfinder.get_instance(game_map.get_size())
+    for start, end in queries:
+        pathfinder.find_path(game_map.get_walkable(), start, end)
+
+
+def bench_hierarchical(game_map: Map, queries: list[tuple]) -> None:
+    """Run the hierarchical pathfinding of the Map for every query, the cluster graph being built on the first one."""
+    for start, end in queries:
+        game_map.path_finding_hierarchical(Coordinate(*start), Coordinate(*end))
+
+
+BENCHMARKS = {
+    "pathfinding": bench_library,
+    "a_star": bench_a_star,
+    "jump_point": bench_jump_point,
+    "hierarchical": bench_hierarchical,
+}
+
+
+def main() -> None:
+    """Run every pathfinder on the same queries for every size and print the mean time per path in milliseconds."""
+    print(f"{'size':>5}" + "".join(f"{name:>14}" for name in BENCHMARKS))
+    for size in SIZES:
+        game_map = populate(size, GridStorage)
+        queries = pick_queries(game_map, QUERIES, size)
+        timings = [
+            measure(benchmark, game_map, queries) / QUERIES
+            for benchmark in BENCHMARKS.values()
+        ]
+        print(f"{size:>5}" + "".join(f"{t:>14.1f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
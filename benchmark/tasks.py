@@ -0,0 +1,111 @@
+"""
+Benchmark of the execution of the tasks.
+
+Compare the former TaskController, executing the task of every unit at every tick, with the event-driven one, parking
+a task until its command is completed, as N villagers wait on the countdown of their move commands.
+Run it from the root of the repository with: python -m benchmark.tasks
+"""
+
+import time
+
+from controller.command_controller import CommandController
+from controller.network_controller import NullNetworkController
+from controller.task_manager import TaskController
+from model.commands.command_scheduler import CommandScheduler
+from model.player.player import Player
+from model.tasks.move_task import MoveTask
+from model.units.villager import Villager
+from util.coordinate import Coordinate
+from util.map import Map
+
+UNITS = [250, 500, 1000, 2000, 4000]
+TICKS = 200
+# A move of a villager lasts 0.8 s, so that a coefficient of 600 ticks per second keeps it waiting for 480 ticks
+CONVERT_COEFF = 600
+
+
+class PollingTaskController(TaskController):
+    """A task manager executing the task of every unit at every tick, as the former TaskController did."""
+
+    def __init__(self, command_manager: CommandController) -> None:
+        super().__init__(command_manager)
+        self.__player: Player = command_manager.get_player()
+
+    def execute_tasks(self) -> None:
+        for unit in self.__player.get_units():
+            if unit.get_task() is not None:
+                try:
+                    unit.get_task().execute_task()
+                except (ValueError, IndexError):
+                    unit.set_task(None)
+
+
+def setup(units: int, task_manager: type) -> tuple[TaskController, CommandScheduler]:
+    """
+    Place villagers on every other tile of every other row of a map, each one moving to the tile below it.
+
+    :param units: The number of villagers.
+    :type units: int
+    :param task_manager: The class of the task manager.
+    :type task_manager: type
+    :return: The task manager of the player and the scheduler of the commands.
+    :rtype: tuple[TaskController, CommandScheduler]
+    """
+    side = int(units**0.5) + 1
+    game_map = Map(2 * side)
+    scheduler = CommandScheduler()
+    player = Player("player", "blue")
+    player.set_max_population(units)
+    player.set_command_manager(
+        CommandController(
+            game_map, player, CONVERT_COEFF, scheduler, NullNetworkController()
+        )
+    )
+    manager = task_manager(player.get_command_manager())
+    player.set_task_manager(manager)
+    for index in range(units):
+        y, x = divmod(index, side)
+        villager = Villager()
+        coordinate = Coordinate.of(2 * x, 2 * y)
+        game_map.add(villager, coordinate)
+        villager.set_coordinate(coordinate)
+        villager.set_player(player)
+        player.add_unit(villager)
+        villager.set_task(
+            MoveTask(
+                player.get_command_manager(),
+                villager,
+                Coordinate.of(2 * x, 2 * y + 1),
+            )
+        )
+    return manager, scheduler
+
+
+def play(manager: TaskController, scheduler: CommandScheduler) -> float:
+    """
+    Start the moves, then execute the tasks and run the commands for TICKS ticks while the villagers wait.
+
+    :return: The mean time of a tick, in microseconds.
+    :rtype: float
+    """
+    for _ in range(2):
+        manager.execute_tasks()
+        scheduler.run(lambda command: command.run_command())
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        manager.execute_tasks()
+        scheduler.run(lambda command: command.run_command())
+    return (time.perf_counter() - start) / TICKS * 1e6
+
+
+def main() -> None:
+    """Play the ticks of every number of villagers with both task managers and print the mean time of a tick."""
+    managers = {"polling (us)": PollingTaskController, "events (us)": TaskController}
+    print(f"{'units':>6}" + "".join(f"{name:>14}" for name in managers))
+    for units in UNITS:
+        times = [play(*setup(units, manager)) for manager in managers.values()]
+        print(f"{units:>6}" + "".join(f"{tick:>14,.1f}" for tick in times))
+
+
+if __name__ == "__main__":
+    main()
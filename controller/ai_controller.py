@@ -1,3 +1,4 @@
+import time
 import typing
 
 from model.ai import AI
@@ -6,8 +7,6 @@ if typing.TYPE_CHECKING:
     from controller.game_controller import GameController
     from model.player.strategies.strategy import Strategy
 
-from pygame import time
-
 from model.player.player import Player
 
 
@@ -36,17 +35,15 @@ class AIController:
 
     def update_knowledge(self) -> None:
         """
-        Updates the known map of the player.
-
-        :param player: The player.
-        :type player: Player
+        Updates the known map of the players, which all share the same snapshot of the map.
         """
         for player in self.__players:
             player.update_centre_coordinate()
+        snapshot = self.__game_controller.get_map().snapshot()
         for player in self.__players:
             if player.get_ai() is None:
                 continue
-            player.get_ai().set_map_known(self.__game_controller.get_map().capture())
+            player.get_ai().set_map_known(snapshot)
             player.get_ai().update_enemies(
                 [enemy.capture() for enemy in self.__players if enemy != player]
             )
@@ -57,17 +54,14 @@ class AIController:
         """
         while self.__running:
             ##print("AI loop")
-            for player in self.__players:
-                self.update_knowledge()
+            self.update_knowledge()
             for player in self.__players:
                 try:
                     player.get_ai().get_strategy().execute()
                 except (ValueError, IndexError, AttributeError):
                     pass
             if self.__game_controller.get_speed() != 0:
-                time.wait(
-                    1000 * self.__refresh_rate // self.__game_controller.get_speed()
-                )
+                time.sleep(self.__refresh_rate / self.__game_controller.get_speed())
 
     def pause(self) -> None:
         """
@@ -3,6 +3,7 @@ from model.commands.attack_command import AttackCommand
 from model.commands.build_command import BuildCommand
 from model.commands.collect_command import CollectCommand
 from model.commands.command import Command
+from model.commands.command_scheduler import CommandScheduler
 from model.commands.drop_command import DropCommand
 from model.commands.move_command import MoveCommand
 from model.commands.spawn_command import SpawnCommand
@@ -19,14 +20,14 @@ if typing.TYPE_CHECKING:
 
 
 class CommandController:
-    """This class is responsible for managing commands of a single player, using the same list of commands for all players."""
+    """This class is responsible for managing commands of a single player, using the same scheduler of commands for all players."""
 
     def __init__(
         self,
         game_map: Map,
         player: Player,
         convert_coeff: int,
-        command_list: list[Command],
+        command_list: CommandScheduler,
         network_controller: "NetworkController",
     ) -> None:
         """
@@ -41,7 +42,7 @@ class CommandController:
         self.__map: Map = game_map
         self.__player: Player = player
         self.__convert_coeff: int = convert_coeff
-        self.__command_list: list[Command] = command_list
+        self.__command_list: CommandScheduler = command_list
         self.__network_controller: "NetworkController" = network_controller
 
     def get_map(self):
@@ -52,14 +53,22 @@ class CommandController:
         """
         return self.__map
 
-    def get_command_list(self) -> list[Command]:
+    def get_command_list(self) -> CommandScheduler:
         """
-        Returns the command list.
-        :return: The command list.
-        :rtype: list
+        Returns the scheduler of the commands.
+        :return: The scheduler of the commands.
+        :rtype: CommandScheduler
         """
         return self.__command_list
 
+    def set_command_list(self, command_list: CommandScheduler) -> None:
+        """
+        Sets the scheduler of the commands, when a game is loaded.
+        :param command_list: The scheduler of the commands.
+        :type command_list: CommandScheduler
+        """
+        self.__command_list = command_list
+
     def get_player(self) -> Player:
         return self.__player
 
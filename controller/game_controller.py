@@ -3,22 +3,19 @@ import random
 import threading
 import typing
 
-from pygame import time
-
 from controller.ai_controller import AIController
 from controller.command_controller import CommandController
 from controller.network_controller import NetworkController
-from model.buildings.barracks import Barracks
 from model.buildings.building import Building
-from model.buildings.farm import Farm
-from model.buildings.house import House
 from model.game_object import GameObject
 from model.interactions import Interactions
 from controller.task_manager import TaskController
 from controller.view_controller import ViewController
+from model import catalogue
 from model.ai import AI
 from model.buildings.town_center import TownCenter
 from model.commands.command import Command
+from model.commands.command_scheduler import CommandScheduler
 from model.player.player import Player
 from model.player.strategies.random_strategy import RandomStrategy
 from model.resources.food import Food
@@ -26,15 +23,14 @@ from model.resources.gold import Gold
 from model.resources.resource import Resource
 from model.resources.wood import Wood
 from model.tasks.build_task import BuildTask
-from model.units.archer import Archer
-from model.units.horseman import Horseman
-from model.units.swordsman import Swordsman
 from model.units.unit import Unit
 from model.units.villager import Villager
 from util.coordinate import Coordinate
 from util.map import Map
+from util.map_generator import MapGenerator
 from util.settings import Settings
 from util.state_manager import InteractionsTypes, MapType, StartingCondition
+from util.tick_scheduler import TickScheduler
 
 if typing.TYPE_CHECKING:
     from controller.menu_controller import MenuController
@@ -72,12 +68,13 @@ class GameController:
         self.__network_controller: NetworkController = NetworkController()
         self.__menu_controller: "MenuController" = menu_controller
         self.settings: Settings = self.__menu_controller.settings
-        self.__command_list: list[Command] = []
+        self.__command_list: CommandScheduler = CommandScheduler()
         self.__players: list[Player] = []
         self.__map: Map = self.__generate_map()
         self.__ai_controller: AIController = AIController(self, 1)
         self.__assign_AI()
         self.__running: bool = False
+        self.__scheduler: TickScheduler = TickScheduler(self.settings.fps.value)
         if not load:
             self.__game_thread = threading.Thread(target=self.game_loop)
             self.__ai_thread = threading.Thread(target=self.__ai_controller.ai_loop)
@@ -163,43 +160,24 @@ class GameController:
         :return: The generated map.
         :rtype: Map
         """
-        map_generation: Map = Map(self.settings.map_size.value)
-
-        # Temporary: Create a Building called "Center" at the center of the map
-        # Note: It will be size 1, except if the map size is even (it will be size 2 in this case)
-        # from model.buildings.building import Building
-        # center_size = 2 if map_generation.get_size() % 2 == 0 else 1
-        # center_coordinate = Coordinate((map_generation.get_size() - center_size) // 2, (map_generation.get_size() - center_size) // 2)
-        # center = Building("Center", "C", 1, {}, center_size, 0)
-        # map_generation.add(center, center_coordinate)
-        # center.set_coordinate(center_coordinate)
+        # The map is reproducible from its seed; a random seed is drawn when none is set, and such maps are not cached
+        seed = getattr(self.settings, "seed", None)
+        generator = MapGenerator(
+            random.randrange(2**32) if seed is None else seed,
+            self.settings.map_type,
+            self.settings.map_size,
+            self.settings.starting_condition,
+            MapGenerator.CACHE_DIRECTORY if seed is not None else None,
+        )
+        map_generation, coordinate, villager_coordinates = generator.generate()
 
         # Generate the players:
-        # Place the town center of the first player at random position, far from the center (30% of map size).
-        # Place the 2nd player town center at the opposite side of the map.
+        # The town center of the first player was placed by the generator far from the center (30% of map size),
+        # with its villagers around it.
         self.__generate_player(uuid.uuid4(), map_generation)
         interactions = Interactions(map_generation, self.__network_controller)
-        min_distance = int(self.settings.map_size.value * 0.3)
         player = self.get_players()[0]
         town_center = TownCenter()
-        while True:
-            # Get a random coordinate. If it is at less than min_distance from the center, try again.
-            center_size = 2 if map_generation.get_size() % 2 == 0 else 1
-            center_coordinate = Coordinate(
-                (map_generation.get_size() - center_size) // 2,
-                (map_generation.get_size() - center_size) // 2,
-            )
-            coordinate = Coordinate(
-                (map_generation.get_size() - center_size) // 2,
-                (map_generation.get_size() - center_size) // 2,
-            )
-            while coordinate.distance(center_coordinate) < min_distance:
-                coordinate = Coordinate(
-                    random.randint(0, self.settings.map_size.value - 1),
-                    random.randint(0, self.settings.map_size.value - 1),
-                )
-            if map_generation.check_placement(town_center, coordinate):
-                break
 
         # Place the town center and link it to the player
         interactions.place_object(town_center, coordinate)
@@ -208,107 +186,12 @@ class GameController:
             player.get_max_population() + town_center.get_capacity_increase()
         )
 
-        # Generate a list of coordinates around the town center (not inside it)
-        around_coordinates = []
-        for x in range(
-            coordinate.get_x() - 1, coordinate.get_x() + town_center.get_size() + 1
-        ):
-            for y in range(
-                coordinate.get_y() - 1, coordinate.get_y() + town_center.get_size() + 1
-            ):
-                if (
-                    x < 0
-                    or y < 0
-                    or x >= self.settings.map_size.value
-                    or y >= self.settings.map_size.value
-                ):
-                    continue
-                if (
-                    x < coordinate.get_x()
-                    or x > coordinate.get_x() + town_center.get_size()
-                    or y < coordinate.get_y()
-                    or y > coordinate.get_y() + town_center.get_size()
-                ):
-                    around_coordinates.append(Coordinate(x, y))
-
-        # Place 3 villagers for the player, at random positions around the town center
-        for _ in range(3):
+        # Place 3 villagers for the player around the town center
+        for coordinate in villager_coordinates:
             villager = Villager()
-            # Get a random coordinate from the list and check placement
-            while True:
-                coordinate = around_coordinates.pop(
-                    random.randint(0, len(around_coordinates) - 1)
-                )
-                if map_generation.check_placement(villager, coordinate):
-                    break
-
-            # Place the villager and link it to the player
             interactions.place_object(villager, coordinate)
             interactions.link_owner(player, villager)
 
-        if MapType(self.settings.map_type) == MapType.RICH:
-            # Wood need to occupe 5% of the map. It will be randomly placed
-            wood = Wood()
-
-            for _ in range(int(self.settings.map_size.value**2 * 0.05)):
-                while True:
-                    coordinate = Coordinate(
-                        random.randint(0, self.settings.map_size.value - 1),
-                        random.randint(0, self.settings.map_size.value - 1),
-                    )
-                    if map_generation.check_placement(wood, coordinate):
-                        break
-
-                map_generation.add(wood, coordinate)
-                wood.set_coordinate(coordinate)
-
-            # Gold need to occupe 0.5% of the map. It will be randomly placed
-            for _ in range(int(self.settings.map_size.value**2 * 0.005)):
-                gold = Gold()
-
-                while True:
-                    coordinate = Coordinate(
-                        random.randint(0, self.settings.map_size.value - 1),
-                        random.randint(0, self.settings.map_size.value - 1),
-                    )
-                    if map_generation.check_placement(gold, coordinate):
-                        break
-
-                map_generation.add(gold, coordinate)
-                gold.set_coordinate(coordinate)
-
-        if MapType(self.settings.map_type) == MapType.GOLD_CENTER:
-            # Gold need to occupe 0.5% of the map. It will be placed in a circle at the center of the map.
-            # Draw a circle that occupies 0.5% of the map and place gold in it.
-            center = Coordinate(
-                self.settings.map_size.value // 2, self.settings.map_size.value // 2
-            )
-            radius = int(self.settings.map_size.value * 0.05)
-            for x in range(center.get_x() - radius, center.get_x() + radius + 1):
-                for y in range(center.get_y() - radius, center.get_y() + radius + 1):
-                    if (x - center.get_x()) ** 2 + (
-                        y - center.get_y()
-                    ) ** 2 <= radius**2:
-                        coordinate = Coordinate(x, y)
-                        gold = Gold()
-                        map_generation.add(gold, coordinate)
-                        gold.set_coordinate(coordinate)
-
-            # Wood need to occupe 5% of the map. It will be randomly placed
-            for _ in range(int(self.settings.map_size.value**2 * 0.05)):
-                wood = Wood()
-
-                while True:
-                    coordinate = Coordinate(
-                        random.randint(0, self.settings.map_size.value - 1),
-                        random.randint(0, self.settings.map_size.value - 1),
-                    )
-                    if map_generation.check_placement(wood, coordinate):
-                        break
-
-                map_generation.add(wood, coordinate)
-                wood.set_coordinate(coordinate)
-
         if MapType(self.settings.map_type) == MapType.TEST:
             # Generate a test map 10x10 with a town center at (0,0) and a villager at (5,5)
             map_generation = Map(120)
@@ -403,18 +286,19 @@ class GameController:
     # TODO: Generate list of players and their units/buildings.
     def update(self) -> None:
         """
-        Update the game state.
+        Update the game state: run the commands due at this tick.
         """
-        for command in self.__command_list.copy():
-            try:
-                # print(f"Command {command} is being executed")
-                command.run_command()
-            except (ValueError, AttributeError):
-                # print(e)
-                # print("Command failed.")
-                command.remove_command_from_list(self.__command_list)
-                command.get_entity().set_task(None)
-                # exit()
+        self.__command_list.run(self.__run_command)
+
+    def __run_command(self, command: Command) -> None:
+        """
+        Run a command, dropping it and the task of its entity if it fails.
+        """
+        try:
+            command.run_command()
+        except (ValueError, AttributeError):
+            command.remove_command_from_list(self.__command_list)
+            command.get_entity().set_task(None)
 
     def load_task(self) -> None:
         """
@@ -427,14 +311,32 @@ class GameController:
             #     pass
             player.get_task_manager().execute_tasks()
 
+    def get_scheduler(self) -> TickScheduler:
+        """
+        Returns the scheduler of the ticks of the game.
+        :return: The scheduler.
+        :rtype: TickScheduler
+        """
+        return self.__scheduler
+
+    def tick(self) -> None:
+        """
+        Run a tick of the simulation: load the tasks of the players, then run the commands.
+        """
+        self.load_task()
+        self.update()
+
     def game_loop(self) -> None:
+        """
+        Run the ticks of the game at the fixed timestep of the settings, the speed of the view scaling the simulated time.
+        The network messages are received while waiting for the next tick.
+        """
         try:
             self.start()
             while self.__running:
-                self.load_task()
-                self.update()
-                self.network_interactions()
-                time.Clock().tick(self.settings.fps.value * self.get_speed())
+                self.__scheduler.set_speed(self.get_speed())
+                self.__scheduler.advance(self.tick)
+                self.network_interactions(self.__scheduler.get_wait())
         except Exception as e:
             raise RuntimeError(f"Game loop failed: {e}")
 
@@ -452,7 +354,7 @@ class GameController:
         self.__view_controller.start_view()
 
     def load_game(
-        self, game_map: Map, players: list[Player], command_list: list[Command]
+        self, game_map: Map, players: list[Player], command_list: CommandScheduler
     ) -> None:
         """
         Load the game with the given map, players and settings.
@@ -461,7 +363,15 @@ class GameController:
         :type map: Map
         :param players: The players.
         :type players: list[Player]
+        :param command_list: The scheduler of the commands, or their list in games saved before they were scheduled.
+        :type command_list: CommandScheduler
         """
+        if not isinstance(command_list, CommandScheduler):
+            command_list = CommandScheduler.from_list(command_list)
+            for player in players:
+                player.get_command_manager().set_command_list(command_list)
+                # Fills the registry of the active entities, which the task managers did not keep then
+                player.set_task_manager(player.get_task_manager())
         self.__map = game_map
         self.__players = players
         self.__running = True
@@ -498,34 +408,32 @@ class GameController:
         self.__players.remove(player)
 
     def get_building(self, id: int, player: Player) -> typing.Optional[Building]:
-        return next((b for b in player.get_buildings() if b.get_id() == id), None)
+        building = self.__map.get_object_id(id)
+        if building is None:
+            # The registry only knows the objects on the map, a building of the player may be off it while it is placed
+            return next((b for b in player.get_buildings() if b.get_id() == id), None)
+        if isinstance(building, Building) and building in player.get_buildings():
+            return building
+        return None
 
     def get_unit(self, id: int, player: Player) -> typing.Optional[Unit]:
-        return next((u for u in player.get_units() if u.get_id() == id), None)
+        unit = self.__map.get_object_id(id)
+        if unit is None:
+            # The registry only knows the objects on the map, a unit of the player may be off it while it is spawned
+            return next((u for u in player.get_units() if u.get_id() == id), None)
+        if isinstance(unit, Unit) and unit in player.get_units():
+            return unit
+        return None
 
     def get_ressource(self, id: int) -> typing.Optional[Resource]:
-        return self.__map.get_object(id)
+        resource = self.__map.get_object_id(id)
+        return resource if isinstance(resource, Resource) else None
 
     def create_object(self, name: str) -> GameObject:
-        object_classes = {
-            "Barracks": Barracks,
-            "Farm": Farm,
-            "House": House,
-            "Town Center": TownCenter,
-            "Food": Food,
-            "Gold": Gold,
-            "Wood": Wood,
-            "Archer": Archer,
-            "Horseman": Horseman,
-            "Swordsman": Swordsman,
-            "Villager": Villager,
-        }
-        if name == "Place Holder":
-            return GameObject("Place Holder", "x", 9999)
-        return object_classes.get(name, GameObject)()
-
-    def network_interactions(self) -> None:
-        interactions = self.__network_controller.receive()
+        return catalogue.create_object(name)
+
+    def network_interactions(self, timeout: float = 0.05) -> None:
+        interactions = self.__network_controller.receive(timeout)
         for interaction in interactions:
             action = InteractionsTypes(interaction["action"])
             player = self.get_player_with_name(
@@ -580,8 +488,8 @@ class GameController:
         coordinate = Coordinate(
             *map(int, interaction["game_object"]["coordinate"].strip("()").split(","))
         )
-        object = self.__map.get(coordinate)
-        if object and object.get_id() == interaction["game_object"]["id"]:
+        object = self.__map.get_object_id(interaction["game_object"]["id"])
+        if object and object is self.__map.get(coordinate):
             self.__map.remove(coordinate)
 
     def __handle_move_unit(self, interaction: list, player: Player):
@@ -737,7 +645,7 @@ class GameController:
         pass
 
     def __handle_link_owner(self, interaction: list, player: Player):
-        entity = self.create_object(interaction["entity"]["name"])
+        entity = self.__map.get_object_id(interaction["entity"]["id"])
         coordinate = Coordinate(
             *map(int, interaction["entity"]["coordinate"].strip("()").split(","))
         )
@@ -0,0 +1,354 @@
+import math
+import random
+import time
+import typing
+
+from controller.ai_controller import AIController
+from controller.command_controller import CommandController
+from controller.network_controller import NullNetworkController
+from controller.task_manager import TaskController
+from model.ai import AI
+from model.buildings.town_center import TownCenter
+from model.commands.command import Command
+from model.commands.command_scheduler import CommandScheduler
+from model.interactions import Interactions
+from model.player.player import Player
+from model.player.strategies.random_strategy import RandomStrategy
+from model.resources.food import Food
+from model.resources.gold import Gold
+from model.resources.wood import Wood
+from model.units.villager import Villager
+from util.coordinate import Coordinate
+from util.map import Map
+from util.map_generator import MapGenerator
+from util.settings import Settings
+from util.state_manager import StartingCondition
+
+"""
+This file contains the HeadlessController class, which plays AI-vs-AI games without view, pygame or network bridge,
+as fast as the simulation allows.
+"""
+
+
+class HeadlessController:
+    """
+    Controller of a game played by AIs only, without view and without network.
+
+    The map and the first start come from the MapGenerator, as in a normal game; the other players start from the
+    first start rotated around the centre of the map. The ticks run back to back, the AIs thinking every AI_PERIOD
+    seconds of simulated time, and the messages to the network are dropped.
+    The seed drives both the map and the random module used by the AIs, so a game can be replayed from its seed.
+    """
+
+    COLORS: list[str] = [
+        "blue",
+        "red",
+        "green",
+        "yellow",
+        "purple",
+        "orange",
+        "pink",
+        "cyan",
+    ]
+    AI_PERIOD: int = 1
+
+    def __init__(
+        self,
+        settings: Settings,
+        player_count: int = 2,
+        cache_directory: typing.Optional[str] = MapGenerator.CACHE_DIRECTORY,
+    ) -> None:
+        """
+        Build the map and the players of a game from the settings.
+
+        :param settings: The settings of the game. A seed of None draws a random seed.
+        :type settings: Settings
+        :param player_count: The number of players, at most one per color.
+        :type player_count: int
+        :param cache_directory: The directory of the cache of the maps, None to disable it. Maps of random seeds are never cached.
+        :type cache_directory: str
+        :raises ValueError: If the number of players is not between 1 and the number of colors.
+        """
+        if not 1 <= player_count <= len(HeadlessController.COLORS):
+            raise ValueError(f"Cannot play with {player_count} players.")
+        self.settings: Settings = settings
+        seed = getattr(settings, "seed", None)
+        self.__seed: int = random.randrange(2**32) if seed is None else seed
+        self.__network_controller: NullNetworkController = NullNetworkController()
+        self.__command_list: CommandScheduler = CommandScheduler()
+        self.__players: list[Player] = []
+        self.__tick: int = 0
+        random.seed(self.__seed)
+        self.__map: Map = self.__generate_map(
+            player_count, cache_directory if seed is not None else None
+        )
+        self.__ai_controller: AIController = AIController(
+            self, HeadlessController.AI_PERIOD
+        )
+        self.__assign_AI()
+
+    def get_seed(self) -> int:
+        """
+        Returns the seed of the game.
+        :return: The seed.
+        :rtype: int
+        """
+        return self.__seed
+
+    def get_map(self) -> Map:
+        """
+        Returns the map.
+        :return: The map.
+        :rtype: Map
+        """
+        return self.__map
+
+    def get_players(self) -> list[Player]:
+        """
+        Returns the players.
+        :return: The players.
+        :rtype: list[Player]
+        """
+        return self.__players
+
+    def get_commandlist(self) -> CommandScheduler:
+        return self.__command_list
+
+    def get_speed(self) -> int:
+        """Get the current speed, a headless game is never paused."""
+        return 1
+
+    def get_tick(self) -> int:
+        """
+        Returns the number of ticks run.
+        :return: The number of ticks.
+        :rtype: int
+        """
+        return self.__tick
+
+    def __generate_player(self, name: str, game_map: Map) -> Player:
+        """
+        Generates a player with its command and task managers.
+        """
+        player = Player(name, HeadlessController.COLORS[len(self.__players)])
+        self.__players.append(player)
+        player.set_command_manager(
+            CommandController(
+                game_map,
+                player,
+                self.settings.fps.value,
+                self.__command_list,
+                self.__network_controller,
+            )
+        )
+        player.set_task_manager(TaskController(player.get_command_manager()))
+        player.set_max_population(5000)
+        return player
+
+    def __generate_map(
+        self, player_count: int, cache_directory: typing.Optional[str]
+    ) -> Map:
+        """
+        Generates the map from the seed, and places the town center and the villagers of every player.
+
+        :param player_count: The number of players.
+        :type player_count: int
+        :param cache_directory: The directory of the cache of the maps, None to disable it.
+        :type cache_directory: str
+        :return: The generated map.
+        :rtype: Map
+        """
+        generator = MapGenerator(
+            self.__seed,
+            self.settings.map_type,
+            self.settings.map_size,
+            self.settings.starting_condition,
+            cache_directory,
+        )
+        game_map, start, villager_coordinates = generator.generate()
+        interactions = Interactions(game_map, self.__network_controller)
+        for index in range(player_count):
+            player = self.__generate_player(f"player_{index + 1}", game_map)
+            coordinate, villagers = start, villager_coordinates
+            if index > 0:
+                coordinate, villagers = self.__pick_start(
+                    game_map, start, index / player_count
+                )
+            town_center = TownCenter()
+            interactions.place_object(town_center, coordinate)
+            interactions.link_owner(player, town_center)
+            player.set_max_population(
+                player.get_max_population() + town_center.get_capacity_increase()
+            )
+            for villager_coordinate in villagers:
+                villager = Villager()
+                interactions.place_object(villager, villager_coordinate)
+                interactions.link_owner(player, villager)
+        return game_map
+
+    def __pick_start(
+        self, game_map: Map, first: Coordinate, turn: float
+    ) -> tuple[Coordinate, list[Coordinate]]:
+        """
+        Pick the start of a player: the empty zone nearest to the start of the first player rotated around the
+        centre of the map, and the empty tiles around it for the villagers.
+
+        :param game_map: The map.
+        :type game_map: Map
+        :param first: The coordinate of the town center of the first player.
+        :type first: Coordinate
+        :param turn: The rotation, as a fraction of a full turn.
+        :type turn: float
+        :return: The coordinate of the town center and the coordinates of the villagers.
+        :rtype: tuple[Coordinate, list[Coordinate]]
+        """
+        size = game_map.get_size()
+        town_center_size = TownCenter.TYPE.get_size()
+        centre = (size - town_center_size) / 2
+        angle = 2 * math.pi * turn
+        dx, dy = first.get_x() - centre, first.get_y() - centre
+        x = round(centre + dx * math.cos(angle) - dy * math.sin(angle))
+        y = round(centre + dx * math.sin(angle) + dy * math.cos(angle))
+        zones = game_map.find_nearest_empty_zones(
+            Coordinate.of(min(max(x, 0), size - 1), min(max(y, 0), size - 1)),
+            town_center_size,
+            1,
+        )
+        if not zones:
+            raise ValueError("No room left for the town center of a player.")
+        x0, y0 = zones[0].get_x(), zones[0].get_y()
+        around = [
+            Coordinate.of(x, y)
+            for y in range(y0 - 1, y0 + town_center_size + 1)
+            for x in range(x0 - 1, x0 + town_center_size + 1)
+            if 0 <= x < size
+            and 0 <= y < size
+            and not (
+                x0 <= x < x0 + town_center_size and y0 <= y < y0 + town_center_size
+            )
+            and game_map.get_xy(x, y) is None
+        ]
+        return zones[0], around[: MapGenerator.VILLAGERS]
+
+    def __assign_AI(self) -> None:
+        """
+        Gives an AI to every player, with the resources of the starting condition.
+        """
+        for player in self.__players:
+            player.set_ai(AI(player, None, self.__map))
+            player.get_ai().set_strategy(RandomStrategy(player.get_ai()))
+            player.update_centre_coordinate()
+            option = StartingCondition(self.settings.starting_condition)
+            if option == StartingCondition.LEAN:
+                player.collect(Food(), 50)
+                player.collect(Wood(), 200)
+                player.collect(Gold(), 50)
+            elif option == StartingCondition.MEAN:
+                player.collect(Food(), 2000)
+                player.collect(Wood(), 2000)
+                player.collect(Gold(), 2000)
+
+    def think(self) -> None:
+        """
+        Let the AIs of the players decide, on a snapshot of the map.
+        """
+        self.__ai_controller.update_knowledge()
+        for player in self.__players:
+            try:
+                player.get_ai().get_strategy().execute()
+            except (ValueError, IndexError, AttributeError):
+                pass
+
+    def load_task(self) -> None:
+        """
+        Load the tasks of the players.
+        """
+        for player in self.__players:
+            player.get_task_manager().execute_tasks()
+
+    def update(self) -> None:
+        """
+        Run the commands due at this tick.
+        """
+        self.__command_list.run(self.__run_command)
+
+    def __run_command(self, command: Command) -> None:
+        """
+        Run a command, dropping it and the task of its entity if it fails.
+        """
+        try:
+            command.run_command()
+        except (ValueError, AttributeError):
+            command.remove_command_from_list(self.__command_list)
+            command.get_entity().set_task(None)
+
+    def get_alive_players(self) -> list[Player]:
+        """
+        Returns the players who still have units or buildings.
+        :return: The players in the game.
+        :rtype: list[Player]
+        """
+        return [
+            player
+            for player in self.__players
+            if player.get_units() or player.get_buildings()
+        ]
+
+    def run(self, max_ticks: int) -> dict:
+        """
+        Run the ticks of the game back to back, until a single player is left or the maximum number of ticks is reached.
+
+        :param max_ticks: The maximum number of ticks.
+        :type max_ticks: int
+        :return: The summary of the game.
+        :rtype: dict
+        """
+        ai_ticks = self.settings.fps.value * HeadlessController.AI_PERIOD
+        start = time.perf_counter()
+        while self.__tick < max_ticks:
+            if self.__tick % ai_ticks == 0:
+                self.think()
+            self.load_task()
+            self.update()
+            self.__tick += 1
+            if len(self.__players) > 1 and len(self.get_alive_players()) <= 1:
+                break
+        return self.get_summary(time.perf_counter() - start)
+
+    def get_summary(self, elapsed: float = 0) -> dict:
+        """
+        Summarise the game.
+
+        :param elapsed: The real time the game took, in seconds.
+        :type elapsed: float
+        :return: The seed, the ticks run, the simulated and real times, the winner if a single player is left,
+            and the units, buildings and resources of every player.
+        :rtype: dict
+        """
+        alive = self.get_alive_players()
+        return {
+            "seed": self.__seed,
+            "ticks": self.__tick,
+            "simulated_time": self.__tick / self.settings.fps.value,
+            "elapsed": elapsed,
+            "ticks_per_second": self.__tick / elapsed if elapsed > 0 else None,
+            "winner": (
+                alive[0].get_name()
+                if len(self.__players) > 1 and len(alive) == 1
+                else None
+            ),
+            "players": [
+                {
+                    "name": player.get_name(),
+                    "color": player.get_color(),
+                    "alive": player in alive,
+                    "units": len(player.get_units()),
+                    "buildings": len(player.get_buildings()),
+                    "resources": {
+                        resource.get_name(): amount
+                        for resource, amount in player.get_resources().items()
+                    },
+                }
+                for player in self.__players
+            ],
+        }
@@ -121,7 +121,7 @@ class MenuController:
                 with open(filename, "wb") as file:
                     pickle.dump(game_state, file)
                 self.call_menu()
-            except (OSError, pickle.PickleError) as e:
+            except (OSError, pickle.PickleError, TypeError) as e:
                 raise RuntimeError(f"Error saving game: {e}") from e
 
     def load_game(self, filename: str) -> None:
@@ -141,5 +141,6 @@ class MenuController:
             self.__game_controller.start_all_threads()
         except FileNotFoundError as exc:
             raise FileNotFoundError(f"Save file not found: {exc}") from exc
-        except (pickle.PickleError, KeyError) as e:
+        except (pickle.PickleError, KeyError, AttributeError, TypeError) as e:
+            # A save whose objects no longer match the classes of the game is reported as incompatible
             raise RuntimeError(f"Error loading game: {e}") from e
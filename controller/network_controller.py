@@ -84,15 +84,21 @@ class NetworkController:
         """
         self.__send_sock.sendto(json.dumps(message).encode(), self.__send_address)
 
-    def receive(self) -> list:
+    def receive(self, timeout: float = 0.05) -> list:
         """
         Récupère tous les messages disponibles dans la file du socket.
+
+        :param timeout: The time to wait for the first message, in seconds.
+        :type timeout: float
         """
         messages = []
+        self.__recv_sock.settimeout(timeout)
         # Lire tous les messages disponibles jusqu'à ce que la file soit vide
         while True:
             try:
                 data, _ = self.__recv_sock.recvfrom(65507)
+                # Les messages suivants sont déjà dans la file, on ne les attend pas
+                self.__recv_sock.settimeout(0)
                 if not data:
                     break
                 message_str = data.decode()
@@ -101,7 +107,7 @@ class NetworkController:
                     messages.append(message)
                 except json.JSONDecodeError as e:
                     raise e
-            except socket.timeout:
+            except (socket.timeout, BlockingIOError):
                 # Plus de messages disponibles, on sort de la boucle
                 break
             except ConnectionResetError:
@@ -117,3 +123,29 @@ class NetworkController:
         self.__stop_network_bridge()
         self.__recv_sock.close()
         self.__send_sock.close()
+
+
+class NullNetworkController:
+    """
+    Network sink of the headless games: the messages sent are dropped and none are ever received,
+    so that no socket is opened and the network bridge is neither built nor started.
+    """
+
+    def send(self, message: str) -> None:
+        """
+        Drops a message.
+        """
+
+    def receive(self, timeout: float = 0.05) -> list:
+        """
+        Returns no message, without waiting.
+
+        :param timeout: Ignored.
+        :type timeout: float
+        """
+        return []
+
+    def close(self) -> None:
+        """
+        Does nothing, there is nothing to close.
+        """
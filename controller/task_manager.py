@@ -1,8 +1,23 @@
+import functools
+import heapq
+import typing
+
 from controller.command_controller import CommandController
 
+if typing.TYPE_CHECKING:
+    from model.commands.command import Command
+    from model.entity import Entity
+    from model.tasks.task import Task
+
 
 class TaskController:
-    """This class is responsible for managing tasks."""
+    """
+    This class is responsible for managing tasks.
+
+    Only the entities of the player that have a task are visited: Entity.set_task keeps them in an active registry.
+    A task only waiting on the countdown of a command is parked until the command is completed, or until the tick at
+    which it has work to do again, so that the cost of a tick follows the active work rather than the population.
+    """
 
     def __init__(self, command_manager: CommandController) -> None:
         """
@@ -11,25 +26,134 @@ class TaskController:
         :type command_manager: CommandController
         """
         self.__command_manager: CommandController = command_manager
+        # Dictionary used as a set, so that the entities are visited in the order they were given their task
+        self.__active: dict["Entity", None] = {}
+        self.__parked: list[tuple[int, int, "Entity", "Task"]] = []
+        # Order of the parked entities due at the same tick, an int rather than an itertools.count so that it pickles
+        self.__counter: int = 0
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores an unpickled task manager, also one saved before it kept a registry of the active entities: the
+        registry then starts empty, and is filled when the game is loaded.
+        :param state: The attributes of the task manager.
+        :type state: dict
+        """
+        state.setdefault("_TaskController__active", {})
+        state.setdefault("_TaskController__parked", [])
+        state.setdefault("_TaskController__counter", 0)
+        self.__dict__.update(state)
+
+    def track(self, entity: "Entity") -> None:
+        """
+        Registers an entity whose task changed: active if it has a task, forgotten otherwise.
+        A parked entity given a new task is active again.
+        :param entity: The entity.
+        :type entity: Entity
+        """
+        if entity.get_task() is None:
+            self.__active.pop(entity, None)
+        else:
+            self.__active[entity] = None
+
+    def untrack(self, entity: "Entity") -> None:
+        """
+        Forgets an entity, when it no longer belongs to the player.
+        :param entity: The entity.
+        :type entity: Entity
+        """
+        self.__active.pop(entity, None)
+
+    def get_active(self) -> list["Entity"]:
+        """
+        Returns the entities whose task runs at the next tick.
+        :return: The active entities, in the order they were given their task.
+        :rtype: list[Entity]
+        """
+        return list(self.__active)
+
+    def park(self, entity: "Entity", ticks: int) -> None:
+        """
+        Parks an entity for some ticks, its task is not executed until then unless the entity is given a new task.
+        :param entity: The entity.
+        :type entity: Entity
+        :param ticks: The number of ticks.
+        :type ticks: int
+        """
+        self.__active.pop(entity, None)
+        self.__counter += 1
+        heapq.heappush(
+            self.__parked,
+            (self.__get_now() + ticks, self.__counter, entity, entity.get_task()),
+        )
+
+    def park_until(self, entity: "Entity", command: "Command") -> None:
+        """
+        Parks an entity until a command is completed, its task is not executed until then unless the entity is given a new task.
+        An entity waiting on a command no longer scheduled stays active, as the command will not be completed.
+        :param entity: The entity.
+        :type entity: Entity
+        :param command: The command.
+        :type command: Command
+        """
+        if not command.is_scheduled():
+            return
+        self.__active.pop(entity, None)
+        task = entity.get_task()
+        # A partial of a bound method, unlike a lambda, is pickled with the game when it is saved
+        command.add_completion_callback(functools.partial(self.resume, entity, task))
+
+    def resume(self, entity: "Entity", task: "Task", command: "Command" = None) -> None:
+        """
+        Makes a parked entity active again, if it still belongs to the player and kept the same task.
+        :param entity: The entity.
+        :type entity: Entity
+        :param task: The task the entity had when it was parked.
+        :type task: Task
+        :param command: The command completed, when the entity was parked until one.
+        :type command: Command
+        """
+        if (
+            entity.get_task() is task
+            and entity.get_player() is self.__command_manager.get_player()
+        ):
+            self.__active[entity] = None
+
+    def __get_now(self) -> int:
+        """
+        Returns the current tick, read on the clock of the commands.
+        :return: The current tick.
+        :rtype: int
+        """
+        return self.__command_manager.get_command_list().get_now()
+
+    def __wake(self) -> None:
+        """
+        Wakes the entities parked until a tick that has come.
+        """
+        now = self.__get_now()
+        while self.__parked and self.__parked[0][0] <= now:
+            _, _, entity, task = heapq.heappop(self.__parked)
+            self.resume(entity, task)
 
     def execute_tasks(self) -> None:
         """
-        Executes all assigned tasks in
-        """
-        for unit in self.__command_manager.get_player().get_units():
-            if unit.get_task() is not None:
-                try:
-                    unit.get_task().execute_task()
-                except (ValueError, IndexError) as e:
-                    # print(f"Error executing task by {unit.get_name()} at {unit.get_coordinate()}")
-                    # import traceback
-                    # print(traceback.format_exc())
-                    # print(e)
-                    # exit()
-                    unit.set_task(None)
-        for building in self.__command_manager.get_player().get_buildings():
-            if building.get_task() is not None:
-                try:
-                    building.get_task().execute_task()
-                except (ValueError, IndexError):
-                    building.set_task(None)
+        Executes the tasks of the active entities, then parks the ones only waiting on the countdown of a command.
+        """
+        self.__wake()
+        for entity in list(self.__active):
+            task = entity.get_task()
+            if task is None:
+                continue
+            try:
+                task.execute_task()
+            except (ValueError, IndexError):
+                entity.set_task(None)
+                continue
+            if entity.get_task() is not task:
+                continue
+            command = task.get_pending_command()
+            if command is not None:
+                self.park_until(entity, command)
+            elif task.get_sleep() > 0:
+                self.park(entity, task.get_sleep())
@@ -130,6 +130,7 @@ class ViewController:
         """
         players = self.__game_controller.get_players()
         all_players_stats = [self.generate_player_stats(player) for player in players]
+        scheduler = self.__game_controller.get_scheduler()
 
         # Generate HTML content
         html_content = f"""
@@ -191,6 +192,9 @@ class ViewController:
             <p>Map Type: {self.get_settings().map_type}</p>
             <p>FPS: {self.get_settings().fps}</p>
             <p>Starting Condition: {self.get_settings().starting_condition}</p>
+            <h2>Ticks</h2>
+            <p>Ticks: {scheduler.get_tick()} ({scheduler.get_dropped()} dropped)</p>
+            <p>Tick Duration (ms): {", ".join(f"p{percentile} {duration:.2f}" for percentile, duration in scheduler.get_percentiles().items())}</p>
         </body>
         </html>
         """
@@ -0,0 +1,55 @@
+import argparse
+import json
+
+from controller.headless_controller import HeadlessController
+from util.settings import Settings
+from util.state_manager import MapSize, MapType, StartingCondition
+
+"""
+Play AI-vs-AI games without view, pygame or network bridge, and print their summaries as JSON lines.
+Run it from the root of the repository, for example with: python headless.py --seed 1 --games 10 --ticks 20000
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Play AI-vs-AI games without view, pygame or network bridge."
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="seed of the first game, random if not set",
+    )
+    parser.add_argument(
+        "--games", type=int, default=1, help="number of games, on consecutive seeds"
+    )
+    parser.add_argument(
+        "--ticks", type=int, default=18000, help="maximum number of ticks of a game"
+    )
+    parser.add_argument("--players", type=int, default=2, help="number of players")
+    parser.add_argument(
+        "--map-type", choices=[t.name for t in MapType], default=MapType.RICH.name
+    )
+    parser.add_argument(
+        "--map-size", choices=[s.name for s in MapSize], default=MapSize.SMALL.name
+    )
+    parser.add_argument(
+        "--starting-condition",
+        choices=[c.name for c in StartingCondition],
+        default=StartingCondition.LEAN.name,
+    )
+    arguments = parser.parse_args()
+
+    for game in range(arguments.games):
+        settings = Settings()
+        settings.map_type = MapType[arguments.map_type]
+        settings.map_size = MapSize[arguments.map_size]
+        settings.starting_condition = StartingCondition[arguments.starting_condition]
+        settings.seed = None if arguments.seed is None else arguments.seed + game
+        controller = HeadlessController(settings, arguments.players)
+        print(json.dumps(controller.run(arguments.ticks)), flush=True)
+
+
+if __name__ == "__main__":
+    main()
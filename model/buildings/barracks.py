@@ -1,10 +1,15 @@
 from model.buildings.building import Building
+from model.object_type import ObjectType
 from model.resources.wood import Wood
 
 
 class Barracks(Building):
     """This class represents the Barracks building."""
 
+    __slots__ = ()
+
+    TYPE: ObjectType = Building.type_of("Barracks", "B", 500, {Wood(): 175}, 3, 50)
+
     def __init__(self) -> None:
         """Initialize a Barracks object."""
-        super().__init__("Barracks", "B", 500, {Wood(): 175}, 3, 50)
+        super().__init__(Barracks.TYPE)
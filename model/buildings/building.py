@@ -1,6 +1,7 @@
 import typing
 
 from model.entity import Entity
+from model.object_type import ObjectType
 
 if typing.TYPE_CHECKING:
     from model.resources.resource import Resource
@@ -9,17 +10,33 @@ if typing.TYPE_CHECKING:
 class Building(Entity):
     """This class represents the buildings on the map."""
 
-    def __init__(
-        self,
+    __slots__ = ("__resources_drop_point", "__population_increase")
+
+    def __init__(self, object_type: ObjectType):
+        """
+        Initializes the building.
+        :param object_type: The type of the building, with its size and whether it is a drop point or adds population.
+        :type object_type: ObjectType
+        """
+        super().__init__(object_type)
+        # Set only when a building is changed, the type holding the flags of every building of its kind
+        self.__resources_drop_point: bool = None
+        self.__population_increase: bool = None
+
+    @staticmethod
+    def type_of(
         name: str,
         letter: str,
         hp: int,
         cost: dict["Resource", int],
         size: int,
         spawning_time: int,
-    ):
+        resources_drop_point: bool = False,
+        population_increase: bool = False,
+        capacity_increase: int = 0,
+    ) -> ObjectType:
         """
-        Initializes the building.
+        Describes a kind of building, with the sprite named after it.
         :param name: The name of the building.
         :type name: str
         :param letter: The letter representing the building.
@@ -32,12 +49,27 @@ class Building(Entity):
         :type size: int
         :param spawning_time: The time it takes to spawn the building.
         :type spawning_time: int
+        :param resources_drop_point: Whether the building is a resources drop point.
+        :type resources_drop_point: bool
+        :param population_increase: Whether the building increases the population.
+        :type population_increase: bool
+        :param capacity_increase: The population the building adds.
+        :type capacity_increase: int
+        :return: The type of the building.
+        :rtype: ObjectType
         """
-        self.__resources_drop_point: bool = False
-        self.__population_increase: bool = False
-        super().__init__(name, letter, hp, cost, spawning_time)
-        super().set_size(size)
-        super().set_sprite_path(f"assets/sprites/buildings/{self.get_name().lower}.png")
+        return ObjectType(
+            name,
+            letter,
+            hp,
+            size=size,
+            sprite_path=f"assets/sprites/buildings/{name.lower()}.png",
+            cost=cost,
+            spawning_time=spawning_time,
+            resources_drop_point=resources_drop_point,
+            population_increase=population_increase,
+            capacity_increase=capacity_increase,
+        )
 
     def is_resources_drop_point(self) -> bool:
         """
@@ -45,6 +77,8 @@ class Building(Entity):
         :return: True if the building is a resources drop point, False otherwise.
         :rtype: bool
         """
+        if self.__resources_drop_point is None:
+            return self.get_type().is_resources_drop_point()
         return self.__resources_drop_point
 
     def set_resources_drop_point(self, resources_drop_point: bool) -> None:
@@ -61,6 +95,8 @@ class Building(Entity):
         :return: True if the building increases the population, False otherwise.
         :rtype: bool
         """
+        if self.__population_increase is None:
+            return self.get_type().is_population_increase()
         return self.__population_increase
 
     def set_population_increase(self, population_increase: bool) -> None:
@@ -1,4 +1,5 @@
 from model.buildings.building import Building
+from model.object_type import ObjectType
 from model.resources.food import Food
 from model.resources.wood import Wood
 
@@ -6,9 +7,13 @@ from model.resources.wood import Wood
 class Farm(Building):
     """This class represents the Farm building."""
 
+    __slots__ = ("___food",)
+
+    TYPE: ObjectType = Building.type_of("Farm", "F", 100, {Wood(): 60}, 2, 10)
+
     def __init__(self) -> None:
         """Initialize a Farm object."""
-        super().__init__("Farm", "F", 100, {Wood(): 60}, 2, 10)
+        super().__init__(Farm.TYPE)
         self.___food: Food = Food()
 
     def get_food(self) -> Food:
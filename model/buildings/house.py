@@ -1,15 +1,27 @@
 from model.buildings.building import Building
+from model.object_type import ObjectType
 from model.resources.wood import Wood
 
 
 class House(Building):
     """This class represents the House building."""
 
+    __slots__ = ()
+
+    TYPE: ObjectType = Building.type_of(
+        "House",
+        "H",
+        200,
+        {Wood(): 25},
+        2,
+        25,
+        population_increase=True,
+        capacity_increase=5,
+    )
+
     def __init__(self) -> None:
         """Initialize a House object."""
-        super().__init__("House", "H", 200, {Wood(): 25}, 2, 25)
-        self.__capacity_increase = 5
-        super().set_population_increase(True)
+        super().__init__(House.TYPE)
 
     def get_capacity_increase(self) -> int:
         """
@@ -18,4 +30,4 @@ class House(Building):
         :return: The population capacity increase.
         :rtype: int
         """
-        return self.__capacity_increase
+        return self.get_type().get_capacity_increase()
@@ -1,16 +1,28 @@
 from model.buildings.building import Building
+from model.object_type import ObjectType
 from model.resources.wood import Wood
 
 
 class TownCenter(Building):
     """This class represents the Town Center building."""
 
+    __slots__ = ()
+
+    TYPE: ObjectType = Building.type_of(
+        "Town Center",
+        "T",
+        1000,
+        {Wood(): 350},
+        4,
+        150,
+        resources_drop_point=True,
+        population_increase=True,
+        capacity_increase=5,
+    )
+
     def __init__(self) -> None:
         """Initialize a TownCenter object."""
-        super().__init__("Town Center", "T", 1000, {Wood(): 350}, 4, 150)
-        self.__capacity_increase = 5
-        super().set_population_increase(True)
-        super().set_resources_drop_point(True)
+        super().__init__(TownCenter.TYPE)
 
     def get_capacity_increase(self) -> int:
         """
@@ -19,4 +31,4 @@ class TownCenter(Building):
         :return: The population capacity increase.
         :rtype: int
         """
-        return self.__capacity_increase
+        return self.get_type().get_capacity_increase()
@@ -0,0 +1,112 @@
+import types
+import typing
+
+from model.buildings.barracks import Barracks
+from model.buildings.farm import Farm
+from model.buildings.house import House
+from model.buildings.town_center import TownCenter
+from model.game_object import GameObject
+from model.object_type import ObjectType
+from model.resources.food import Food
+from model.resources.gold import Gold
+from model.resources.wood import Wood
+from model.units.archer import Archer
+from model.units.horseman import Horseman
+from model.units.swordsman import Swordsman
+from model.units.unit import Unit
+from model.units.villager import Villager
+
+"""
+This file contains the catalogue of the kinds of game objects: their classes and types by name, the unit spawned by
+each building, and the factories creating the objects from their name.
+"""
+
+# The classes of the game objects, by name
+OBJECT_CLASSES: typing.Mapping[str, type[GameObject]] = types.MappingProxyType(
+    {
+        object_class.TYPE.get_name(): object_class
+        for object_class in (
+            Barracks,
+            Farm,
+            House,
+            TownCenter,
+            Food,
+            Gold,
+            Wood,
+            Archer,
+            Horseman,
+            Swordsman,
+            Villager,
+        )
+    }
+)
+
+# The types of the game objects, by name
+OBJECT_TYPES: typing.Mapping[str, ObjectType] = types.MappingProxyType(
+    {name: object_class.TYPE for name, object_class in OBJECT_CLASSES.items()}
+    | {GameObject.PLACE_HOLDER.get_name(): GameObject.PLACE_HOLDER}
+)
+
+# The class of the unit spawned by a building, by name of the building
+SPAWNED_UNITS: typing.Mapping[str, type[Unit]] = types.MappingProxyType(
+    {
+        "Town Center": Villager,
+        "Barracks": Swordsman,
+        "Archery Range": Archer,
+        "Stable": Horseman,
+    }
+)
+
+
+def get_type(name: str) -> ObjectType:
+    """
+    Get the type of a kind of game object, without creating one.
+
+    :param name: The name of the kind.
+    :type name: str
+    :return: The type.
+    :rtype: ObjectType
+    :raises KeyError: If no kind has this name.
+    """
+    return OBJECT_TYPES[name]
+
+
+def create_object(name: str) -> GameObject:
+    """
+    Create a new game object of a kind.
+
+    :param name: The name of the kind.
+    :type name: str
+    :return: The new object, a place holder if no kind has this name.
+    :rtype: GameObject
+    """
+    object_class = OBJECT_CLASSES.get(name)
+    if object_class is None:
+        return GameObject(GameObject.PLACE_HOLDER)
+    return object_class()
+
+
+def get_spawned_type(building_name: str) -> ObjectType:
+    """
+    Get the type of the unit spawned by a building, to check its cost or spawning time without creating one.
+
+    :param building_name: The name of the building.
+    :type building_name: str
+    :return: The type of the unit.
+    :rtype: ObjectType
+    :raises KeyError: If the building does not spawn units.
+    """
+    return SPAWNED_UNITS[building_name].TYPE
+
+
+def spawn_unit(building_name: str) -> Unit:
+    """
+    Create a new unit of the kind spawned by a building.
+
+    :param building_name: The name of the building.
+    :type building_name: str
+    :return: The new unit.
+    :rtype: Unit
+    :raises KeyError: If the building does not spawn units.
+    """
+    return SPAWNED_UNITS[building_name]()
@@ -8,6 +8,7 @@ import typing
 
 if typing.TYPE_CHECKING:
     from controller.network_controller import NetworkController
+    from model.commands.command_scheduler import CommandScheduler
 
 
 class AttackCommand(Command):
@@ -21,7 +22,7 @@ class AttackCommand(Command):
         network_controller: "NetworkController",
         target_coord: Coordinate,
         convert_coeff: int,
-        command_list: list[Command],
+        command_list: "CommandScheduler",
     ) -> None:
         """
         Initializes the AttackCommand with the given map, player, entity, process and convert_coeff.
@@ -56,4 +57,3 @@ class AttackCommand(Command):
 
         if self.get_tick() <= 0:
             super().remove_command_from_list(self.__command_list)
-        self.set_tick(self.get_tick() - 1)
@@ -10,6 +10,7 @@ import json
 
 if typing.TYPE_CHECKING:
     from controller.network_controller import NetworkController
+    from model.commands.command_scheduler import CommandScheduler
 
 
 class BuildCommand(Command):
@@ -24,7 +25,7 @@ class BuildCommand(Command):
         building: Building,
         target_coord: Coordinate,
         convert_coeff: int,
-        command_list: list[Command],
+        command_list: "CommandScheduler",
     ) -> None:
         """
         Initializes the BuildCommand with the given map, player, entity, process and convert_coeff.
@@ -49,7 +50,7 @@ class BuildCommand(Command):
         self.__building = building
         self.__target_coord = target_coord
         self.__command_list = command_list
-        self.__place_holder: GameObject = GameObject("Place Holder", "x", 9999)
+        self.__place_holder: GameObject = GameObject(GameObject.PLACE_HOLDER)
         self.__place_holder.set_size(building.get_size())
         self.__start: bool = True
         super().push_command_to_list(command_list)
@@ -91,7 +92,6 @@ class BuildCommand(Command):
                         + self.__building.get_capacity_increase()
                     )
             super().remove_command_from_list(self.__command_list)
-        self.set_tick(self.get_tick() - 1)
 
     def send_network(self):
         """
@@ -9,6 +9,7 @@ import json
 
 if typing.TYPE_CHECKING:
     from controller.network_controller import NetworkController
+    from model.commands.command_scheduler import CommandScheduler
 
 
 class CollectCommand(Command):
@@ -22,7 +23,7 @@ class CollectCommand(Command):
         network_controller: "NetworkController",
         target_coord: Coordinate,
         convert_coeff: int,
-        command_list: list[Command],
+        command_list: "CommandScheduler",
     ):
         """
         Initializes the CollectCommand with the given map, player, entity, process and convert_coeff.
@@ -56,4 +57,3 @@ class CollectCommand(Command):
                     self.get_entity(), self.__target_coord, 1
                 )
         super().remove_command_from_list(self.__command_list)
-        self.set_tick(self.get_tick() - 1)
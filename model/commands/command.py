@@ -9,6 +9,7 @@ import typing
 
 if typing.TYPE_CHECKING:
     from controller.network_controller import NetworkController
+    from model.commands.command_scheduler import CommandScheduler
 
 
 class Command(ABC):
@@ -45,6 +46,21 @@ class Command(ABC):
         self.__convert_coeff: int = convert_coeff
         self.__time: float = 0
         self.__tick: int = 0
+        self.__tick_start: int = 0
+        self.__scheduler: "CommandScheduler" = None
+        self.__completion_callbacks: list[typing.Callable[["Command"], None]] = []
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores an unpickled command, also one saved when the commands were kept in a list, before they were given a
+        scheduler and completion callbacks.
+        :param state: The attributes of the command.
+        :type state: dict
+        """
+        state.setdefault("_Command__scheduler", None)
+        state.setdefault("_Command__tick_start", 0)
+        state.setdefault("_Command__completion_callbacks", [])
+        self.__dict__.update(state)
 
     def get_interactions(self) -> Interactions:
         """
@@ -56,11 +72,52 @@ class Command(ABC):
 
     def get_tick(self) -> int:
         """
-        Returns the tick of the command.
+        Returns the tick of the command, counted down by the clock of its scheduler while it is scheduled.
         :return: The tick of the command.
         :rtype: int
         """
-        return self.__tick
+        if self.__scheduler is None:
+            return self.__tick
+        return self.__tick - (self.__scheduler.get_now() - self.__tick_start)
+
+    def is_started(self) -> bool:
+        """
+        Returns whether the command has started, meaning that its scheduler already ran it, or that it is no longer scheduled.
+        A command acts on the map when it starts, then only counts its ticks down until it finishes.
+        :return: True if the command has started, False otherwise.
+        :rtype: bool
+        """
+        return (
+            self.__scheduler is None or self.__scheduler.get_now() > self.__tick_start
+        )
+
+    def is_scheduled(self) -> bool:
+        """
+        Returns whether the command is still in the scheduler it was pushed to.
+        :return: True if the command is scheduled, False otherwise.
+        :rtype: bool
+        """
+        return self.__scheduler is not None
+
+    def add_completion_callback(
+        self, callback: typing.Callable[["Command"], None]
+    ) -> None:
+        """
+        Adds a function called with the command once, when its scheduler reaches the tick at which its countdown is over,
+        or when the command is removed from its scheduler before, because it failed or was cancelled.
+        The function is called when the clock advances to that tick, so before the tasks of that tick are executed.
+        :param callback: The function.
+        :type callback: Callable[[Command], None]
+        """
+        self.__completion_callbacks.append(callback)
+
+    def complete(self) -> None:
+        """
+        Calls the completion callbacks of the command, and forgets them.
+        """
+        callbacks, self.__completion_callbacks = self.__completion_callbacks, []
+        for callback in callbacks:
+            callback(self)
 
     def set_tick(self, tick: int) -> None:
         """
@@ -69,6 +126,8 @@ class Command(ABC):
         :type tick: int
         """
         self.__tick = tick
+        if self.__scheduler is not None:
+            self.__tick_start = self.__scheduler.get_now()
 
     def get_time(self) -> float:
         """
@@ -118,16 +177,15 @@ class Command(ABC):
         """
         return self.__convert_coeff
 
-    def push_command_to_list(self, command_list: list["Command"]) -> None:
+    def push_command_to_list(self, command_list: "CommandScheduler") -> None:
         """
-        Pushes the command to the given list.
-        :param command_list: The list where the command will be pushed.
-        :type command_list: list
+        Pushes the command to the given scheduler, to start at the current tick.
+        :param command_list: The scheduler where the command will be pushed.
+        :type command_list: CommandScheduler
+        :raises ValueError: If the entity is already busy with a conflicting command.
         """
-        for command in command_list:
-            if command.get_entity() == self.__entity and not (
-                command.get_process() == Process.SPAWN
-            ):
+        for command in command_list.get_commands(self.__entity):
+            if not (command.get_process() == Process.SPAWN):
                 if (
                     command.get_process() == Process.COLLECT
                     or command.get_process() == Process.BUILD
@@ -138,16 +196,41 @@ class Command(ABC):
                     or command.get_process() == Process.MOVE
                 ) and command.get_process() == self.__process:
                     raise ValueError("Entity is cooling down from attacking or moving.")
-        command_list.append(self)
+        self.__scheduler = command_list
+        self.__tick_start = command_list.get_now()
+        command_list.schedule(self, command_list.get_now())
+
+    def move_to_scheduler(
+        self, command_list: list["Command"], scheduler: "CommandScheduler"
+    ) -> None:
+        """
+        Moves a command of a game saved when the commands were kept in a list to a scheduler, to run at its current
+        tick with the ticks it has left. The references of the command to the list are replaced with the scheduler.
+        :param command_list: The list where the command was saved.
+        :type command_list: list[Command]
+        :param scheduler: The scheduler where the command will be pushed.
+        :type scheduler: CommandScheduler
+        """
+        for name, value in list(vars(self).items()):
+            if value is command_list:
+                setattr(self, name, scheduler)
+        self.__scheduler = scheduler
+        self.__tick_start = scheduler.get_now()
+        scheduler.schedule(self, scheduler.get_now())
 
-    def remove_command_from_list(self, command_list: list["Command"]) -> None:
+    def remove_command_from_list(self, command_list: "CommandScheduler") -> None:
         """
-        Removes the command from the given list.
-        :param command_list: The list where the command will be removed.
-        :type command_list: list
+        Removes the command from the given scheduler, and completes it so that nothing keeps waiting on it.
+        Its tick stops counting down, at the value it has once the current tick is over.
+        :param command_list: The scheduler where the command will be removed.
+        :type command_list: CommandScheduler
         """
         if self in command_list:
+            if self.__scheduler is command_list:
+                self.__tick = self.get_tick() - 1
+                self.__scheduler = None
             command_list.remove(self)
+            self.complete()
 
     @abstractmethod
     def run_command(self):
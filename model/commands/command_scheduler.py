@@ -0,0 +1,163 @@
+import typing
+
+if typing.TYPE_CHECKING:
+    from model.commands.command import Command
+    from model.entity import Entity
+
+"""
+This file contains the CommandScheduler class, which replaces the shared list of commands with a hashed timing wheel,
+so that a tick only runs the commands that have work to do.
+"""
+
+
+class CommandScheduler:
+    """
+    Hashed timing wheel of the commands of all the players.
+
+    Every command is filed under the tick at which it next needs to run: the tick it was pushed, to start, then the
+    tick at which its counter reaches 0, to finish. The wheel has WHEEL_SIZE slots and a command due at tick t is kept
+    in slot t % WHEEL_SIZE, so a tick only looks at one slot, skipping the commands due in a later turn of the wheel.
+    Scheduling, removing and checking whether a command is scheduled are O(1).
+    The scheduled commands of every entity are indexed too, so that the conflicts of a new command are found in O(1).
+    The commands count their ticks on the clock of the scheduler, which advances by one at the end of every run.
+    When the clock reaches the tick at which the countdown of a command is over, the command is completed, calling
+    the functions waiting on it, such as the tasks parked until then.
+    """
+
+    WHEEL_SIZE: int = 256
+
+    def __init__(self) -> None:
+        """
+        Create an empty scheduler at tick 0.
+        """
+        self.__now: int = 0
+        self.__due: dict["Command", int] = {}
+        self.__by_entity: dict["Entity", dict["Command", None]] = {}
+        self.__slots: list[dict["Command", None]] = [
+            {} for _ in range(CommandScheduler.WHEEL_SIZE)
+        ]
+
+    @staticmethod
+    def from_list(commands: list["Command"]) -> "CommandScheduler":
+        """
+        Create a scheduler running the commands of a game saved when they were kept in a list.
+
+        :param commands: The commands.
+        :type commands: list[Command]
+        :return: The scheduler, at tick 0.
+        :rtype: CommandScheduler
+        """
+        scheduler = CommandScheduler()
+        for command in commands:
+            command.move_to_scheduler(commands, scheduler)
+        return scheduler
+
+    def get_now(self) -> int:
+        """
+        Get the current tick of the scheduler.
+
+        :return: The current tick.
+        :rtype: int
+        """
+        return self.__now
+
+    def schedule(self, command: "Command", tick: int) -> None:
+        """
+        File a command under the tick at which it next needs to run, replacing its previous tick if it was scheduled.
+
+        :param command: The command.
+        :type command: Command
+        :param tick: The tick, the current tick if it is in the past.
+        :type tick: int
+        """
+        self.remove(command)
+        tick = max(tick, self.__now)
+        self.__due[command] = tick
+        self.__slots[tick % CommandScheduler.WHEEL_SIZE][command] = None
+        self.__by_entity.setdefault(command.get_entity(), {})[command] = None
+
+    def remove(self, command: "Command") -> None:
+        """
+        Remove a command, if it is scheduled.
+
+        :param command: The command.
+        :type command: Command
+        """
+        tick = self.__due.pop(command, None)
+        if tick is None:
+            return
+        self.__slots[tick % CommandScheduler.WHEEL_SIZE].pop(command, None)
+        entity = command.get_entity()
+        commands = self.__by_entity[entity]
+        del commands[command]
+        if not commands:
+            del self.__by_entity[entity]
+
+    def get_commands(self, entity: "Entity") -> list["Command"]:
+        """
+        Get the scheduled commands of an entity.
+
+        :param entity: The entity.
+        :type entity: Entity
+        :return: The commands of the entity, in the order they were scheduled.
+        :rtype: list[Command]
+        """
+        return list(self.__by_entity.get(entity, ()))
+
+    def run(self, run: typing.Callable[["Command"], None]) -> int:
+        """
+        Run the commands due at the current tick, then advance the clock.
+        A command still scheduled after running, and not filed again, is filed under the tick at which its counter
+        reaches 0, or the next tick if it already has.
+        The commands whose counter reaches 0 at the new tick are completed.
+
+        :param run: The function running a command.
+        :type run: Callable[[Command], None]
+        :return: The number of commands run.
+        :rtype: int
+        """
+        now = self.__now
+        slot = self.__slots[now % CommandScheduler.WHEEL_SIZE]
+        due = [command for command in slot if self.__due[command] == now]
+        for command in due:
+            del slot[command]
+        for command in due:
+            run(command)
+            if self.__due.get(command) == now:
+                tick = now + max(command.get_tick(), 1)
+                self.__due[command] = tick
+                self.__slots[tick % CommandScheduler.WHEEL_SIZE][command] = None
+        self.__now = now = now + 1
+        for command in list(self.__slots[now % CommandScheduler.WHEEL_SIZE]):
+            if self.__due.get(command) == now and command.get_tick() <= 0:
+                command.complete()
+        return len(due)
+
+    def __contains__(self, command: "Command") -> bool:
+        """
+        Check if a command is scheduled.
+
+        :param command: The command.
+        :type command: Command
+        :return: True if the command is scheduled, False otherwise.
+        :rtype: bool
+        """
+        return command in self.__due
+
+    def __iter__(self) -> typing.Iterator["Command"]:
+        """
+        Iterate over the scheduled commands, in the order they were scheduled.
+
+        :return: An iterator over the commands.
+        :rtype: Iterator[Command]
+        """
+        return iter(list(self.__due))
+
+    def __len__(self) -> int:
+        """
+        Get the number of scheduled commands.
+
+        :return: The number of commands.
+        :rtype: int
+        """
+        return len(self.__due)
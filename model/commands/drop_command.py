@@ -7,6 +7,7 @@ import typing
 
 if typing.TYPE_CHECKING:
     from controller.network_controller import NetworkController
+    from model.commands.command_scheduler import CommandScheduler
 
 
 class DropCommand(Command):
@@ -20,7 +21,7 @@ class DropCommand(Command):
         network_controller: "NetworkController",
         target_coord: Coordinate,
         convert_coeff: int,
-        command_list: list[Command],
+        command_list: "CommandScheduler",
     ) -> None:
         """
         Initializes the DropCommand with the given map, player, entity, process and convert_coeff.
@@ -9,6 +9,7 @@ import json
 
 if typing.TYPE_CHECKING:
     from controller.network_controller import NetworkController
+    from model.commands.command_scheduler import CommandScheduler
 
 
 class MoveCommand(Command):
@@ -22,7 +23,7 @@ class MoveCommand(Command):
         network_controller: "NetworkController",
         target_coord: Coordinate,
         convert_coeff: int,
-        command_list: list[Command],
+        command_list: "CommandScheduler",
     ) -> None:
         """
         Initializes the MoveCommand with the given map, player, entity, process and convert_coeff.
@@ -56,7 +57,6 @@ class MoveCommand(Command):
             self.get_interactions().move_unit(self.get_entity(), self.__target_coord)
         if self.get_tick() <= 0:
             super().remove_command_from_list(self.__command_list)
-        self.set_tick(self.get_tick() - 1)
 
     def send_network(self):
         """
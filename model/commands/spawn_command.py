@@ -1,7 +1,8 @@
+from model import catalogue
 from model.buildings.building import Building
 from model.commands.command import Command, Process
-from model.commands.unit_spawner import UnitSpawner
 from model.game_object import GameObject
+from model.object_type import ObjectType
 from model.player.player import Player
 from model.units.unit import Unit
 from util.coordinate import Coordinate
@@ -10,6 +11,7 @@ import typing
 
 if typing.TYPE_CHECKING:
     from controller.network_controller import NetworkController
+    from model.commands.command_scheduler import CommandScheduler
 
 
 class SpawnCommand(Command):
@@ -23,7 +25,7 @@ class SpawnCommand(Command):
         network_controller: "NetworkController",
         target_coord: Coordinate,
         convert_coeff: int,
-        command_list: list[Command],
+        command_list: "CommandScheduler",
     ) -> None:
         """
         Initializes the SpawnCommand with the given map, player, building, target_coord and convert_coeff.
@@ -41,11 +43,12 @@ class SpawnCommand(Command):
         super().__init__(
             game_map, player, building, network_controller, Process.SPAWN, convert_coeff
         )
-        self.set_time(UnitSpawner()[building.get_name()].get_spawning_time())
+        self.__unit_type: ObjectType = catalogue.get_spawned_type(building.get_name())
+        self.set_time(self.__unit_type.get_spawning_time())
         self.set_tick(int(self.get_time() * convert_coeff))
         self.__target_coord = target_coord
         self.__command_list = command_list
-        self.__place_holder: GameObject = GameObject("Place Holder", "x", 9999)
+        self.__place_holder: GameObject = GameObject(GameObject.PLACE_HOLDER)
         self.__start: bool = True
         super().push_command_to_list(command_list)
         # print(f"Spawning {self} for {self.get_player().get_name()}, at {self.__target_coord}")
@@ -73,13 +76,11 @@ class SpawnCommand(Command):
                 raise ValueError("Population limit reached.")
             if not all(
                 self.get_player().check_consume(resource, amount)
-                for resource, amount in UnitSpawner()[self.get_entity().get_name()]
-                .get_cost()
-                .items()
+                for resource, amount in self.__unit_type.get_cost().items()
             ):
                 super().remove_command_from_list(self.__command_list)
                 raise ValueError(
-                    f"Not enough resources. Needing {UnitSpawner()[self.get_entity().get_name()].get_cost()} while having {self.get_player().get_resources()}"
+                    f"Not enough resources. Needing {dict(self.__unit_type.get_cost())} while having {self.get_player().get_resources()}"
                 )
             if (
                 not self.get_interactions()
@@ -88,9 +89,7 @@ class SpawnCommand(Command):
             ):
                 super().remove_command_from_list(self.__command_list)
                 raise ValueError("Invalid placement.")
-            for resource, amount in (
-                UnitSpawner()[self.get_entity().get_name()].get_cost().items()
-            ):
+            for resource, amount in self.__unit_type.get_cost().items():
                 self.get_player().consume(resource, amount)
                 # print(f"Player {self.get_player().get_name()} consumed {amount} {resource}")
             self.get_interactions().place_object(
@@ -100,11 +99,10 @@ class SpawnCommand(Command):
         if self.get_tick() <= 0:
             if self in self.__command_list:
                 self.get_interactions().remove_object(self.__place_holder)
-                spawned: Unit = UnitSpawner()[self.get_entity().get_name()]
+                spawned: Unit = catalogue.spawn_unit(self.get_entity().get_name())
                 self.get_interactions().place_object(spawned, self.__target_coord)
                 self.get_interactions().link_owner(self.get_player(), spawned)
 
                 super().remove_command_from_list(self.__command_list)
             else:
                 pass
-        self.set_tick(self.get_tick() - 1)
@@ -1,6 +1,7 @@
 import typing
 
 from model.game_object import GameObject
+from model.object_type import ObjectType
 from model.resources.resource import Resource
 
 if typing.TYPE_CHECKING:
@@ -11,31 +12,16 @@ if typing.TYPE_CHECKING:
 class Entity(GameObject):
     """This class represents the entities (Units and Buildings) on the map."""
 
-    def __init__(
-        self,
-        name: str,
-        letter: str,
-        hp: int,
-        cost: dict["Resource", int],
-        spawning_time: int,
-    ):
+    __slots__ = ("__player", "__task")
+
+    def __init__(self, object_type: ObjectType):
         """
         Initializes the entity.
 
-        :param name: The name of the entity.
-        :type name: str
-        :param letter: The letter representing the entity.
-        :type letter: str
-        :param hp: The hit points of the entity.
-        :type hp: int
-        :param cost: The cost of the entity in resources.
-        :type cost: dict['Resource', int]
-        :param spawning_time: The time it takes to spawn the entity.
-        :type spawning_time: int
+        :param object_type: The type of the entity, with its cost and spawning time.
+        :type object_type: ObjectType
         """
-        super().__init__(name, letter, hp)
-        self.__cost: dict[Resource, int] = cost
-        self.__spawning_time: int = spawning_time
+        super().__init__(object_type)
         self.__player: "Player" = None
         self.__task: "Task" = None
 
@@ -45,14 +31,14 @@ class Entity(GameObject):
     def __repr__(self):
         return f"{self.get_name()} Hp: {self.get_hp()}. Coordinate: {self.get_coordinate()}"
 
-    def get_cost(self) -> dict[Resource, int]:
+    def get_cost(self) -> typing.Mapping[Resource, int]:
         """
         Returns the cost of the entity.
 
         :return: The cost of the entity in resources.
-        :rtype: dict['Resource', int]
+        :rtype: Mapping['Resource', int]
         """
-        return self.__cost
+        return self.get_type().get_cost()
 
     def get_spawning_time(self) -> int:
         """
@@ -61,7 +47,7 @@ class Entity(GameObject):
         :return: The spawning time of the entity.
         :rtype: int
         """
-        return self.__spawning_time
+        return self.get_type().get_spawning_time()
 
     def get_player(self) -> "Player":
         """
@@ -92,9 +78,12 @@ class Entity(GameObject):
 
     def set_task(self, task: "Task") -> None:
         """
-        Sets the task associated with the entity.
+        Sets the task associated with the entity, and registers the change with the task manager of its player.
 
         :param task: The task to associate with the entity.
         :type task: Task
         """
         self.__task = task
+        player = self.get_player()
+        if player is not None and player.get_task_manager() is not None:
+            player.get_task_manager().track(self)
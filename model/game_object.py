@@ -1,29 +1,54 @@
+import typing
+
+from model.object_type import ObjectType
 from util.coordinate import Coordinate
 
 
 class GameObject:
-    """This class represents an object in the game."""
+    """
+    This class represents an object in the game.
+
+    The constants of the kind of an object are kept in its shared ObjectType, and the classes of the model declare
+    __slots__, so that an object only carries its own state. The size and the sprite path can still be set on an
+    object, overriding the ones of its type.
+    """
+
+    __slots__ = (
+        "__type",
+        "__hp",
+        "__coordinate",
+        "__alive",
+        "__size",
+        "__sprite_path",
+        "__id",
+    )
+
+    PLACE_HOLDER: ObjectType = ObjectType("Place Holder", "x", 9999)
 
-    def __init__(self, name: str, letter: str, hp: int):
+    def __init__(self, object_type: ObjectType):
         """
         Initializes a game object.
 
-        :param name: The name of the game object.
-        :type name: str
-        :param letter: The letter representing the game object.
-        :type letter: str
-        :param hp: The hit points of the game object.
-        :type hp: int
+        :param object_type: The type of the game object.
+        :type object_type: ObjectType
         """
-        self.__name: str = name
-        self.__letter: str = letter
-        self.__hp: int = hp
+        self.__type: ObjectType = object_type
+        self.__hp: int = object_type.get_hp()
         self.__coordinate: Coordinate = None
         self.__alive: bool = True
-        self.__size: int = 1
+        self.__size: int = None
         self.__sprite_path: str = None
         self.__id: id = None
 
+    def get_type(self) -> ObjectType:
+        """
+        Returns the type of the object.
+
+        :return: The shared description of the kind of the object.
+        :rtype: ObjectType
+        """
+        return self.__type
+
     def get_name(self) -> str:
         """
         Returns the name of the object.
@@ -31,7 +56,7 @@ class GameObject:
         :return: The name of the object.
         :rtype: str
         """
-        return self.__name
+        return self.__type.get_name()
 
     def get_letter(self) -> str:
         """
@@ -40,7 +65,7 @@ class GameObject:
         :return: The letter of the object.
         :rtype: str
         """
-        return self.__letter
+        return self.__type.get_letter()
 
     def get_hp(self) -> int:
         """
@@ -112,6 +137,8 @@ class GameObject:
         :return: The size of the object.
         :rtype: int
         """
+        if self.__size is None:
+            return self.__type.get_size()
         return self.__size
 
     def set_size(self, size: int) -> None:
@@ -130,6 +157,8 @@ class GameObject:
         :return: The path to the sprite of the object.
         :rtype: str
         """
+        if self.__sprite_path is None:
+            return self.__type.get_sprite_path()
         return self.__sprite_path
 
     def set_sprite_path(self, path: str) -> None:
@@ -167,3 +196,51 @@ class GameObject:
         :rtype: int
         """
         return self.__id
+
+    def __setstate__(self, state: typing.Union[tuple, dict]) -> None:
+        """
+        Restores an unpickled object, also one pickled before the model declared __slots__, whose state is the
+        dictionary of its attributes: the constants now kept in the type of the object are dropped, and the attributes
+        added since start empty. The attributes the object no longer has are dropped in both cases.
+
+        :param state: The state of the object.
+        :type state: tuple or dict
+        """
+        slots = GameObject.__get_slot_names(type(self))
+        if isinstance(state, tuple):
+            state = {
+                name: value
+                for name, value in {**(state[0] or {}), **(state[1] or {})}.items()
+                if name in slots
+            }
+        else:
+            state = {
+                **dict.fromkeys(slots),
+                **{name: value for name, value in state.items() if name in slots},
+                "_GameObject__type": getattr(
+                    type(self), "TYPE", GameObject.PLACE_HOLDER
+                ),
+                "_GameObject__sprite_path": None,
+            }
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    @staticmethod
+    def __get_slot_names(object_class: type) -> set[str]:
+        """
+        Returns the names of the attributes of the slots of a class and of its bases, mangled as in their dictionary.
+
+        :param object_class: The class.
+        :type object_class: type
+        :return: The names of the attributes.
+        :rtype: set[str]
+        """
+        return {
+            (
+                f"_{base.__name__.lstrip('_')}{name}"
+                if name.startswith("__") and not name.endswith("__")
+                else name
+            )
+            for base in object_class.__mro__
+            for name in base.__dict__.get("__slots__", ())
+        }
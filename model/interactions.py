@@ -254,6 +254,7 @@ class Interactions:
         :type entity: Entity
         """
         entity.set_player(player)
+        self.__map.reindex(entity)
         if isinstance(entity, Building):
             player.add_building(entity)
         if isinstance(entity, Unit):
@@ -0,0 +1,258 @@
+import types
+import typing
+
+if typing.TYPE_CHECKING:
+    from model.resources.resource import Resource
+
+"""
+This file contains the ObjectType class, which describes the constants shared by all the game objects of a kind.
+"""
+
+
+class ObjectType:
+    """
+    Read-only description of a kind of game object.
+
+    Every class of the model holds its type as a class-level TYPE, and its instances only keep a reference to it next
+    to their own state, instead of a copy of the name, letter, cost, sprite path and statistics of their kind.
+    The attributes that do not apply to a kind keep their neutral default.
+    """
+
+    __slots__ = (
+        "__name",
+        "__letter",
+        "__hp",
+        "__size",
+        "__sprite_path",
+        "__cost",
+        "__spawning_time",
+        "__attack_per_second",
+        "__speed",
+        "__range",
+        "__resources_drop_point",
+        "__population_increase",
+        "__capacity_increase",
+        "__amount",
+        "__spawnable",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        letter: str,
+        hp: int,
+        size: int = 1,
+        sprite_path: str = None,
+        cost: typing.Optional[dict["Resource", int]] = None,
+        spawning_time: int = 0,
+        attack_per_second: int = 0,
+        speed: float = 0,
+        range: int = 1,
+        resources_drop_point: bool = False,
+        population_increase: bool = False,
+        capacity_increase: int = 0,
+        amount: int = 0,
+        spawnable: bool = False,
+    ) -> None:
+        """
+        Describe a kind of game object.
+
+        :param name: The name of the objects.
+        :type name: str
+        :param letter: The letter representing the objects.
+        :type letter: str
+        :param hp: The hit points of a new object.
+        :type hp: int
+        :param size: The size of the objects, in tiles.
+        :type size: int
+        :param sprite_path: The path to the sprite of the objects.
+        :type sprite_path: str
+        :param cost: The cost of an entity in resources.
+        :type cost: dict['Resource', int]
+        :param spawning_time: The time it takes to spawn an entity.
+        :type spawning_time: int
+        :param attack_per_second: The attack rate of a unit.
+        :type attack_per_second: int
+        :param speed: The speed of a unit.
+        :type speed: float
+        :param range: The range of a unit.
+        :type range: int
+        :param resources_drop_point: Whether a building is a resources drop point.
+        :type resources_drop_point: bool
+        :param population_increase: Whether a building increases the population.
+        :type population_increase: bool
+        :param capacity_increase: The population a building adds.
+        :type capacity_increase: int
+        :param amount: The amount of a new resource.
+        :type amount: int
+        :param spawnable: Whether a resource is spawnable.
+        :type spawnable: bool
+        """
+        self.__name: str = name
+        self.__letter: str = letter
+        self.__hp: int = hp
+        self.__size: int = size
+        self.__sprite_path: str = sprite_path
+        self.__cost: typing.Mapping["Resource", int] = types.MappingProxyType(
+            dict(cost or {})
+        )
+        self.__spawning_time: int = spawning_time
+        self.__attack_per_second: int = attack_per_second
+        self.__speed: float = speed
+        self.__range: int = range
+        self.__resources_drop_point: bool = resources_drop_point
+        self.__population_increase: bool = population_increase
+        self.__capacity_increase: int = capacity_increase
+        self.__amount: int = amount
+        self.__spawnable: bool = spawnable
+
+    def __repr__(self) -> str:
+        return f"ObjectType({self.__name})"
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickles the type by value: the cost is pickled as a plain dictionary.
+
+        :return: The constructor and its arguments.
+        :rtype: tuple
+        """
+        return (
+            ObjectType,
+            (
+                self.__name,
+                self.__letter,
+                self.__hp,
+                self.__size,
+                self.__sprite_path,
+                dict(self.__cost),
+                self.__spawning_time,
+                self.__attack_per_second,
+                self.__speed,
+                self.__range,
+                self.__resources_drop_point,
+                self.__population_increase,
+                self.__capacity_increase,
+                self.__amount,
+                self.__spawnable,
+            ),
+        )
+
+    def get_name(self) -> str:
+        """
+        Returns the name of the objects.
+        :return: The name.
+        :rtype: str
+        """
+        return self.__name
+
+    def get_letter(self) -> str:
+        """
+        Returns the letter representing the objects.
+        :return: The letter.
+        :rtype: str
+        """
+        return self.__letter
+
+    def get_hp(self) -> int:
+        """
+        Returns the hit points of a new object.
+        :return: The hit points.
+        :rtype: int
+        """
+        return self.__hp
+
+    def get_size(self) -> int:
+        """
+        Returns the size of the objects.
+        :return: The size, in tiles.
+        :rtype: int
+        """
+        return self.__size
+
+    def get_sprite_path(self) -> str:
+        """
+        Returns the path to the sprite of the objects.
+        :return: The path, None if the objects have no sprite.
+        :rtype: str
+        """
+        return self.__sprite_path
+
+    def get_cost(self) -> typing.Mapping["Resource", int]:
+        """
+        Returns the cost of an entity.
+        :return: The read-only cost in resources.
+        :rtype: Mapping['Resource', int]
+        """
+        return self.__cost
+
+    def get_spawning_time(self) -> int:
+        """
+        Returns the time it takes to spawn an entity.
+        :return: The spawning time.
+        :rtype: int
+        """
+        return self.__spawning_time
+
+    def get_attack_per_second(self) -> int:
+        """
+        Returns the attack rate of a unit.
+        :return: The attack per second.
+        :rtype: int
+        """
+        return self.__attack_per_second
+
+    def get_speed(self) -> float:
+        """
+        Returns the speed of a unit.
+        :return: The speed.
+        :rtype: float
+        """
+        return self.__speed
+
+    def get_range(self) -> int:
+        """
+        Returns the range of a unit.
+        :return: The range.
+        :rtype: int
+        """
+        return self.__range
+
+    def is_resources_drop_point(self) -> bool:
+        """
+        Returns whether a building is a resources drop point.
+        :return: True if it is, False otherwise.
+        :rtype: bool
+        """
+        return self.__resources_drop_point
+
+    def is_population_increase(self) -> bool:
+        """
+        Returns whether a building increases the population.
+        :return: True if it does, False otherwise.
+        :rtype: bool
+        """
+        return self.__population_increase
+
+    def get_capacity_increase(self) -> int:
+        """
+        Returns the population a building adds.
+        :return: The capacity increase.
+        :rtype: int
+        """
+        return self.__capacity_increase
+
+    def get_amount(self) -> int:
+        """
+        Returns the amount of a new resource.
+        :return: The amount.
+        :rtype: int
+        """
+        return self.__amount
+
+    def is_spawnable(self) -> bool:
+        """
+        Returns whether a resource is spawnable.
+        :return: True if it is, False otherwise.
+        :rtype: bool
+        """
+        return self.__spawnable
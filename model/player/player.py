@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Set
+from typing import TYPE_CHECKING, AbstractSet
 
 from model.buildings.building import Building
 from model.resources.food import Food
@@ -28,9 +28,10 @@ class Player:
         self.__name: str = name
         self.__color: str = color
         self.__resource: dict[Resource, int] = {Food(): 0, Gold(): 0, Wood(): 0}
-        self.__units: Set[Unit] = set()
+        # The units and the buildings are kept in dictionaries used as sets, so that they are always visited in the order they were added
+        self.__units: dict[Unit, None] = {}
         self.__unit_count: int = 0
-        self.__buildings: Set[Building] = set()
+        self.__buildings: dict[Building, None] = {}
         self.__max_population: int = 0
         self.__command_manager: "CommandController" = None
         self.__task_manager: "TaskController" = None
@@ -40,6 +41,20 @@ class Player:
     def __repr__(self):
         return f"{self.get_name()} : {self.get_color()}"
 
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores an unpickled player, also one saved when its units and buildings were kept in sets, or with the
+        component store the players no longer have.
+
+        :param state: The attributes of the player.
+        :type state: dict
+        """
+        for name in ("_Player__units", "_Player__buildings"):
+            if isinstance(state.get(name), (set, frozenset)):
+                state[name] = dict.fromkeys(state[name])
+        state.pop("_Player__component_store", None)
+        self.__dict__.update(state)
+
     def get_centre_coordinate(self) -> Coordinate:
         return self.__centre_coordinate
 
@@ -158,14 +173,14 @@ class Player:
             raise ValueError("Not enough resources to consume")
         self.__resource[resource] -= amount
 
-    def get_units(self) -> Set[Unit]:
+    def get_units(self) -> AbstractSet[Unit]:
         """
         Returns the units of the player.
 
-        :return: A set of units.
-        :rtype: Set[Unit]
+        :return: A set of units, in the order they were added.
+        :rtype: AbstractSet[Unit]
         """
-        return self.__units
+        return self.__units.keys()
 
     def get_unit_count(self) -> int:
         """
@@ -186,8 +201,10 @@ class Player:
         """
         if not self.__unit_count < self.__max_population:
             raise ValueError("Player has reached the maximum population")
-        self.__units.add(unit)
+        self.__units[unit] = None
         self.__unit_count += 1
+        if self.__task_manager is not None:
+            self.__task_manager.track(unit)
 
     def remove_unit(self, unit: Unit) -> None:
         """
@@ -196,17 +213,19 @@ class Player:
         :param unit: The unit to remove.
         :type unit: Unit
         """
-        self.__units.remove(unit)
+        del self.__units[unit]
         self.__unit_count -= 1
+        if self.__task_manager is not None:
+            self.__task_manager.untrack(unit)
 
-    def get_buildings(self) -> Set[Building]:
+    def get_buildings(self) -> AbstractSet[Building]:
         """
         Returns the buildings of the player.
 
-        :return: A set of buildings.
-        :rtype: Set[Building]
+        :return: A set of buildings, in the order they were added.
+        :rtype: AbstractSet[Building]
         """
-        return self.__buildings
+        return self.__buildings.keys()
 
     def add_building(self, building: Building) -> None:
         """
@@ -215,7 +234,9 @@ class Player:
         :param building: The building to add.
         :type building: Building
         """
-        self.__buildings.add(building)
+        self.__buildings[building] = None
+        if self.__task_manager is not None:
+            self.__task_manager.track(building)
 
     def remove_building(self, building: Building) -> None:
         """
@@ -224,7 +245,9 @@ class Player:
         :param building: The building to remove.
         :type building: Building
         """
-        self.__buildings.remove(building)
+        del self.__buildings[building]
+        if self.__task_manager is not None:
+            self.__task_manager.untrack(building)
 
     def get_max_population(self) -> int:
         """
@@ -279,6 +302,9 @@ class Player:
         :type task_manager: TaskController
         """
         self.__task_manager = task_manager
+        if task_manager is not None:
+            for entity in [*self.__units, *self.__buildings]:
+                task_manager.track(entity)
 
     def __eq__(self, other: "Player") -> bool:
         """
@@ -1,10 +1,10 @@
+from model import catalogue
 from model.ai import AI
 from model.buildings.barracks import Barracks
 from model.buildings.building import Building
 from model.buildings.farm import Farm
 from model.buildings.house import House
 from model.buildings.town_center import TownCenter
-from model.commands.unit_spawner import UnitSpawner
 from model.player.player import Player
 from model.player.strategies.strategy import Strategy
 from model.resources.resource import Resource
@@ -99,12 +99,14 @@ class DefaultStrategy(Strategy):
         build_points = (
             self.get_ai()
             .get_map_known()
-            .find_nearest_empty_zones(center_coordinate, TownCenter().get_size())
+            .find_nearest_empty_zones(
+                center_coordinate, TownCenter.TYPE.get_size(), len(villagers) + 1
+            )
         )
         collect_points = (
             self.get_ai()
             .get_map_known()
-            .find_nearest_objects(center_coordinate, Resource)
+            .find_nearest_objects(center_coordinate, Resource, len(villagers))
         )
         for i, villager in enumerate(villagers):
             match self.__villager_task_count % 3:
@@ -112,7 +114,7 @@ class DefaultStrategy(Strategy):
                     if (
                         all(
                             self.get_ai().get_player().check_consume(resource, amount)
-                            for resource, amount in Farm().get_cost().items()
+                            for resource, amount in Farm.TYPE.get_cost().items()
                         )
                         and build_points
                     ):
@@ -127,7 +129,7 @@ class DefaultStrategy(Strategy):
                     if (
                         all(
                             self.get_ai().get_player().check_consume(resource, amount)
-                            for resource, amount in House().get_cost().items()
+                            for resource, amount in House.TYPE.get_cost().items()
                         )
                         and build_points
                     ):
@@ -162,12 +164,14 @@ class DefaultStrategy(Strategy):
         build_points = (
             self.get_ai()
             .get_map_known()
-            .find_nearest_empty_zones(center_coordinate, TownCenter().get_size())
+            .find_nearest_empty_zones(
+                center_coordinate, TownCenter.TYPE.get_size(), len(villagers) + 1
+            )
         )
         collect_points = (
             self.get_ai()
             .get_map_known()
-            .find_nearest_objects(center_coordinate, Resource)
+            .find_nearest_objects(center_coordinate, Resource, len(villagers))
         )
         for i, villager in enumerate(villagers):
             match self.__villager_task_count % 2:
@@ -175,7 +179,7 @@ class DefaultStrategy(Strategy):
                     if (
                         all(
                             self.get_ai().get_player().check_consume(resource, amount)
-                            for resource, amount in Barracks().get_cost().items()
+                            for resource, amount in Barracks.TYPE.get_cost().items()
                         )
                         and build_points
                     ):
@@ -187,7 +191,7 @@ class DefaultStrategy(Strategy):
                     elif (
                         all(
                             self.get_ai().get_player().check_consume(resource, amount)
-                            for resource, amount in Farm().get_cost().items()
+                            for resource, amount in Farm.TYPE.get_cost().items()
                         )
                         and build_points
                     ):
@@ -202,7 +206,7 @@ class DefaultStrategy(Strategy):
                     if (
                         all(
                             self.get_ai().get_player().check_consume(resource, amount)
-                            for resource, amount in Farm().get_cost().items()
+                            for resource, amount in Farm.TYPE.get_cost().items()
                         )
                         and build_points
                     ):
@@ -318,12 +322,12 @@ class DefaultStrategy(Strategy):
             for b in self.get_ai().get_player().get_buildings()
             if isinstance(b, object_type) and b.get_task() is None
         ]
-        unit = UnitSpawner()[object_type().get_name()]
+        unit_type = catalogue.get_spawned_type(object_type.TYPE.get_name())
         for building in buildings:
             if (
                 all(
                     self.get_ai().get_player().get_resources().get(key, 0) >= cost
-                    for key, cost in unit.get_cost().items()
+                    for key, cost in unit_type.get_cost().items()
                 )
                 and self.get_ai().get_player().get_unit_count()
                 < self.get_ai().get_player().get_max_population()
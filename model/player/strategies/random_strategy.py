@@ -71,11 +71,11 @@ class RandomStrategy(Strategy):
                 build_point = random.choice(adjacent_build_points)
                 # Choose a random building: 0=Farm, 1=House
                 building_type = random.randint(0, 1)
-                building = Farm() if building_type == 0 else House()
+                building_class = Farm if building_type == 0 else House
 
                 # Check if we have resources
                 can_build = True
-                for resource, amount in building.get_cost().items():
+                for resource, amount in building_class.TYPE.get_cost().items():
                     if not self.get_ai().get_player().check_consume(resource, amount):
                         can_build = False
                         break
@@ -86,7 +86,7 @@ class RandomStrategy(Strategy):
                             self.get_ai().get_player().get_command_manager(),
                             villager,
                             build_point,
-                            building,
+                            building_class(),
                         )
                     )
 
@@ -1,9 +1,14 @@
+from model.object_type import ObjectType
 from model.resources.resource import Resource
 
 
 class Food(Resource):
     """This class represents the Food resource"""
     
+    __slots__ = ()
+
+    TYPE: ObjectType = Resource.type_of("Food", "F", 300, False)
+
     def __init__(self):
         """Initializes the food"""
-        super().__init__("Food", "F", 300, False)
\ No newline at end of file
+        super().__init__(Food.TYPE)
\ No newline at end of file
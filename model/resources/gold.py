@@ -1,9 +1,14 @@
+from model.object_type import ObjectType
 from model.resources.resource import Resource
 
 
 class Gold(Resource):
     """This class represents the Gold resource"""
     
+    __slots__ = ()
+
+    TYPE: ObjectType = Resource.type_of("Gold", "G", 800, True)
+
     def __init__(self):
         """Initializes the gold"""
-        super().__init__("Gold", "G", 800, True)
\ No newline at end of file
+        super().__init__(Gold.TYPE)
\ No newline at end of file
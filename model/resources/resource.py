@@ -1,13 +1,27 @@
 from model.game_object import GameObject
+from model.object_type import ObjectType
 
 
 class Resource(GameObject):
     """This class represents the resources on the map"""
     
-    def __init__(self, name: str, letter: str, amount: int, spawnable: bool):
+    __slots__ = ("__amount",)
+
+    def __init__(self, object_type: ObjectType):
         """
         Initializes the resource.
 
+        :param object_type: The type of the resource, with its amount and whether it can spawn.
+        :type object_type: ObjectType
+        """
+        super().__init__(object_type)
+        self.__amount: int = object_type.get_amount()
+
+    @staticmethod
+    def type_of(name: str, letter: str, amount: int, spawnable: bool) -> ObjectType:
+        """
+        Describes a kind of resource, with the sprite named after it.
+
         :param name: The name of the resource.
         :type name: str
         :param letter: The letter representing the resource.
@@ -16,11 +30,10 @@ class Resource(GameObject):
         :type amount: int
         :param spawnable: Whether the resource can spawn.
         :type spawnable: bool
+        :return: The type of the resource.
+        :rtype: ObjectType
         """
-        super().__init__(name, letter, 1)
-        self.__amount: int = amount
-        self.__spawnable: bool = spawnable
-        super().set_sprite_path(f"assets/sprites/resources/{self.get_name().lower()}.png")
+        return ObjectType(name, letter, 1, sprite_path=f"assets/sprites/resources/{name.lower()}.png", amount=amount, spawnable=spawnable)
     
     def get_amount(self) -> int:
         """
@@ -38,7 +51,7 @@ class Resource(GameObject):
         :return: True if the resource can spawn, False otherwise.
         :rtype: bool
         """
-        return self.__spawnable
+        return self.get_type().is_spawnable()
     
     def collect(self, amount: int) -> int:
         """
@@ -1,9 +1,14 @@
+from model.object_type import ObjectType
 from model.resources.resource import Resource
 
 
 class Wood(Resource):
     """This class represents the Wood resource"""
     
+    __slots__ = ()
+
+    TYPE: ObjectType = Resource.type_of("Wood", "W", 100, True)
+
     def __init__(self):
         """Initializes the wood"""
-        super().__init__("Wood", "W", 100, True)
\ No newline at end of file
+        super().__init__(Wood.TYPE)
\ No newline at end of file
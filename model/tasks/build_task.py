@@ -37,6 +37,18 @@ class BuildTask(Task):
         """
         return self.__name
     
+    def get_pending_command(self) -> Command:
+        """
+        Returns the started move or build command the task is only waiting on, until its countdown is over.
+        :return: The command, None if the task has work to do at the next tick.
+        :rtype: Command
+        """
+        if not self.get_entity().get_coordinate().is_adjacent(self.get_target_coord()):
+            return self.__move_task.get_pending_command()
+        if self.get_waiting() and self.__command and self.__command.is_scheduled() and self.__command.is_started() and self.__command.get_tick() > 0:
+            return self.__command
+        return None
+    
     def execute_task(self):
         """
         Execute the build task.
@@ -51,6 +51,23 @@ class CollectAndDropTask(Task):
         if self.__move_task_back is None:
             self.__move_task_back: MoveTask = MoveTask(self.get_command_manager(), self.get_entity(), self.__drop_coord)
     
+    def get_pending_command(self) -> Command:
+        """
+        Returns the started move or collect command the task is only waiting on, until its countdown is over.
+        :return: The command, None if the task has work to do at the next tick.
+        :rtype: Command
+        """
+        collecter : Villager = self.get_entity()
+        if self.__target_resource and collecter.get_inventory()[self.__target_resource] < collecter.get_inventory_size():
+            if not collecter.get_coordinate().is_adjacent(self.get_target_coord()):
+                return self.__move_task_go.get_pending_command()
+            if self.get_waiting() and self.__command and self.__command.is_scheduled() and self.__command.is_started() and self.__command.get_tick() > 0:
+                return self.__command
+            return None
+        if self.__move_task_back is not None and not collecter.get_coordinate().is_adjacent(self.__drop_coord):
+            return self.__move_task_back.get_pending_command()
+        return None
+    
     def execute_task(self):
         """
         Execute the collect and drop task.
@@ -34,6 +34,21 @@ class KillTask(Task):
         """
         return self.__name
     
+    def get_pending_command(self) -> Command:
+        """
+        Returns the started move or attack command the task is only waiting on, until its countdown is over.
+        :return: The command, None if the task has work to do at the next tick.
+        :rtype: Command
+        """
+        attacker: Unit = self.get_entity()
+        if not attacker.get_coordinate().is_in_range(self.get_target_coord(), attacker.get_range()):
+            if attacker.get_coordinate().is_adjacent(self.get_target_coord()):
+                return None
+            return self.__move_task.get_pending_command()
+        if self.get_waiting() and self.__command and self.__command.is_scheduled() and self.__command.is_started() and self.__command.get_tick() > 0:
+            return self.__command
+        return None
+    
     def execute_task(self):
         """
         Execute the kill task.
@@ -3,6 +3,8 @@ from model.commands.command import Command
 from model.tasks.task import Task
 from model.units.unit import Unit
 from util.coordinate import Coordinate
+from util.flow_field import FlowField
+from util.map import Map
 from util.state_manager import Process
 
 
@@ -24,10 +26,20 @@ class MoveTask(Task):
         :type avoid_to_coord: Coordinate
         """
         super().__init__(command_manager, unit, target_coord)
+        self.__flow_field: FlowField = None
+        self.__flow_goal: tuple[int, int] = None
         if avoid_from_coord and avoid_to_coord:
             self.__path: list[Coordinate] = self.get_command_manager().get_map().path_finding_avoid(self.get_entity().get_coordinate(), self.get_target_coord(), avoid_from_coord, avoid_to_coord)
         else:
-            if diagonal:
+            if diagonal and self.get_entity().get_coordinate().distance(self.get_target_coord()) <= Map.HIERARCHICAL_DISTANCE:
+                # Units heading to a popular destination nearby share the flow field of the destination instead of searching their own path
+                # The far ones keep the hierarchical path, so that the field never has to be expanded over most of the map
+                self.__flow_field = self.get_command_manager().get_map().get_flow_fields().request((self.get_target_coord().get_x(), self.get_target_coord().get_y()))
+            if self.__flow_field is not None:
+                self.__path: list[Coordinate] = []
+            elif diagonal and self.get_entity().get_coordinate().distance(self.get_target_coord()) > Map.HIERARCHICAL_DISTANCE:
+                self.__path: list[Coordinate] = self.get_command_manager().get_map().path_finding_hierarchical(self.get_entity().get_coordinate(), self.get_target_coord())
+            elif diagonal:
                 self.__path: list[Coordinate] = self.get_command_manager().get_map().path_finding(self.get_entity().get_coordinate(), self.get_target_coord())
             else:
                 self.__path: list[Coordinate] = self.get_command_manager().get_map().path_finding_non_diagonal(self.get_entity().get_coordinate(), self.get_target_coord())
@@ -35,7 +47,30 @@ class MoveTask(Task):
         self.__step: int = 0
         self.__command: Command = None
         self.__name : str = "MoveTask"
-    
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the attributes of the task to pickle. The flow field is not saved with the game, only its goal is,
+        so that the task gets the field of the goal again from the loaded map.
+        :return: The attributes of the task.
+        :rtype: dict
+        """
+        state = self.__dict__.copy()
+        if self.__flow_field is not None:
+            state["_MoveTask__flow_field"] = None
+            state["_MoveTask__flow_goal"] = self.__flow_field.get_goal()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores an unpickled move task, also one saved before the move tasks could follow a flow field.
+        :param state: The attributes of the task.
+        :type state: dict
+        """
+        state.setdefault("_MoveTask__flow_field", None)
+        state.setdefault("_MoveTask__flow_goal", None)
+        self.__dict__.update(state)
+
     def get_name(self) -> str:
         """
         Returns the name of the task.
@@ -44,13 +79,40 @@ class MoveTask(Task):
         """
         return self.__name
     
+    def __next_coord(self) -> Coordinate:
+        """
+        Returns the next coordinate of the move, read from the flow field or the path.
+        :return: The next coordinate.
+        :rtype: Coordinate
+        :raises ValueError: If the flow field has no step towards the target.
+        """
+        if self.__flow_goal is not None:
+            self.__flow_field = self.get_command_manager().get_map().get_flow_fields().get_field(self.__flow_goal)
+            self.__flow_goal = None
+        if self.__flow_field is not None:
+            step = self.__flow_field.next_step(self.get_entity().get_coordinate().get_x(), self.get_entity().get_coordinate().get_y())
+            if step is None:
+                raise ValueError("No step towards the target.")
+            return Coordinate.of(*step)
+        return self.__path[self.__step]
+    
+    def get_pending_command(self) -> Command:
+        """
+        Returns the started move command the move task is only waiting on, until its countdown is over.
+        :return: The command, None if the task has work to do at the next tick.
+        :rtype: Command
+        """
+        if self.get_waiting() and self.__command and self.__command.is_scheduled() and self.__command.is_started() and self.__command.get_tick() > 0:
+            return self.__command
+        return None
+    
     def execute_task(self):
         """
         Execute the move task.
         """
         try:
             if not (self.get_waiting()):
-                self.__command = self.get_command_manager().command(self.get_entity(), Process.MOVE, self.__path[self.__step])
+                self.__command = self.get_command_manager().command(self.get_entity(), Process.MOVE, self.__next_coord())
                 self.set_waiting(True)
             if self.__command.get_tick() <= 0:
                 self.set_waiting(False)
@@ -17,7 +17,7 @@ class SpawnTask(Task):
         :param building: The building that will execute the task.
         :type building: Building
         """
-        target_coord : Coordinate = command_manager.get_map().find_nearest_empty_zones(building.get_coordinate(), 1)[0]
+        target_coord : Coordinate = command_manager.get_map().find_nearest_empty_zones(building.get_coordinate(), 1, 1)[0]
         super().__init__(command_manager, building, target_coord)
         self.__name : str = "SpawnTask"
         self.__command: Command = None
@@ -30,6 +30,16 @@ class SpawnTask(Task):
         """
         return self.__name
     
+    def get_sleep(self) -> int:
+        """
+        Returns the number of ticks the task is only waiting on the countdown of its started spawn command.
+        :return: The number of ticks, 0 if the task has work to do at the next tick.
+        :rtype: int
+        """
+        if self.get_waiting() and self.__command and self.__command.is_started():
+            return self.__command.get_tick() - (self.__command.get_convert_coeff() * 20)
+        return 0
+    
     def execute_task(self):
         if not self.get_waiting():
             self.__command =self.get_command_manager().command(self.get_entity(), Process.SPAWN, self.get_target_coord())
@@ -1,6 +1,8 @@
+import typing
 from abc import ABC, abstractmethod
 
 from controller.command_controller import CommandController
+from model.commands.command import Command
 from model.entity import Entity
 from util.coordinate import Coordinate
 
@@ -51,6 +53,24 @@ class Task(ABC):
         """
         pass
 
+    def get_pending_command(self) -> typing.Optional[Command]:
+        """
+        Returns the started command, still scheduled, the task is only waiting on, until its countdown is over.
+        The task manager parks the task until the command is completed.
+        :return: The command, None if the task has work to do at the next tick.
+        :rtype: Command
+        """
+        return None
+
+    def get_sleep(self) -> int:
+        """
+        Returns the number of ticks the task is only waiting on the countdown of a command, when it resumes before the
+        command is completed. The task manager parks the task for that long.
+        :return: The number of ticks, 0 if the task has work to do at the next tick.
+        :rtype: int
+        """
+        return 0
+
     def get_command_manager(self) -> CommandController:
         """
         Returns the command manager of the task.
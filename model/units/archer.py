@@ -1,3 +1,4 @@
+from model.object_type import ObjectType
 from model.resources.food import Food
 from model.resources.gold import Gold
 from model.resources.wood import Wood
@@ -6,8 +7,11 @@ from model.units.unit import Unit
 
 class Archer(Unit):
     """This class represents the Archer unit on the map, inheriting from Unit"""
+    __slots__ = ()
+
+    TYPE: ObjectType = Unit.type_of("Archer", "a", 30,{ Wood(): 25, Gold(): 45 }, 35, 4, 1.0, 4)
+
     def __init__(self):
-        super().__init__("Archer", "a", 30,{ Wood(): 25, Gold(): 45 }, 35, 4, 1.0)
-        super().set_range(4)
+        super().__init__(Archer.TYPE)
     
         
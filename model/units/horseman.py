@@ -1,3 +1,4 @@
+from model.object_type import ObjectType
 from model.resources.food import Food
 from model.resources.gold import Gold
 from model.resources.wood import Wood
@@ -6,8 +7,12 @@ from model.units.unit import Unit
 
 class Horseman(Unit):
     """This class represents the Horseman the map, inheriting from Unit"""
+    __slots__ = ()
+
+    TYPE: ObjectType = Unit.type_of("Horseman", "h", 45, { Food() : 80, Gold(): 20}, 30, 4, 1.2)
+
     def __init__(self):
-        super().__init__("Horseman", "h", 45, { Food() : 80, Gold(): 20}, 30, 4, 1.2)
+        super().__init__(Horseman.TYPE)
 
     
         
\ No newline at end of file
@@ -1,3 +1,4 @@
+from model.object_type import ObjectType
 from model.resources.food import Food
 from model.resources.gold import Gold
 from model.resources.wood import Wood
@@ -6,8 +7,12 @@ from model.units.unit import Unit
 
 class Swordsman(Unit):
     """This class represents the Swordsman unit on the map, inheriting from Unit"""
+    __slots__ = ()
+
+    TYPE: ObjectType = Unit.type_of("Swordsman", "s", 40, { Food(): 50, Gold(): 20 },20, 4, 0.9)
+
     def __init__(self):
-        super().__init__("Swordsman", "s", 40, { Food(): 50, Gold(): 20 },20, 4, 0.9)
+        super().__init__(Swordsman.TYPE)
 
     
         
\ No newline at end of file
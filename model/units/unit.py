@@ -1,12 +1,28 @@
 from model.entity import Entity
+from model.object_type import ObjectType
 from model.resources.resource import Resource
 
 
 class Unit(Entity):
     """This class represents the units on the map."""
 
-    def __init__(
-        self,
+    __slots__ = ("__attack_per_second", "__speed", "__range")
+
+    def __init__(self, object_type: ObjectType):
+        """
+        Initializes the unit.
+
+        :param object_type: The type of the unit, with its attack rate, speed and range.
+        :type object_type: ObjectType
+        """
+        super().__init__(object_type)
+        # Set only when a unit is changed, the type holding the statistics of every unit of its kind
+        self.__attack_per_second: int = None
+        self.__speed: float = None
+        self.__range: int = None
+
+    @staticmethod
+    def type_of(
         name: str,
         letter: str,
         hp: int,
@@ -14,41 +30,37 @@ class Unit(Entity):
         spawning_time: int,
         attack_per_second: int,
         speed: float,
-    ):
-        """
-        Initializes the unit.
-
-        :param name: The name of the unit.
-        :type name: str
-        :param letter: The letter representing the unit.
-        :type letter: str
-        :param hp: The hit points of the unit.
-        :type hp: int
-        :param cost: The cost to create the unit.
-        :type cost: dict['Resource', int]
-        :param spawning_time: The time it takes to spawn the unit.
-        :type spawning_time: int
-        :param attack_per_second: The attack rate of the unit.
-        :type attack_per_second: int
-        :param speed: The speed of the unit.
-        :type speed: float
-        """
-        super().__init__(name, letter, hp, cost, spawning_time)
-        self.__attack_per_second: int = attack_per_second
-        self.__speed: float = speed
-        self.__range: int = 1
-        super().set_sprite_path(f"assets/sprites/units/{name.lower()}.png")
+        range: int = 1,
+    ) -> ObjectType:
+        """This method will describe a kind of unit, with the sprite named after it"""
+        return ObjectType(
+            name,
+            letter,
+            hp,
+            sprite_path=f"assets/sprites/units/{name.lower()}.png",
+            cost=cost,
+            spawning_time=spawning_time,
+            attack_per_second=attack_per_second,
+            speed=speed,
+            range=range,
+        )
 
     def get_attack_per_second(self) -> float:
         """This method will return the speed of attack of the unit"""
+        if self.__attack_per_second is None:
+            return self.get_type().get_attack_per_second()
         return self.__attack_per_second
 
     def get_speed(self) -> float:
         """This method will return the speed of the unit"""
+        if self.__speed is None:
+            return self.get_type().get_speed()
         return self.__speed
 
     def get_range(self) -> int:
         """This method will return the range of the unit"""
+        if self.__range is None:
+            return self.get_type().get_range()
         return self.__range
 
     def set_range(self, new_range: int):
@@ -1,3 +1,4 @@
+from model.object_type import ObjectType
 from model.resources.food import Food
 from model.resources.gold import Gold
 from model.resources.resource import Resource
@@ -8,12 +9,18 @@ from model.units.unit import Unit
 class Villager(Unit):
     """This class represents the Villager unit"""
 
+    __slots__ = ("__inventory",)
+
+    TYPE: ObjectType = Unit.type_of("Villager", "v", 25, {Food(): 50}, 25, 2, 0.8)
+    INVENTORY_SIZE: int = 20
+    COLLECT_TIME_PER_MINUTE: int = 25
+    # Shared keys of the inventories, the resources being compared by name
+    RESOURCES: tuple[Resource, ...] = (Food(), Gold(), Wood())
+
     def __init__(self):
         """Initializes the villager"""
-        super().__init__("Villager", "v", 25, {Food(): 50}, 25, 2, 0.8)        
-        self.__inventory: dict[Resource, int] = {Food(): 0,Gold(): 0,Wood(): 0}
-        self.__inventory_size: int = 20
-        self.__collect_time_per_minute: int = 25
+        super().__init__(Villager.TYPE)
+        self.__inventory: dict[Resource, int] = dict.fromkeys(Villager.RESOURCES, 0)
 
     def get_inventory(self) -> dict[Resource, int]:
         """
@@ -31,7 +38,7 @@ class Villager(Unit):
         :return: The inventory size of the villager.
         :rtype: int
         """
-        return self.__inventory_size
+        return Villager.INVENTORY_SIZE
     
     def get_collect_time_per_minute(self) -> int:
         """
@@ -40,7 +47,7 @@ class Villager(Unit):
         :return: The time it takes to collect resources per minute.
         :rtype: int
         """
-        return self.__collect_time_per_minute
+        return Villager.COLLECT_TIME_PER_MINUTE
     
     def stock_resource(self,resource: Resource, amount: int) -> None:
         """
@@ -51,10 +58,10 @@ class Villager(Unit):
         :param amount: The amount of resource to stock.
         :type amount: int
         """
-        if self.__inventory[Wood()] + self.__inventory[Food()] + self.__inventory[Gold()] + amount <= self.__inventory_size:
+        if self.__inventory[Wood()] + self.__inventory[Food()] + self.__inventory[Gold()] + amount <= Villager.INVENTORY_SIZE:
             self.__inventory[resource] += amount
         else:
-            self.__inventory[resource] += self.__inventory_size - self.__inventory[Wood()] + self.__inventory[Food()] + self.__inventory[Gold()]
+            self.__inventory[resource] += Villager.INVENTORY_SIZE - self.__inventory[Wood()] + self.__inventory[Food()] + self.__inventory[Gold()]
             raise ValueError("Capacity exceeded")
         
     def empty_resource(self) -> dict[Resource, int]:
@@ -65,5 +72,5 @@ class Villager(Unit):
         :rtype: dict[Resource, int]
         """
         inventory = self.__inventory
-        self.__inventory = {Food(): 0,Gold(): 0,Wood(): 0}
+        self.__inventory = dict.fromkeys(Villager.RESOURCES, 0)
         return inventory
\ No newline at end of file
@@ -0,0 +1,43 @@
+import unittest
+
+from model import catalogue
+from model.buildings.town_center import TownCenter
+from model.game_object import GameObject
+from model.units.swordsman import Swordsman
+from model.units.villager import Villager
+
+
+class TestCatalogue(unittest.TestCase):
+    """Test cases for the catalogue of the kinds of game objects."""
+
+    def test_types(self):
+        """Test that every kind is found by name, with the type shared by its objects."""
+        for name, object_class in catalogue.OBJECT_CLASSES.items():
+            with self.subTest(name=name):
+                self.assertIs(catalogue.get_type(name), object_class.TYPE)
+                self.assertEqual(object_class().get_name(), name)
+        self.assertIs(catalogue.get_type("Place Holder"), GameObject.PLACE_HOLDER)
+        with self.assertRaises(TypeError):
+            catalogue.OBJECT_CLASSES["Villager"] = Swordsman
+
+    def test_create_object(self):
+        """Test that the objects are created by name, and unknown names give place holders."""
+        town_center = catalogue.create_object("Town Center")
+        self.assertIsInstance(town_center, TownCenter)
+        self.assertIsNot(town_center, catalogue.create_object("Town Center"))
+        for name in ["Place Holder", "Unknown"]:
+            with self.subTest(name=name):
+                place_holder = catalogue.create_object(name)
+                self.assertIs(place_holder.get_type(), GameObject.PLACE_HOLDER)
+
+    def test_spawn(self):
+        """Test that the unit spawned by a building is known without creating one."""
+        self.assertIs(catalogue.get_spawned_type("Town Center"), Villager.TYPE)
+        self.assertIs(catalogue.get_spawned_type("Barracks"), Swordsman.TYPE)
+        self.assertIsInstance(catalogue.spawn_unit("Barracks"), Swordsman)
+        with self.assertRaises(KeyError):
+            catalogue.get_spawned_type("House")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from model.resources.wood import Wood
+from util.cluster_graph import ClusterGraph
+from util.coordinate import Coordinate
+from util.map import Map
+from util.pathfinder import Pathfinder
+
+
+class TestClusterGraph(unittest.TestCase):
+    """Test cases for the ClusterGraph class used by the hierarchical pathfinding."""
+
+    def setUp(self):
+        """Set up a 48x48 map with a vertical wall of wood at x = 20 that has a single gap at y = 40."""
+        self.map = Map(48)
+        for y in range(48):
+            if y != 40:
+                self.map.add(Wood(), Coordinate(20, y))
+        self.graph = ClusterGraph(self.map)
+
+    def assert_valid(self, path: list[tuple[int, int]]):
+        """Assert that every step of a path is a move to an adjacent empty tile."""
+        for (x, y), (nx, ny) in zip(path, path[1:]):
+            self.assertEqual(max(abs(nx - x), abs(ny - y)), 1)
+            self.assertIsNone(self.map.get_xy(nx, ny))
+
+    def test_find_path(self):
+        """Test that the path goes through the gap and is as long as the flat one."""
+        path = self.graph.find_path((2, 2), (45, 3))
+        self.assertEqual((path[0], path[-1]), ((2, 2), (45, 3)))
+        self.assert_valid(path)
+        self.assertIn((20, 40), path)
+        flat = Pathfinder(48).find_path(self.map.get_walkable(), (2, 2), (45, 3))
+        self.assertLessEqual(len(path), len(flat) * 1.2)
+
+    def test_update(self):
+        """Test that the graph follows the additions and removals of the map."""
+        self.assertTrue(self.graph.find_path((2, 2), (45, 3)))
+        self.map.add(Wood(), Coordinate(20, 40))
+        self.assertEqual(self.graph.find_path((2, 2), (45, 3)), [])
+        self.map.remove(Coordinate(20, 10))
+        path = self.graph.find_path((2, 2), (45, 3))
+        self.assert_valid(path)
+        self.assertIn((20, 10), path)
+
+    def test_map_hierarchical(self):
+        """Test that the Map returns the hierarchical path as coordinates, without the start."""
+        path = self.map.path_finding_hierarchical(Coordinate(2, 2), Coordinate(45, 3))
+        self.assertEqual(path[-1], Coordinate(45, 3))
+        self.assertNotEqual(path[0], Coordinate(2, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
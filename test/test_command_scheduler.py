@@ -0,0 +1,176 @@
+import unittest
+
+from controller.command_controller import CommandController
+from controller.network_controller import NullNetworkController
+from model.commands.command_scheduler import CommandScheduler
+from model.player.player import Player
+from model.units.villager import Villager
+from util.coordinate import Coordinate
+from util.map import Map
+from util.state_manager import Process
+
+
+class CountdownCommand:
+    """A command counting its ticks down on the clock of the scheduler, and removing itself once they are over."""
+
+    def __init__(self, scheduler: CommandScheduler, ticks: int) -> None:
+        self.scheduler = scheduler
+        self.end = scheduler.get_now() + ticks
+        self.runs = []
+        self.completions = []
+        scheduler.schedule(self, scheduler.get_now())
+
+    def get_tick(self) -> int:
+        return self.end - self.scheduler.get_now()
+
+    def get_entity(self) -> "CountdownCommand":
+        return self
+
+    def complete(self) -> None:
+        self.completions.append(self.scheduler.get_now())
+
+    def run_command(self) -> None:
+        self.runs.append(self.scheduler.get_now())
+        if self.get_tick() <= 0:
+            self.scheduler.remove(self)
+
+
+class TestCommandScheduler(unittest.TestCase):
+    """Test cases for the CommandScheduler class."""
+
+    def setUp(self):
+        """Set up an empty scheduler."""
+        self.scheduler = CommandScheduler()
+
+    def advance(self, ticks: int) -> list[int]:
+        """Run the scheduler for some ticks and return the number of commands run at each tick."""
+        return [
+            self.scheduler.run(lambda command: command.run_command())
+            for _ in range(ticks)
+        ]
+
+    def test_only_due_commands_run(self):
+        """Test that a command runs when it starts and when its ticks are over, even beyond a turn of the wheel."""
+        long = CommandScheduler.WHEEL_SIZE + 10
+        short_command = CountdownCommand(self.scheduler, 3)
+        long_command = CountdownCommand(self.scheduler, long)
+        self.assertEqual(len(self.scheduler), 2)
+        self.assertEqual(sum(self.advance(long + 1)), 4)
+        self.assertEqual(short_command.runs, [0, 3])
+        self.assertEqual(long_command.runs, [0, long])
+        self.assertEqual(short_command.completions, [3])
+        self.assertEqual(long_command.completions, [long])
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_remove(self):
+        """Test that a removed command is no longer scheduled nor run."""
+        command = CountdownCommand(self.scheduler, 5)
+        self.advance(1)
+        self.assertIn(command, self.scheduler)
+        self.scheduler.remove(command)
+        self.scheduler.remove(command)
+        self.assertNotIn(command, self.scheduler)
+        self.assertEqual(self.scheduler.get_commands(command), [])
+        self.assertEqual(sum(self.advance(10)), 0)
+        self.assertEqual(command.runs, [0])
+        self.assertEqual(command.completions, [])
+
+    def test_schedule(self):
+        """Test that scheduling a command again replaces its tick, and that a tick in the past means now."""
+        command = CountdownCommand(self.scheduler, 5)
+        self.scheduler.schedule(command, 2)
+        self.assertEqual(self.advance(3), [0, 0, 1])
+        self.scheduler.schedule(command, -1)
+        self.assertEqual(self.advance(1), [1])
+        self.assertEqual(list(self.scheduler), [command])
+
+    def test_move_command(self):
+        """Test that a move command moves its unit when it starts, counts its ticks down while it waits, is completed when they are over, then removed."""
+        game_map = Map(10)
+        player = Player("player", "blue")
+        villager = Villager()
+        game_map.add(villager, Coordinate(1, 1))
+        villager.set_coordinate(Coordinate(1, 1))
+        villager.set_player(player)
+        manager = CommandController(
+            game_map, player, 60, self.scheduler, NullNetworkController()
+        )
+        command = manager.command(villager, Process.MOVE, Coordinate(2, 2))
+        ticks = command.get_tick()
+        completions = []
+        command.add_completion_callback(
+            lambda command: completions.append(
+                (self.scheduler.get_now(), command.get_tick())
+            )
+        )
+        self.assertEqual(self.scheduler.get_commands(villager), [command])
+        with self.assertRaises(ValueError):
+            manager.command(villager, Process.MOVE, Coordinate(3, 3))
+        self.advance(1)
+        self.assertIs(game_map.get(Coordinate(2, 2)), villager)
+        self.assertEqual(command.get_tick(), ticks - 1)
+        self.assertEqual(sum(self.advance(ticks)), 1)
+        self.assertEqual(completions, [(ticks, 0)])
+        self.assertNotIn(command, self.scheduler)
+        self.assertEqual(command.get_tick(), -1)
+        self.advance(5)
+        self.assertEqual(command.get_tick(), -1)
+
+    def test_from_list(self):
+        """Test that a command saved in the list of commands of an older game is moved to a scheduler, and finishes there."""
+        game_map = Map(10)
+        player = Player("player", "blue")
+        villager = Villager()
+        game_map.add(villager, Coordinate(1, 1))
+        villager.set_coordinate(Coordinate(1, 1))
+        villager.set_player(player)
+        manager = CommandController(
+            game_map, player, 60, CommandScheduler(), NullNetworkController()
+        )
+        command = manager.command(villager, Process.MOVE, Coordinate(2, 2))
+        ticks = command.get_tick()
+        state = vars(command).copy()
+        for name in ["scheduler", "tick_start", "completion_callbacks"]:
+            del state[f"_Command__{name}"]
+        commands = [command]
+        state["_MoveCommand__command_list"] = commands
+        command.__dict__.clear()
+        command.__setstate__(state)
+        scheduler = CommandScheduler.from_list(commands)
+        self.assertEqual(list(scheduler), [command])
+        self.assertTrue(command.is_scheduled())
+        self.scheduler = scheduler
+        self.advance(ticks + 1)
+        self.assertIs(game_map.get(Coordinate(2, 2)), villager)
+        self.assertEqual(len(scheduler), 0)
+        self.assertEqual(commands, [command])
+
+    def test_remove_command(self):
+        """Test that a command removed before its ticks are over is completed once, so nothing keeps waiting on it."""
+        game_map = Map(10)
+        player = Player("player", "blue")
+        villager = Villager()
+        game_map.add(villager, Coordinate(1, 1))
+        villager.set_coordinate(Coordinate(1, 1))
+        villager.set_player(player)
+        manager = CommandController(
+            game_map, player, 60, self.scheduler, NullNetworkController()
+        )
+        command = manager.command(villager, Process.MOVE, Coordinate(2, 2))
+        completions = []
+        command.add_completion_callback(
+            lambda command: completions.append(command.get_tick())
+        )
+        self.advance(1)
+        self.assertTrue(command.is_scheduled())
+        command.remove_command_from_list(self.scheduler)
+        command.remove_command_from_list(self.scheduler)
+        self.assertFalse(command.is_scheduled())
+        self.assertEqual(len(completions), 1)
+        self.assertGreater(completions[0], 0)
+        self.advance(command.get_tick() + 1)
+        self.assertEqual(len(completions), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
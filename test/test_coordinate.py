@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 from util.coordinate import Coordinate
@@ -313,6 +314,26 @@ class TestCoordinate(unittest.TestCase):
             "The string should be equal to Coordinate(1, 1)",
         )
 
+    def test_of(self):
+        """Test the interning of the tile coordinates."""
+        self.assertIs(Coordinate.of(1, 1), Coordinate.of(1, 1))
+        self.assertEqual(Coordinate.of(1, 1), self.coordinate)
+        self.assertIsNot(Coordinate.of(-1, 1), Coordinate.of(-1, 1))
+        self.assertIs(self.coordinate + (1, 0), Coordinate.of(2, 1))
+        with self.assertRaises(ValueError):
+            Coordinate.of(1, 1).set_x(2)
+
+    def test_set_hash(self):
+        """Test that the cached hash follows the setters."""
+        self.coordinate.set_x(3)
+        self.assertEqual(hash(self.coordinate), hash((3, 1)))
+
+    def test_pickle(self):
+        """Test that the coordinates survive pickling."""
+        self.assertEqual(
+            pickle.loads(pickle.dumps(Coordinate.of(2, 3))), Coordinate(2, 3)
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
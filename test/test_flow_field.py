@@ -0,0 +1,68 @@
+import unittest
+
+from model.resources.wood import Wood
+from util.coordinate import Coordinate
+from util.flow_field import FlowField, FlowFieldService
+from util.map import Map
+from util.pathfinder import Pathfinder
+
+
+class TestFlowField(unittest.TestCase):
+    """Test cases for the FlowField and FlowFieldService classes."""
+
+    def setUp(self):
+        """Set up a 20x20 map with a vertical wall of wood at x = 10 that has a single gap at y = 15."""
+        self.map = Map(20)
+        for y in range(20):
+            if y != 15:
+                self.map.add(Wood(), Coordinate(10, y))
+
+    def follow(self, field: FlowField, start: tuple[int, int]) -> list[tuple[int, int]]:
+        """Follow the steps of a field from a tile until it stops."""
+        path = [start]
+        step = field.next_step(*start)
+        while step is not None and len(path) <= 400:
+            path.append(step)
+            step = field.next_step(*step)
+        return path
+
+    def test_next_step(self):
+        """Test that following the field reaches the goal through the gap as fast as the Pathfinder."""
+        field = FlowField(self.map, (18, 2))
+        path = self.follow(field, (2, 2))
+        self.assertEqual(path[-1], (18, 2))
+        self.assertIn((10, 15), path)
+        flat = Pathfinder(20).find_path(self.map.get_walkable(), (2, 2), (18, 2))
+        self.assertEqual(len(path), len(flat))
+
+    def test_recompute(self):
+        """Test that the field is recomputed when a unit is stuck on a wall built after the search."""
+        field = FlowField(self.map, (18, 2))
+        self.follow(field, (2, 2))
+        self.map.add(Wood(), Coordinate(10, 15))
+        self.map.remove(Coordinate(10, 3))
+        path = self.follow(field, (9, 15))
+        self.assertEqual(path[-1], (18, 2))
+        self.assertIn((10, 3), path)
+
+    def test_radius(self):
+        """Test that the search stays in the square of the radius around the goal."""
+        game_map = Map(FlowField.RADIUS * 2 + 20)
+        field = FlowField(game_map, (5, 5))
+        far = FlowField.RADIUS + 10
+        self.assertIsNone(field.next_step(far, far))
+        self.assertEqual(field.next_step(far - 10, far - 10), (far - 11, far - 11))
+
+    def test_popular_goal(self):
+        """Test that the service only shares a field once a goal is requested by several units."""
+        service = FlowFieldService(self.map)
+        for _ in range(FlowFieldService.POPULAR_REQUESTS - 1):
+            self.assertIsNone(service.request((18, 2)))
+        field = service.request((18, 2))
+        self.assertIsNotNone(field)
+        self.assertIs(service.request((18, 2)), field)
+        self.assertIsNone(service.request((1, 1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
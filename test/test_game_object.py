@@ -0,0 +1,110 @@
+import pickle
+import unittest
+
+from model.buildings.town_center import TownCenter
+from model.game_object import GameObject
+from model.player.player import Player
+from model.resources.food import Food
+from model.resources.gold import Gold
+from model.resources.wood import Wood
+from model.units.archer import Archer
+from model.units.villager import Villager
+
+
+class TestGameObject(unittest.TestCase):
+    """Test cases for the compact game objects and their shared types."""
+
+    def test_slots(self):
+        """Test that the objects of the model carry no instance dictionary."""
+        for game_object in [
+            GameObject(GameObject.PLACE_HOLDER),
+            Villager(),
+            Archer(),
+            TownCenter(),
+            Wood(),
+        ]:
+            with self.subTest(game_object=game_object.get_name()):
+                self.assertFalse(hasattr(game_object, "__dict__"))
+
+    def test_type(self):
+        """Test that the objects of a kind share its type, read through the usual getters."""
+        first, second = Archer(), Archer()
+        self.assertIs(first.get_type(), second.get_type())
+        self.assertIs(first.get_cost(), second.get_cost())
+        self.assertEqual(first.get_range(), 4)
+        self.assertEqual(first.get_sprite_path(), "assets/sprites/units/archer.png")
+        with self.assertRaises(TypeError):
+            first.get_cost()[Wood()] = 0
+        town_center = TownCenter()
+        self.assertEqual(town_center.get_size(), 4)
+        self.assertTrue(town_center.is_resources_drop_point())
+        self.assertEqual(town_center.get_capacity_increase(), 5)
+        self.assertEqual(Villager().get_inventory(), {Food(): 0, Gold(): 0, Wood(): 0})
+
+    def test_override(self):
+        """Test that setting a statistic on an object only changes that object."""
+        archer = Archer()
+        archer.set_range(1)
+        archer.set_speed(3.0)
+        place_holder = GameObject(GameObject.PLACE_HOLDER)
+        place_holder.set_size(3)
+        self.assertEqual(archer.get_range(), 1)
+        self.assertEqual(archer.get_speed(), 3.0)
+        self.assertEqual(Archer().get_range(), 4)
+        self.assertEqual(place_holder.get_size(), 3)
+        self.assertEqual(GameObject(GameObject.PLACE_HOLDER).get_size(), 1)
+
+    def test_pickle(self):
+        """Test that an object keeps its state and its type through pickling."""
+        villager = Villager()
+        villager.damage(5)
+        villager.stock_resource(Wood(), 3)
+        copy = pickle.loads(pickle.dumps(villager))
+        self.assertEqual(copy.get_hp(), villager.get_hp())
+        self.assertEqual(copy.get_inventory()[Wood()], 3)
+        self.assertEqual(copy.get_cost(), villager.get_cost())
+        self.assertEqual(copy.get_speed(), villager.get_speed())
+
+    def test_old_state(self):
+        """Test that an object and its player saved before the model used slots are restored."""
+        villager = Villager.__new__(Villager)
+        villager.__setstate__(
+            {
+                "_GameObject__name": "Villager",
+                "_GameObject__letter": "v",
+                "_GameObject__hp": 20,
+                "_GameObject__coordinate": None,
+                "_GameObject__alive": True,
+                "_GameObject__size": 1,
+                "_GameObject__sprite_path": "assets/sprites/units/villager.png",
+                "_GameObject__id": 7,
+                "_Entity__cost": {Food(): 50},
+                "_Entity__spawning_time": 25,
+                "_Entity__player": None,
+                "_Entity__task": None,
+                "_Unit__attack_per_second": 2,
+                "_Unit__speed": 0.8,
+                "_Unit__range": 1,
+                "_Villager__inventory": {Food(): 0, Gold(): 4, Wood(): 0},
+                "_Villager__inventory_size": 20,
+                "_Villager__collect_time_per_minute": 25,
+            }
+        )
+        self.assertIs(villager.get_type(), Villager.TYPE)
+        self.assertEqual(villager.get_hp(), 20)
+        self.assertEqual(villager.get_id(), 7)
+        self.assertEqual(villager.get_speed(), 0.8)
+        self.assertEqual(villager.get_inventory()[Gold()], 4)
+        player = Player.__new__(Player)
+        state = vars(Player("player", "blue")).copy()
+        state["_Player__component_store"] = None
+        state["_Player__units"] = {villager}
+        state["_Player__buildings"] = set()
+        player.__setstate__(state)
+        self.assertEqual(list(player.get_units()), [villager])
+        player.remove_unit(villager)
+        self.assertEqual(list(player.get_units()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import sys
+import unittest
+
+from controller.headless_controller import HeadlessController
+from util.settings import Settings
+
+
+class TestHeadlessController(unittest.TestCase):
+    """Test cases for the HeadlessController class."""
+
+    def play(self, seed: int, ticks: int) -> dict:
+        """Play a game of two players on a small map, without cache, and return its summary without the timings."""
+        settings = Settings()
+        settings.seed = seed
+        summary = HeadlessController(settings, 2, None).run(ticks)
+        del summary["elapsed"], summary["ticks_per_second"]
+        return summary
+
+    def test_run(self):
+        """Test that a game builds both players, runs its ticks and is summarised, without loading pygame."""
+        summary = self.play(1, 600)
+        self.assertEqual(summary["seed"], 1)
+        self.assertEqual(summary["ticks"], 600)
+        self.assertEqual(summary["simulated_time"], 10)
+        self.assertEqual(len(summary["players"]), 2)
+        for player in summary["players"]:
+            self.assertTrue(player["alive"])
+            self.assertGreaterEqual(player["buildings"], 1)
+            self.assertEqual(set(player["resources"]), {"Food", "Gold", "Wood"})
+        self.assertNotIn("pygame", sys.modules)
+
+    def test_seed(self):
+        """Test that two games of the same seed give the same summary."""
+        self.assertEqual(self.play(3, 600), self.play(3, 600))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import random
 import unittest
 from collections import defaultdict
 
@@ -124,6 +125,39 @@ class TestMapCoordinate(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.map.move(self.unit, Coordinate(0, 0))
 
+    def test_step(self):
+        """Test the step method of the Map class. Asserts that stepping a unit updates the map like a removal followed by an addition, and that invalid steps raise a ValueError."""
+        self.unit.set_id(2)
+        other = Map(5)
+        for game_map in (self.map, other):
+            game_map.add(self.unit, Coordinate(4, 4))
+        version = self.map.get_version()
+        self.map.step(self.unit, Coordinate(3, 3))
+        other.remove(Coordinate(4, 4))
+        other.add(self.unit, Coordinate(3, 3))
+        self.assertEqual(self.map.get_walkable(), other.get_walkable())
+        self.assertEqual(self.map.get_map_list(), other.get_map_list())
+        self.assertEqual(self.map.get_footprint(2), [Coordinate(3, 3)])
+        self.assertEqual(
+            [change[1:] for change in self.map.changes_since(version)],
+            [
+                (Coordinate(4, 4), self.unit, None),
+                (Coordinate(3, 3), None, self.unit),
+            ],
+        )
+        self.assertEqual(
+            self.map.find_nearest_objects(Coordinate(0, 0), Villager),
+            other.find_nearest_objects(Coordinate(0, 0), Villager),
+        )
+        self.unit.set_coordinate(Coordinate(3, 3))
+        self.map.add(Villager(), Coordinate(2, 2))
+        for coordinate in (Coordinate(3, 3), Coordinate(1, 3), Coordinate(2, 2)):
+            with self.assertRaises(ValueError):
+                self.map.step(self.unit, coordinate)
+        self.unit.set_coordinate(Coordinate(4, 4))
+        with self.assertRaises(ValueError):
+            self.map.step(self.unit, Coordinate(5, 4))
+
     def test_get_method(self):
         """Test the get method of the Map class. Adds a building and a unit to the map and asserts their positions."""
         self.map.add(self.building, Coordinate(0, 0))
@@ -148,6 +182,122 @@ class TestMapCoordinate(unittest.TestCase):
                         f"There should be no unit at position ({x}, {y})",
                     )
 
+    def test_walkable(self):
+        """Test that the walkability grid of the Map class follows the additions, moves and removals."""
+        self.map.add(self.building, Coordinate(0, 0))
+        self.map.add(self.unit, Coordinate(4, 4))
+        self.map.move(self.unit, Coordinate(4, 3))
+        self.unit.set_coordinate(Coordinate(4, 3))
+        expected = bytearray(
+            0 if (x < 4 and y < 4) or (x, y) == (4, 3) else 1
+            for y in range(5)
+            for x in range(5)
+        )
+        self.assertEqual(self.map.get_walkable(), expected)
+        self.map.force_move(self.unit, Coordinate(4, 4))
+        self.map.remove(Coordinate(0, 0))
+        expected = bytearray(
+            0 if (x, y) == (4, 4) else 1 for y in range(5) for x in range(5)
+        )
+        self.assertEqual(self.map.get_walkable(), expected)
+        self.assertEqual(self.map.capture().get_walkable(), expected)
+
+    def test_snapshot(self):
+        """Test the snapshot method of the Map class. Asserts that the snapshot only follows the map when it is taken again."""
+        self.map.add(self.building, Coordinate(0, 0))
+        snapshot = self.map.snapshot()
+        self.assertEqual(snapshot.get_map(), self.map.get_map())
+        self.map.add(self.unit, Coordinate(4, 4))
+        self.map.remove(Coordinate(0, 0))
+        self.assertEqual(snapshot.get(Coordinate(0, 0)), self.building)
+        self.assertIsNone(snapshot.get(Coordinate(4, 4)))
+        self.assertIs(self.map.snapshot(), snapshot)
+        self.assertEqual(snapshot.get_map(), self.map.get_map())
+        self.assertEqual(snapshot.get_walkable(), self.map.get_walkable())
+
+    def test_bulk_place(self):
+        """Test the bulk_place method of the Map class. Asserts that the objects land on distinct empty tiles and that overfilling raises a ValueError."""
+        self.map.add(self.building, Coordinate(0, 0))
+        coordinates = self.map.bulk_place(Villager, 9, random.Random(0))
+        self.assertEqual(len(set(coordinates)), 9)
+        for coordinate in coordinates:
+            self.assertIsInstance(self.map.get(coordinate), Villager)
+            self.assertEqual(self.map.get(coordinate).get_coordinate(), coordinate)
+        with self.assertRaises(ValueError):
+            self.map.bulk_place(Villager, 1)
+
+    def test_changes_since(self):
+        """Test the journal of the Map class. Asserts that the changes and the dirty chunks follow the versions, and that a consumer too far behind must resynchronise."""
+        self.map.add(self.unit, Coordinate(4, 4))
+        version = self.map.get_version()
+        self.assertEqual(self.map.get_dirty_chunks(version), [])
+        self.map.force_move(self.unit, Coordinate(3, 4))
+        self.assertEqual(
+            self.map.changes_since(version),
+            [
+                (version + 1, Coordinate(4, 4), self.unit, None),
+                (version + 2, Coordinate(3, 4), None, self.unit),
+            ],
+        )
+        self.assertEqual(self.map.get_dirty_chunks(version), [0])
+        self.assertTrue(self.map.is_dirty(version, Coordinate(0, 0), Coordinate(4, 4)))
+        self.assertEqual(self.map.changes_since(self.map.get_version()), [])
+        game_map = Map(40)
+        for _ in range(Map.JOURNAL_CAPACITY // 2 + 1):
+            game_map.add(self.unit, Coordinate(0, 0))
+            game_map.remove(Coordinate(0, 0))
+        self.assertIsNone(game_map.changes_since(0))
+        self.assertFalse(
+            game_map.is_dirty(0, Coordinate(16, 16), Coordinate(39, 39)),
+        )
+
+    def test_is_empty_zone(self):
+        """Test the is_empty_zone method of the Map class. Asserts that it follows the additions and removals and rejects squares outside the map."""
+        self.assertTrue(self.map.is_empty_zone(0, 0, 5))
+        self.assertFalse(self.map.is_empty_zone(1, 1, 5))
+        self.map.add(self.unit, Coordinate(4, 4))
+        self.assertFalse(self.map.is_empty_zone(0, 0, 5))
+        self.assertTrue(self.map.is_empty_zone(0, 0, 4))
+        self.map.remove(Coordinate(4, 4))
+        self.assertTrue(self.map.is_empty_zone(0, 0, 5))
+
+    def test_find_nearest_empty_zones(self):
+        """Test the find_nearest_empty_zones method of the Map class. Asserts that the zones found are empty and do not overlap."""
+        game_map = Map(12)
+        game_map.add(self.building, Coordinate(0, 0))
+        zones = game_map.find_nearest_empty_zones(Coordinate(2, 2), 2)
+        self.assertEqual(zones[0], Coordinate(1, 5))
+        for zone in zones:
+            self.assertTrue(game_map.is_empty_zone(zone.get_x(), zone.get_y(), 2))
+        for first in zones:
+            for second in zones:
+                if first != second:
+                    self.assertTrue(
+                        abs(first.get_x() - second.get_x()) >= 3
+                        or abs(first.get_y() - second.get_y()) >= 3
+                    )
+        self.assertEqual(
+            game_map.find_nearest_empty_zones(Coordinate(2, 2), 2, 2), zones[:2]
+        )
+
+    def test_get_object_id(self):
+        """Test the get_object_id and get_footprint methods of the Map class. Asserts that the registry follows the additions, moves and removals."""
+        self.building.set_id(1)
+        self.unit.set_id(2)
+        self.map.add(self.building, Coordinate(0, 0))
+        self.map.add(self.unit, Coordinate(4, 4))
+        self.assertIs(self.map.get_object_id(1), self.building)
+        self.assertEqual(len(self.map.get_footprint(1)), 16)
+        self.map.move(self.unit, Coordinate(4, 3))
+        self.unit.set_coordinate(Coordinate(4, 3))
+        self.assertEqual(self.map.get_footprint(2), [Coordinate(4, 3)])
+        self.map.force_move(self.unit, Coordinate(4, 4))
+        self.assertEqual(self.map.get_footprint(2), [Coordinate(4, 4)])
+        self.assertIs(self.map.capture().get_object_id(2), self.unit)
+        self.map.remove(Coordinate(0, 0))
+        self.assertIsNone(self.map.get_object_id(1))
+        self.assertEqual(self.map.get_footprint(1), [])
+
     def test_get_map(self):
         """Test the get_map method of the Map class. Adds a building and a unit to the map and asserts the map's content."""
         expected = defaultdict(lambda: None)
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+
+from util.map_generator import MapGenerator
+from util.state_manager import MapSize, MapType, StartingCondition
+
+
+class TestMapGenerator(unittest.TestCase):
+    """Test cases for the MapGenerator class."""
+
+    def test_reproducible(self):
+        """Test that a seed always gives the same map, and that another seed gives another map."""
+        for map_type in [MapType.RICH, MapType.GOLD_CENTER, MapType.CLUSTERED]:
+            with self.subTest(map_type=map_type.name):
+                first = MapGenerator(
+                    1, map_type, MapSize.SMALL, StartingCondition.LEAN, None
+                ).generate()
+                second = MapGenerator(
+                    1, map_type, MapSize.SMALL, StartingCondition.LEAN, None
+                ).generate()
+                other = MapGenerator(
+                    2, map_type, MapSize.SMALL, StartingCondition.LEAN, None
+                ).generate()
+                self.assertEqual(repr(first[0]), repr(second[0]))
+                self.assertEqual(first[1:], second[1:])
+                self.assertNotEqual(repr(first[0]), repr(other[0]))
+
+    def test_start_is_free(self):
+        """Test that the tiles of the first player are left empty."""
+        game_map, town_center, villagers = MapGenerator(
+            3, MapType.CLUSTERED, MapSize.SMALL, StartingCondition.LEAN, None
+        ).generate()
+        self.assertTrue(
+            game_map.is_empty_zone(town_center.get_x(), town_center.get_y(), 4)
+        )
+        self.assertEqual(len(villagers), 3)
+        for villager in villagers:
+            self.assertIsNone(game_map.get(villager))
+        wood = sum(1 for obj in game_map.get_map().values() if obj.get_name() == "Wood")
+        self.assertEqual(wood, int(120**2 * MapGenerator.WOOD_SHARE))
+
+    def test_cache(self):
+        """Test that a generated map is cached on disk under its key and loaded back."""
+        with tempfile.TemporaryDirectory() as directory:
+            generator = MapGenerator(
+                4, MapType.RICH, MapSize.SMALL, StartingCondition.MEAN, directory
+            )
+            self.assertEqual(
+                os.path.basename(generator.get_cache_path()),
+                f"v{MapGenerator.CACHE_VERSION}_4_RICH_120_MEAN.pkl",
+            )
+            generated = generator.generate()
+            self.assertTrue(os.path.exists(generator.get_cache_path()))
+            loaded = generator.generate()
+            self.assertEqual(repr(loaded[0]), repr(generated[0]))
+            self.assertEqual(loaded[1:], generated[1:])
+
+
+if __name__ == "__main__":
+    unittest.main()
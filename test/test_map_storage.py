@@ -0,0 +1,107 @@
+import pickle
+import unittest
+
+from model.buildings.town_center import TownCenter
+from model.units.villager import Villager
+from util.coordinate import Coordinate
+from util.map import Map
+from util.storage.chunked_storage import ChunkedStorage
+from util.storage.dict_storage import DictStorage
+from util.storage.grid_storage import GridStorage
+
+
+class TestMapStorage(unittest.TestCase):
+    """Test cases checking that every storage backend behaves the same behind the Map API."""
+
+    STORAGES = [DictStorage, GridStorage, ChunkedStorage]
+
+    def test_set_and_get(self):
+        """Test that a stored object can be read back and that storing None empties the tile."""
+        for storage_class in self.STORAGES:
+            with self.subTest(storage=storage_class.__name__):
+                storage = storage_class(5)
+                unit = Villager()
+                storage.set(2, 3, unit)
+                self.assertIs(storage.get(2, 3), unit)
+                self.assertIsNone(storage.get(3, 2))
+                storage.set(2, 3, None)
+                self.assertIsNone(storage.get(2, 3))
+                self.assertEqual(list(storage.items()), [])
+
+    def test_objects_are_distinct(self):
+        """Test that an object covering several tiles is listed only once."""
+        for storage_class in self.STORAGES:
+            with self.subTest(storage=storage_class.__name__):
+                game_map = Map(5, storage_class)
+                building = TownCenter()
+                game_map.add(building, Coordinate(0, 0))
+                game_map.add(Villager(), Coordinate(4, 4))
+                self.assertEqual(len(game_map.get_storage().objects()), 2)
+                game_map.remove(Coordinate(0, 0))
+                self.assertEqual(len(game_map.get_storage().objects()), 1)
+
+    def test_get_xy(self):
+        """Test the get_xy method of the Map class, including coordinates outside the map."""
+        for storage_class in self.STORAGES:
+            with self.subTest(storage=storage_class.__name__):
+                game_map = Map(5, storage_class)
+                unit = Villager()
+                game_map.add(unit, Coordinate(4, 4))
+                self.assertIs(game_map.get_xy(4, 4), unit)
+                self.assertIsNone(game_map.get_xy(5, 4))
+                self.assertIsNone(game_map.get_xy(-1, 0))
+                self.assertIsNone(game_map.get(Coordinate(4, 5)))
+
+    def test_capture_is_independent(self):
+        """Test that a captured map does not see the changes made to the original one."""
+        for storage_class in self.STORAGES:
+            with self.subTest(storage=storage_class.__name__):
+                game_map = Map(5, storage_class)
+                unit = Villager()
+                game_map.add(unit, Coordinate(1, 1))
+                copy = game_map.capture()
+                game_map.remove(Coordinate(1, 1))
+                self.assertIs(copy.get(Coordinate(1, 1)), unit)
+                self.assertIsNone(game_map.get(Coordinate(1, 1)))
+
+    def test_pickle(self):
+        """Test that a map survives a save and load round trip."""
+        for storage_class in self.STORAGES:
+            with self.subTest(storage=storage_class.__name__):
+                game_map = Map(5, storage_class)
+                game_map.add(TownCenter(), Coordinate(0, 0))
+                loaded: Map = pickle.loads(pickle.dumps(game_map))
+                self.assertEqual(repr(loaded), repr(game_map))
+                self.assertEqual(len(loaded.get_storage().objects()), 1)
+
+    def test_items_in(self):
+        """Test that the tiles of a rectangle are listed row by row, including across chunks."""
+        for storage_class in self.STORAGES:
+            with self.subTest(storage=storage_class.__name__):
+                storage = storage_class(70)
+                for x, y in [(69, 69), (40, 5), (3, 33), (31, 32), (32, 31)]:
+                    storage.set(x, y, Villager())
+                self.assertEqual(
+                    [(x, y) for x, y, _ in storage.items_in(20, 0, 45, 40)],
+                    [(40, 5), (32, 31), (31, 32)],
+                )
+                self.assertEqual(
+                    sorted(((y, x) for x, y, _ in storage.items())),
+                    [(5, 40), (31, 32), (32, 31), (33, 3), (69, 69)],
+                )
+
+    def test_chunks_are_sparse(self):
+        """Test that the chunked storage only allocates the chunks holding objects."""
+        storage = ChunkedStorage(2000)
+        self.assertEqual(storage.get_allocated_chunks(), 0)
+        unit = Villager()
+        storage.set(1500, 1500, unit)
+        self.assertEqual(storage.get_allocated_chunks(), 1)
+        self.assertIs(storage.get(1500, 1500), unit)
+        self.assertIsNone(storage.get(1501, 1500))
+        storage.set(1500, 1500, None)
+        self.assertEqual(storage.get_allocated_chunks(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
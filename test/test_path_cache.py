@@ -0,0 +1,51 @@
+import unittest
+
+from model.resources.wood import Wood
+from util.coordinate import Coordinate
+from util.map import Map
+from util.path_cache import PathCache
+
+
+class TestPathCache(unittest.TestCase):
+    """Test cases for the PathCache class and its use by the Map."""
+
+    def setUp(self):
+        """Set up a 40x40 empty map."""
+        self.map = Map(40)
+        self.cache = self.map.get_path_cache()
+
+    def test_hit_and_miss(self):
+        """Test that the same search is answered by the cache, and a different mode is not."""
+        path = self.map.path_finding(Coordinate(0, 0), Coordinate(39, 0))
+        self.assertEqual(
+            self.map.path_finding(Coordinate(0, 0), Coordinate(39, 0)), path
+        )
+        self.map.path_finding_non_diagonal(Coordinate(0, 0), Coordinate(39, 0))
+        self.assertEqual((self.cache.get_hits(), self.cache.get_misses()), (1, 2))
+
+    def test_invalidation(self):
+        """Test that a change on a chunk crossed by the path invalidates it, but not a change elsewhere."""
+        self.map.path_finding(Coordinate(0, 0), Coordinate(39, 0))
+        self.map.add(Wood(), Coordinate(20, 30))
+        self.map.path_finding(Coordinate(0, 0), Coordinate(39, 0))
+        self.assertEqual(self.cache.get_hits(), 1)
+        self.map.add(Wood(), Coordinate(20, 0))
+        path = self.map.path_finding(Coordinate(0, 0), Coordinate(39, 0))
+        self.assertEqual(self.cache.get_hits(), 1)
+        self.assertNotIn(Coordinate(20, 0), path)
+
+    def test_eviction(self):
+        """Test that the least recently used path is evicted when the cache is full."""
+        cache = PathCache(Map.CHUNK_SIZE, 3, capacity=2)
+        versions = [0] * 9
+        cache.put("a", [(0, 0), (1, 1)], versions)
+        cache.put("b", [(0, 0), (1, 0)], versions)
+        cache.get("a", versions)
+        cache.put("c", [(0, 0), (0, 1)], versions)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b", versions))
+        self.assertIsNotNone(cache.get("a", versions))
+
+
+if __name__ == "__main__":
+    unittest.main()
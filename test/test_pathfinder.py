@@ -0,0 +1,87 @@
+import unittest
+
+from util.pathfinder import Pathfinder
+
+
+def path_cost(path: list[tuple[int, int]]) -> float:
+    """Get the cost of a path, diagonal steps costing the square root of 2."""
+    return sum(
+        2**0.5 if a[0] != b[0] and a[1] != b[1] else 1 for a, b in zip(path, path[1:])
+    )
+
+
+class TestPathfinder(unittest.TestCase):
+    """Test cases for the Pathfinder class, in A*, Jump Point Search and non diagonal modes."""
+
+    def setUp(self):
+        """Set up a 7x7 grid with a vertical wall at x = 3 that has a single gap at y = 6."""
+        self.size = 7
+        self.walkable = bytearray(b"\x01") * (self.size * self.size)
+        for y in range(self.size - 1):
+            self.walkable[y * self.size + 3] = 0
+        self.pathfinder = Pathfinder(self.size)
+
+    def assert_valid(self, path: list[tuple[int, int]], diagonal: bool):
+        """Assert that every step of a path is a move to an adjacent walkable tile."""
+        for (x, y), (nx, ny) in zip(path, path[1:]):
+            self.assertEqual(max(abs(nx - x), abs(ny - y)), 1)
+            if not diagonal:
+                self.assertEqual(abs(nx - x) + abs(ny - y), 1)
+            self.assertEqual(self.walkable[ny * self.size + nx], 1)
+
+    def test_modes_agree(self):
+        """Test that A* and Jump Point Search find paths of the same cost around the wall."""
+        a_star = self.pathfinder.find_path(
+            self.walkable, (0, 0), (6, 0), jump_point=False
+        )
+        jump_point = self.pathfinder.find_path(self.walkable, (0, 0), (6, 0))
+        for path in (a_star, jump_point):
+            self.assertEqual(path[0], (0, 0))
+            self.assertEqual(path[-1], (6, 0))
+            self.assert_valid(path, True)
+            self.assertIn((3, 6), path)
+        self.assertAlmostEqual(path_cost(a_star), path_cost(jump_point))
+
+    def test_non_diagonal(self):
+        """Test that the non diagonal mode only moves horizontally or vertically."""
+        path = self.pathfinder.find_path(self.walkable, (0, 0), (6, 0), False)
+        self.assert_valid(path, False)
+        self.assertEqual(len(path) - 1, 18)
+
+    def test_no_path(self):
+        """Test that an empty path is returned when the gap of the wall is closed."""
+        self.walkable[6 * self.size + 3] = 0
+        self.assertEqual(self.pathfinder.find_path(self.walkable, (0, 0), (6, 0)), [])
+
+    def test_avoid(self):
+        """Test that the avoid rectangle closes the gap but not the end tile."""
+        avoid = (3, 6, 3, 6)
+        self.assertEqual(
+            self.pathfinder.find_path(self.walkable, (0, 0), (6, 0), avoid=avoid), []
+        )
+        path = self.pathfinder.find_path(self.walkable, (0, 0), (3, 6), avoid=avoid)
+        self.assertEqual(path[-1], (3, 6))
+
+    def test_window(self):
+        """Test that the search leaves its first window when the only path goes around a long wall."""
+        size = Pathfinder.WINDOW_MARGIN * 4
+        walkable = bytearray(b"\x01") * (size * size)
+        for y in range(size - 1):
+            walkable[y * size + 1] = 0
+        pathfinder = Pathfinder(size)
+        for jump_point in (True, False):
+            with self.subTest(jump_point=jump_point):
+                path = pathfinder.find_path(
+                    walkable, (0, 0), (2, 0), jump_point=jump_point
+                )
+                self.assertIn((1, size - 1), path)
+                self.assertAlmostEqual(path_cost(path), 2 * (size - 2) + 2 * 2**0.5)
+
+    def test_outside(self):
+        """Test that a tile outside the map raises a ValueError."""
+        with self.assertRaises(ValueError):
+            self.pathfinder.find_path(self.walkable, (0, 0), (7, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from model.buildings.farm import Farm
+from model.player.player import Player
+from model.resources.resource import Resource
+from model.resources.wood import Wood
+from model.units.swordsman import Swordsman
+from model.units.villager import Villager
+from util.coordinate import Coordinate
+from util.map import Map
+
+
+class TestSpatialIndex(unittest.TestCase):
+    """Test cases for the spatial index of the Map and the nearest objects queries."""
+
+    def setUp(self):
+        """Set up a 40x40 map with wood at (5, 5) and (30, 30), and a farm at (20, 20)."""
+        self.map = Map(40)
+        self.map.add(Wood(), Coordinate(5, 5))
+        self.map.add(Wood(), Coordinate(30, 30))
+        self.farm = Farm()
+        self.farm.set_coordinate(Coordinate(20, 20))
+        self.map.add(self.farm, Coordinate(20, 20))
+
+    def test_nearest_resources(self):
+        """Test that resources and farms are found nearest first, and limited by count and radius."""
+        found = self.map.find_nearest_objects(Coordinate(0, 0), Wood)
+        self.assertEqual(found, [Coordinate(5, 5), Coordinate(30, 30)])
+        found = self.map.find_nearest_objects(Coordinate(31, 31), Wood, 1)
+        self.assertEqual(found, [Coordinate(30, 30)])
+        found = self.map.find_nearest_objects(Coordinate(18, 18), Wood, radius=12)
+        self.assertEqual(found, [Coordinate(30, 30)])
+        found = self.map.find_nearest_objects(Coordinate(21, 23), Farm)
+        self.assertEqual(len(found), 4)
+        found = self.map.find_nearest_objects(Coordinate(22, 22), Resource, 2)
+        self.assertEqual(found, [Coordinate(21, 21), Coordinate(21, 20)])
+
+    def test_nearest_enemies(self):
+        """Test that enemies are found by owner, after the owner is linked and once removed."""
+        player = Player("Enemy", "red")
+        swordsman = Swordsman()
+        swordsman.set_coordinate(Coordinate(10, 10))
+        self.map.add(swordsman, Coordinate(10, 10))
+        swordsman.set_player(player)
+        self.map.reindex(swordsman)
+        villager = Villager()
+        villager.set_coordinate(Coordinate(2, 2))
+        self.map.add(villager, Coordinate(2, 2))
+        self.assertEqual(
+            self.map.find_nearest_enemies(Coordinate(0, 0), player),
+            [Coordinate(10, 10)],
+        )
+        self.assertEqual(
+            self.map.capture().find_nearest_enemies(Coordinate(0, 0), player),
+            [Coordinate(10, 10)],
+        )
+        self.map.remove(Coordinate(10, 10))
+        self.assertEqual(self.map.find_nearest_enemies(Coordinate(0, 0), player), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+import pickle
+import unittest
+
+from controller.command_controller import CommandController
+from controller.network_controller import NullNetworkController
+from controller.task_manager import TaskController
+from model.commands.command_scheduler import CommandScheduler
+from model.player.player import Player
+from model.tasks.move_task import MoveTask
+from model.units.villager import Villager
+from util.coordinate import Coordinate
+from util.flow_field import FlowFieldService
+from util.map import Map
+
+
+class SleepingTask:
+    """A task counting its executions, and sleeping for a fixed number of ticks after each of them."""
+
+    def __init__(self, sleep: int) -> None:
+        self.sleep = sleep
+        self.executions = 0
+
+    def execute_task(self) -> None:
+        self.executions += 1
+
+    def get_pending_command(self) -> None:
+        return None
+
+    def get_sleep(self) -> int:
+        return self.sleep
+
+
+class TestTaskController(unittest.TestCase):
+    """Test cases for the TaskController class."""
+
+    def setUp(self):
+        """Set up a player with a villager on a map, and the managers of its commands and tasks."""
+        self.scheduler = CommandScheduler()
+        self.map = Map(10)
+        self.player = Player("player", "blue")
+        self.player.set_max_population(10)
+        self.player.set_command_manager(
+            CommandController(
+                self.map, self.player, 60, self.scheduler, NullNetworkController()
+            )
+        )
+        self.task_manager = TaskController(self.player.get_command_manager())
+        self.player.set_task_manager(self.task_manager)
+        self.villager = Villager()
+        self.map.add(self.villager, Coordinate(1, 1))
+        self.villager.set_coordinate(Coordinate(1, 1))
+        self.villager.set_player(self.player)
+        self.player.add_unit(self.villager)
+
+    def advance(self, ticks: int) -> None:
+        """Run the tasks then the commands, for some ticks."""
+        for _ in range(ticks):
+            self.task_manager.execute_tasks()
+            self.scheduler.run(lambda command: command.run_command())
+
+    def test_active(self):
+        """Test that only the entities with a task are active, and that a removed unit is forgotten."""
+        self.assertEqual(self.task_manager.get_active(), [])
+        task = SleepingTask(0)
+        self.villager.set_task(task)
+        self.assertEqual(self.task_manager.get_active(), [self.villager])
+        self.advance(3)
+        self.assertEqual(task.executions, 3)
+        self.villager.set_task(None)
+        self.assertEqual(self.task_manager.get_active(), [])
+        self.villager.set_task(task)
+        self.player.remove_unit(self.villager)
+        self.assertEqual(self.task_manager.get_active(), [])
+
+    def test_park(self):
+        """Test that a sleeping task is parked for its ticks, unless its entity is given a new task."""
+        task = SleepingTask(4)
+        self.villager.set_task(task)
+        self.advance(9)
+        self.assertEqual(task.executions, 3)
+        self.assertEqual(self.task_manager.get_active(), [])
+        other = SleepingTask(4)
+        self.villager.set_task(other)
+        self.advance(1)
+        self.assertEqual(other.executions, 1)
+        self.advance(8)
+        self.assertEqual(task.executions, 3)
+        self.assertEqual(other.executions, 3)
+
+    def test_move_task(self):
+        """Test that a move task is parked until its commands are completed, and reaches its target on the same tick as when it is executed every tick."""
+        target = Coordinate(4, 1)
+        other = Player("other", "red")
+        other.set_command_manager(
+            CommandController(
+                self.map, other, 60, self.scheduler, NullNetworkController()
+            )
+        )
+        polled = Villager()
+        self.map.add(polled, Coordinate(1, 3))
+        polled.set_coordinate(Coordinate(1, 3))
+        polled.set_player(other)
+        polled.set_task(MoveTask(other.get_command_manager(), polled, Coordinate(4, 3)))
+        self.villager.set_task(
+            MoveTask(self.player.get_command_manager(), self.villager, target)
+        )
+        active = 0
+        while self.villager.get_task() is not None:
+            active += len(self.task_manager.get_active())
+            try:
+                polled.get_task().execute_task()
+            except IndexError:
+                polled.set_task(None)
+            self.advance(1)
+            self.assertEqual(
+                self.villager.get_coordinate().get_x(), polled.get_coordinate().get_x()
+            )
+        self.assertIsNone(polled.get_task())
+        self.assertIs(self.map.get(target), self.villager)
+        self.assertLessEqual(active, 3 * 3 + 1)
+
+    def test_removed_command(self):
+        """Test that a task parked on a command removed before its ticks are over is active again, and not parked on it anymore."""
+        task = MoveTask(
+            self.player.get_command_manager(), self.villager, Coordinate(4, 1)
+        )
+        self.villager.set_task(task)
+        self.advance(2)
+        self.assertEqual(self.task_manager.get_active(), [])
+        [command] = self.scheduler.get_commands(self.villager)
+        self.assertIs(task.get_pending_command(), command)
+        command.remove_command_from_list(self.scheduler)
+        self.assertEqual(self.task_manager.get_active(), [self.villager])
+        self.assertIsNone(task.get_pending_command())
+        self.advance(3)
+        self.assertEqual(self.task_manager.get_active(), [self.villager])
+
+    def test_pickle(self):
+        """Test that a player with a parked task is pickled with the game, and its task resumes once loaded."""
+        self.villager.set_task(
+            MoveTask(self.player.get_command_manager(), self.villager, Coordinate(4, 1))
+        )
+        self.advance(2)
+        self.assertEqual(self.task_manager.get_active(), [])
+        player, scheduler, game_map = pickle.loads(
+            pickle.dumps((self.player, self.scheduler, self.map))
+        )
+        [villager] = player.get_units()
+        for _ in range(1000):
+            if villager.get_task() is None:
+                break
+            player.get_task_manager().execute_tasks()
+            scheduler.run(lambda command: command.run_command())
+        self.assertIsNone(villager.get_task())
+        self.assertIs(game_map.get(Coordinate(4, 1)), villager)
+
+    def test_pickle_flow_field(self):
+        """Test that a game is pickled while a unit follows a flow field, and that the unit follows the field of the loaded map."""
+        goal = Coordinate(4, 4)
+        flow_fields = self.map.get_flow_fields()
+        for _ in range(FlowFieldService.POPULAR_REQUESTS - 1):
+            flow_fields.request((goal.get_x(), goal.get_y()))
+        self.villager.set_task(
+            MoveTask(self.player.get_command_manager(), self.villager, goal)
+        )
+        self.advance(2)
+        self.assertEqual(flow_fields.get_field_count(), 1)
+        player, scheduler, game_map = pickle.loads(
+            pickle.dumps((self.player, self.scheduler, self.map))
+        )
+        [villager] = player.get_units()
+        self.assertEqual(game_map.get_flow_fields().get_field_count(), 0)
+        for _ in range(1000):
+            if villager.get_task() is None:
+                break
+            player.get_task_manager().execute_tasks()
+            scheduler.run(lambda command: command.run_command())
+        self.assertIsNone(villager.get_task())
+        self.assertIs(game_map.get(goal), villager)
+        self.assertEqual(game_map.get_flow_fields().get_field_count(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+
+from util.tick_scheduler import TickScheduler
+
+
+class FakeClock:
+    """A clock moved by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTickScheduler(unittest.TestCase):
+    """Test cases for the TickScheduler class."""
+
+    def setUp(self):
+        """Set up a scheduler of 10 ticks per second on a clock moved by hand."""
+        self.clock = FakeClock()
+        self.scheduler = TickScheduler(10, clock=self.clock)
+        self.ticks = []
+
+    def step(self):
+        """Record a tick."""
+        self.ticks.append(self.scheduler.get_tick())
+
+    def test_fixed_timestep(self):
+        """Test that the ticks follow the elapsed time, whatever the frames, and that the remainder is carried over."""
+        self.assertEqual(self.scheduler.advance(self.step), 0)
+        for elapsed in (0.05, 0.07, 0.13, 0.25):
+            self.clock.now += elapsed
+            self.scheduler.advance(self.step)
+        self.assertEqual(self.ticks, [0, 1, 2, 3, 4])
+        self.assertAlmostEqual(self.scheduler.get_simulated_time(), 0.5)
+        self.assertAlmostEqual(self.scheduler.get_wait(), 0.1)
+
+    def test_speed(self):
+        """Test that the speed scales the simulated time and that a speed of 0 pauses the ticks."""
+        self.scheduler.advance(self.step)
+        self.scheduler.set_speed(3)
+        self.clock.now += 0.1
+        self.assertEqual(self.scheduler.advance(self.step), 3)
+        self.scheduler.set_speed(0)
+        self.clock.now += 1
+        self.assertEqual(self.scheduler.advance(self.step), 0)
+        self.assertEqual(self.scheduler.get_wait(), TickScheduler.IDLE)
+
+    def test_max_steps(self):
+        """Test that a frame runs at most MAX_STEPS ticks and drops the rest of the late time."""
+        self.scheduler.advance(self.step)
+        self.clock.now += 2
+        self.assertEqual(self.scheduler.advance(self.step), TickScheduler.MAX_STEPS)
+        self.assertEqual(self.scheduler.get_dropped(), 20 - TickScheduler.MAX_STEPS)
+        self.clock.now += 0.1
+        self.assertEqual(self.scheduler.advance(self.step), 1)
+
+    def test_percentiles(self):
+        """Test the percentiles of the durations of the ticks."""
+        self.assertEqual(self.scheduler.get_percentiles(), {})
+
+        def step():
+            self.clock.now += 0.001 * (self.scheduler.get_tick() + 1)
+
+        self.scheduler.advance(step)
+        for frame in range(100):
+            self.clock.now = 0.1 * frame + 0.1001
+            self.scheduler.advance(step)
+        self.assertEqual(
+            {p: round(d, 6) for p, d in self.scheduler.get_percentiles().items()},
+            {50: 50.0, 90: 90.0, 99: 99.0},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,425 @@
+import threading
+import typing
+from heapq import heappop, heappush
+
+from util.pathfinder import SQRT2, Pathfinder
+
+if typing.TYPE_CHECKING:
+    from util.map import Map
+
+"""
+This file contains the ClusterGraph class, the abstract graph used for hierarchical pathfinding (HPA*) on large maps.
+"""
+
+
+class ClusterGraph:
+    """
+    Abstract graph over a Map, cut into square clusters of Map.CHUNK_SIZE tiles.
+
+    Each border between two clusters gets transitions: for every run of tiles walkable on both sides, one pair of tiles in the middle,
+    or one at each end when the run is long. Transitions are linked across the border (inter edges) and, inside a cluster,
+    to every transition reachable without leaving the cluster (intra edges). Intra edges are only computed when a search first reaches the cluster.
+
+    The graph follows the chunk versions of the map: only the clusters that changed since the last query, and their neighbours, are rebuilt.
+    A node is identified by the index y * size + x of its tile.
+    """
+
+    LONG_ENTRANCE: int = 6
+
+    def __init__(self, game_map: "Map") -> None:
+        """
+        Create the graph of a map. It is built lazily, on the first query.
+
+        :param game_map: The map to build the graph on.
+        :type game_map: Map
+        """
+        self.__map: "Map" = game_map
+        self.__size: int = game_map.get_size()
+        self.__cluster_size: int = game_map.CHUNK_SIZE
+        self.__clusters: int = -(-self.__size // self.__cluster_size)
+        self.__versions: list[int] = [-1] * (self.__clusters * self.__clusters)
+        self.__borders: dict[tuple[int, int], list[tuple[int, int, float]]] = {}
+        self.__nodes: list[set[int]] = [set() for _ in self.__versions]
+        self.__intra: list[typing.Optional[dict[int, list[tuple[int, float]]]]] = [
+            None for _ in self.__versions
+        ]
+        self.__inter: dict[int, dict[int, float]] = {}
+        self.__lock: threading.Lock = threading.Lock()
+
+    def get_cluster(self, x: int, y: int) -> int:
+        """
+        Get the cluster of a tile.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :return: The index of the cluster.
+        :rtype: int
+        """
+        return (y // self.__cluster_size) * self.__clusters + x // self.__cluster_size
+
+    def get_node_count(self) -> int:
+        """
+        Get the number of abstract nodes, mostly for testing and benchmarking.
+
+        :return: The number of nodes.
+        :rtype: int
+        """
+        with self.__lock:
+            self.__update()
+            return sum(len(nodes) for nodes in self.__nodes)
+
+    def find_path(
+        self, start: tuple[int, int], end: tuple[int, int]
+    ) -> list[tuple[int, int]]:
+        """
+        Find a path on the abstract graph and refine it tile by tile with the Pathfinder.
+        The start and end tiles are always considered walkable.
+        If the abstract graph finds nothing, a flat search is run so that no existing path is missed.
+
+        :param start: The (x, y) starting tile.
+        :type start: tuple[int, int]
+        :param end: The (x, y) ending tile.
+        :type end: tuple[int, int]
+        :return: The list of (x, y) tiles from start to end, both included. Empty if there is no path.
+        :rtype: list[tuple[int, int]]
+        """
+        walkable = self.__map.get_walkable()
+        pathfinder = Pathfinder.get_instance(self.__size)
+        with self.__lock:
+            self.__update()
+            waypoints = self.__abstract_path(start, end, walkable)
+        if waypoints is None:
+            return pathfinder.find_path(walkable, start, end)
+        path = [start]
+        for origin, target in zip(waypoints, waypoints[1:]):
+            segment = pathfinder.find_path(walkable, origin, target)
+            if not segment:
+                return pathfinder.find_path(walkable, start, end)
+            path.extend(segment[1:])
+        return path
+
+    def __update(self) -> None:
+        """
+        Rebuild the borders of the clusters whose chunk version changed, and mark their intra edges as stale.
+        """
+        versions = self.__map.get_chunk_versions()
+        dirty = [
+            cluster
+            for cluster, version in enumerate(versions)
+            if self.__versions[cluster] != version
+        ]
+        if not dirty:
+            return
+        touched = set(dirty)
+        rebuilt = set()
+        for cluster in dirty:
+            self.__versions[cluster] = versions[cluster]
+            for neighbour in self.__neighbours(cluster):
+                key = (min(cluster, neighbour), max(cluster, neighbour))
+                if key not in rebuilt:
+                    rebuilt.add(key)
+                    self.__build_border(*key)
+                touched.add(neighbour)
+        for cluster in touched:
+            nodes = set()
+            for neighbour in self.__neighbours(cluster):
+                key = (min(cluster, neighbour), max(cluster, neighbour))
+                for first, second, _ in self.__borders.get(key, []):
+                    nodes.add(first if cluster == key[0] else second)
+            if cluster in dirty or nodes != self.__nodes[cluster]:
+                self.__nodes[cluster] = nodes
+                self.__intra[cluster] = None
+
+    def __neighbours(self, cluster: int) -> list[int]:
+        """
+        Get the clusters around a cluster, diagonals included.
+
+        :param cluster: The index of the cluster.
+        :type cluster: int
+        :return: The indexes of the neighbouring clusters.
+        :rtype: list[int]
+        """
+        cy, cx = divmod(cluster, self.__clusters)
+        return [
+            ny * self.__clusters + nx
+            for ny in range(cy - 1, cy + 2)
+            for nx in range(cx - 1, cx + 2)
+            if (nx, ny) != (cx, cy)
+            and 0 <= nx < self.__clusters
+            and 0 <= ny < self.__clusters
+        ]
+
+    def __build_border(self, first: int, second: int) -> None:
+        """
+        Compute the transitions of the border between two neighbouring clusters and update the inter edges.
+
+        :param first: The index of the first cluster, the smallest one.
+        :type first: int
+        :param second: The index of the second cluster.
+        :type second: int
+        """
+        size, cluster_size = self.__size, self.__cluster_size
+        walkable = self.__map.get_walkable()
+        for tile, other, _ in self.__borders.pop((first, second), []):
+            self.__inter[tile].pop(other, None)
+            self.__inter[other].pop(tile, None)
+        fy, fx = divmod(first, self.__clusters)
+        sy, sx = divmod(second, self.__clusters)
+        transitions = []
+        if fx != sx and fy != sy:
+            # Diagonal neighbours only touch by a corner
+            x = (fx + 1) * cluster_size - 1 if sx > fx else fx * cluster_size
+            y = (fy + 1) * cluster_size - 1
+            nx, ny = x + (1 if sx > fx else -1), y + 1
+            if walkable[y * size + x] and walkable[ny * size + nx]:
+                transitions.append((y * size + x, ny * size + nx, SQRT2))
+        else:
+            if fy == sy:
+                x = (fx + 1) * cluster_size - 1
+                start = fy * cluster_size
+                pairs = [
+                    (y * size + x, y * size + x + 1)
+                    for y in range(start, min(start + cluster_size, size))
+                ]
+            else:
+                y = (fy + 1) * cluster_size - 1
+                start = fx * cluster_size
+                pairs = [
+                    (y * size + x, (y + 1) * size + x)
+                    for x in range(start, min(start + cluster_size, size))
+                ]
+            run = []
+            for pair in pairs + [None]:
+                if pair is not None and walkable[pair[0]] and walkable[pair[1]]:
+                    run.append(pair)
+                    continue
+                if len(run) >= ClusterGraph.LONG_ENTRANCE:
+                    transitions.append((*run[0], 1.0))
+                    transitions.append((*run[-1], 1.0))
+                elif run:
+                    transitions.append((*run[len(run) // 2], 1.0))
+                run = []
+        self.__borders[(first, second)] = transitions
+        for tile, other, cost in transitions:
+            self.__inter.setdefault(tile, {})[other] = cost
+            self.__inter.setdefault(other, {})[tile] = cost
+
+    def __local_grid(
+        self, cluster: int, walkable: bytearray, free: tuple[int, ...] = ()
+    ) -> tuple[bytearray, int, int, int]:
+        """
+        Copy the walkability of a cluster into a small grid padded with a blocked border.
+
+        :param cluster: The index of the cluster.
+        :type cluster: int
+        :param walkable: The walkability grid of the map.
+        :type walkable: bytearray
+        :param free: The indexes of tiles considered walkable whatever the grid says.
+        :type free: tuple[int, ...]
+        :return: The local grid, its width and the x and y coordinates of the cluster origin.
+        :rtype: tuple[bytearray, int, int, int]
+        """
+        size, cluster_size = self.__size, self.__cluster_size
+        cy, cx = divmod(cluster, self.__clusters)
+        min_x, min_y = cx * cluster_size, cy * cluster_size
+        columns = min(min_x + cluster_size, size) - min_x
+        rows = min(min_y + cluster_size, size) - min_y
+        width = columns + 2
+        local = bytearray(width * (rows + 2))
+        for y in range(rows):
+            row = (min_y + y) * size + min_x
+            offset = (y + 1) * width + 1
+            local[offset : offset + columns] = walkable[row : row + columns]
+        for tile in free:
+            y, x = divmod(tile, size)
+            if 0 <= x - min_x < columns and 0 <= y - min_y < rows:
+                local[(y - min_y + 1) * width + x - min_x + 1] = 1
+        return local, width, min_x, min_y
+
+    def __distances(
+        self,
+        source: int,
+        cluster: int,
+        walkable: bytearray,
+        targets: typing.Iterable[int],
+        free: tuple[int, ...] = (),
+    ) -> dict[int, float]:
+        """
+        Run Dijkstra from a tile without leaving its cluster, and get the distance to the reachable targets.
+
+        :param source: The index of the tile to start from.
+        :type source: int
+        :param cluster: The index of the cluster to stay in.
+        :type cluster: int
+        :param walkable: The walkability grid of the map.
+        :type walkable: bytearray
+        :param targets: The indexes of the tiles to reach.
+        :type targets: Iterable[int]
+        :param free: The indexes of tiles considered walkable whatever the grid says.
+        :type free: tuple[int, ...]
+        :return: The distance to every reachable target, the source excluded.
+        :rtype: dict[int, float]
+        """
+        size = self.__size
+        local, width, min_x, min_y = self.__local_grid(cluster, walkable, free)
+
+        def to_local(tile: int) -> int:
+            y, x = divmod(tile, size)
+            return (y - min_y + 1) * width + x - min_x + 1
+
+        return ClusterGraph.__local_dijkstra(
+            local,
+            width,
+            to_local(source),
+            {to_local(target): target for target in targets if target != source},
+        )
+
+    @staticmethod
+    def __local_dijkstra(
+        local: bytearray, width: int, source: int, targets: dict[int, int]
+    ) -> dict[int, float]:
+        """
+        Run Dijkstra on a padded local grid until every target is reached or the grid is exhausted.
+
+        :param local: The padded local grid.
+        :type local: bytearray
+        :param width: The width of the local grid.
+        :type width: int
+        :param source: The local index of the source.
+        :type source: int
+        :param targets: The tiles to reach, keyed by their local index.
+        :type targets: dict[int, int]
+        :return: The distance to every reachable target, keyed by tile.
+        :rtype: dict[int, float]
+        """
+        steps = [
+            (dy * width + dx, SQRT2 if dx and dy else 1.0)
+            for dx, dy in Pathfinder.DIAGONAL_DIRECTIONS
+        ]
+        distances = [float("inf")] * len(local)
+        distances[source] = 0.0
+        found = {}
+        heap = [(0.0, source)]
+        while heap and len(found) < len(targets):
+            distance, current = heappop(heap)
+            if distance > distances[current]:
+                continue
+            if current in targets:
+                found[targets[current]] = distance
+            for offset, cost in steps:
+                neighbour = current + offset
+                if local[neighbour]:
+                    new_distance = distance + cost
+                    if new_distance < distances[neighbour]:
+                        distances[neighbour] = new_distance
+                        heappush(heap, (new_distance, neighbour))
+        return found
+
+    def __intra_edges(
+        self, cluster: int, walkable: bytearray
+    ) -> dict[int, list[tuple[int, float]]]:
+        """
+        Get the intra edges of a cluster, computing them if they are stale.
+        Distances are symmetric, so each node only searches for the nodes after it.
+
+        :param cluster: The index of the cluster.
+        :type cluster: int
+        :param walkable: The walkability grid of the map.
+        :type walkable: bytearray
+        :return: The edges of every node of the cluster.
+        :rtype: dict[int, list[tuple[int, float]]]
+        """
+        intra = self.__intra[cluster]
+        if intra is not None:
+            return intra
+        size = self.__size
+        local, width, min_x, min_y = self.__local_grid(cluster, walkable)
+        nodes = sorted(self.__nodes[cluster])
+        local_nodes = [
+            (node // size - min_y + 1) * width + node % size - min_x + 1
+            for node in nodes
+        ]
+        intra = {node: [] for node in nodes}
+        for i, node in enumerate(nodes):
+            targets = {local_nodes[j]: nodes[j] for j in range(i + 1, len(nodes))}
+            if not targets:
+                break
+            distances = ClusterGraph.__local_dijkstra(
+                local, width, local_nodes[i], targets
+            )
+            for other, distance in distances.items():
+                intra[node].append((other, distance))
+                intra[other].append((node, distance))
+        self.__intra[cluster] = intra
+        return intra
+
+    def __abstract_path(
+        self, start: tuple[int, int], end: tuple[int, int], walkable: bytearray
+    ) -> typing.Optional[list[tuple[int, int]]]:
+        """
+        Run A* on the abstract graph, with the start and end tiles linked to the transitions of their clusters.
+
+        :param start: The (x, y) starting tile.
+        :type start: tuple[int, int]
+        :param end: The (x, y) ending tile.
+        :type end: tuple[int, int]
+        :param walkable: The walkability grid of the map.
+        :type walkable: bytearray
+        :return: The (x, y) waypoints from start to end, None if the graph has no path.
+        :rtype: list[tuple[int, int]]
+        """
+        size = self.__size
+        source = start[1] * size + start[0]
+        goal = end[1] * size + end[0]
+        if source == goal:
+            return [start]
+        free = (source, goal)
+        start_cluster = self.get_cluster(*start)
+        end_cluster = self.get_cluster(*end)
+        start_targets = set(self.__nodes[start_cluster])
+        if end_cluster == start_cluster:
+            start_targets.add(goal)
+        start_edges = self.__distances(
+            source, start_cluster, walkable, start_targets, free
+        )
+        end_edges = self.__distances(
+            goal, end_cluster, walkable, self.__nodes[end_cluster], free
+        )
+
+        def heuristic(node: int) -> float:
+            y, x = divmod(node, size)
+            hx, hy = abs(x - end[0]), abs(y - end[1])
+            return hx + hy + (SQRT2 - 2) * min(hx, hy)
+
+        costs = {source: 0.0}
+        parents = {source: -1}
+        closed = set()
+        heap = [(heuristic(source), source)]
+        while heap:
+            _, current = heappop(heap)
+            if current in closed:
+                continue
+            closed.add(current)
+            if current == goal:
+                waypoints = []
+                while current >= 0:
+                    waypoints.append((current % size, current // size))
+                    current = parents[current]
+                waypoints.reverse()
+                return waypoints
+            edges = list(self.__inter.get(current, {}).items())
+            cluster = self.get_cluster(current % size, current // size)
+            edges.extend(self.__intra_edges(cluster, walkable).get(current, []))
+            if current == source:
+                edges.extend(start_edges.items())
+            if current in end_edges:
+                edges.append((goal, end_edges[current]))
+            for neighbour, cost in edges:
+                new_cost = costs[current] + cost
+                if new_cost < costs.get(neighbour, float("inf")):
+                    costs[neighbour] = new_cost
+                    parents[neighbour] = current
+                    heappush(heap, (new_cost + heuristic(neighbour), neighbour))
+        return None
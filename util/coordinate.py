@@ -1,5 +1,19 @@
+"""
+This file contains the Coordinate class, which represents the coordinates of the tiles in the grid.
+"""
+
+INTERN_LIMIT: int = 4096
+
+
 class Coordinate:
-    """Used to represent the coordinates of the tiles in the grid."""
+    """
+    Used to represent the coordinates of the tiles in the grid.
+
+    Coordinates are compact slotted objects whose hash, the hash of their (x, y) pair, is computed once. The coordinates of the tiles of a map
+    are interned by Coordinate.of: they are shared and read-only, while the constructor keeps creating mutable coordinates.
+    """
+
+    __slots__ = ("__x", "__y", "__hash", "__interned")
 
     def __init__(self, x: int, y: int):
         """
@@ -12,6 +26,62 @@ class Coordinate:
         """
         self.__x = x
         self.__y = y
+        self.__hash = hash((x, y))
+        self.__interned = False
+
+    @staticmethod
+    def of(x: int, y: int) -> "Coordinate":
+        """
+        Get the shared coordinate of a tile, creating it on first use.
+        Only integer coordinates between 0 and INTERN_LIMIT are interned, the others are created as usual.
+
+        :param x: The x coordinate.
+        :type x: int
+        :param y: The y coordinate.
+        :type y: int
+        :return: The read-only coordinate.
+        :rtype: Coordinate
+        """
+        if type(x) is int and type(y) is int and 0 <= x < INTERN_LIMIT > y >= 0:
+            key = y * INTERN_LIMIT + x
+            coordinate = _interned.get(key)
+            if coordinate is None:
+                coordinate = Coordinate(x, y)
+                coordinate.__interned = True
+                coordinate = _interned.setdefault(key, coordinate)
+            return coordinate
+        return Coordinate(x, y)
+
+    def is_interned(self) -> bool:
+        """
+        Check if the coordinate is shared through Coordinate.of, and thus read-only.
+
+        :return: True if the coordinate is interned, False otherwise.
+        :rtype: bool
+        """
+        return self.__interned
+
+    def offset(self, dx: int, dy: int) -> "Coordinate":
+        """
+        Get the coordinate shifted by an integer pair, without building an intermediate coordinate.
+
+        :param dx: The shift on the x axis.
+        :type dx: int
+        :param dy: The shift on the y axis.
+        :type dy: int
+        :return: The shifted coordinate, interned when it is a tile coordinate.
+        :rtype: Coordinate
+        """
+        return Coordinate.of(self.__x + dx, self.__y + dy)
+
+    def to_tuple(self) -> tuple[int, int]:
+        """
+        Get the coordinate as an (x, y) pair.
+
+        :return: The (x, y) pair.
+        :rtype: tuple[int, int]
+        """
+        return self.__x, self.__y
 
     def set_x(self, x: int) -> None:
         """
@@ -19,8 +89,12 @@ class Coordinate:
 
         :param x: The new x coordinate.
         :type x: int
+        :raises ValueError: If the coordinate is interned.
         """
+        if self.__interned:
+            raise ValueError("An interned coordinate cannot be modified.")
         self.__x = x
+        self.__hash = hash((x, self.__y))
 
     def set_y(self, y: int) -> None:
         """
@@ -28,8 +102,12 @@ class Coordinate:
 
         :param y: The new y coordinate.
         :type y: int
+        :raises ValueError: If the coordinate is interned.
         """
+        if self.__interned:
+            raise ValueError("An interned coordinate cannot be modified.")
         self.__y = y
+        self.__hash = hash((self.__x, y))
 
     def get_x(self) -> int:
         """
@@ -60,9 +138,7 @@ class Coordinate:
         """
         if not isinstance(other, Coordinate):
             return None
-        return (
-            (self.get_x() - other.get_x()) ** 2 + (self.get_y() - other.get_y()) ** 2
-        ) ** 0.5
+        return ((self.__x - other.__x) ** 2 + (self.__y - other.__y) ** 2) ** 0.5
 
     def is_in_range(self, other: "Coordinate", distance_range: float) -> bool:
         """
@@ -90,7 +166,8 @@ class Coordinate:
         """
         if not isinstance(other, Coordinate):
             return False
-        return self != other and self.is_in_range(other, 2**0.5)
+        dx, dy = self.__x - other.__x, self.__y - other.__y
+        return 0 < dx * dx + dy * dy <= 2
 
     def __hash__(self) -> int:
         """
@@ -99,7 +176,7 @@ class Coordinate:
         :return: The hash value.
         :rtype: int
         """
-        return hash((self.get_x(), self.get_y()))
+        return self.__hash
 
     def __eq__(self, other: object) -> bool:
         """
@@ -110,17 +187,19 @@ class Coordinate:
         :return: True if the coordinates are equal, False otherwise.
         :rtype: bool
         """
+        if self is other:
+            return True
         if not isinstance(other, Coordinate):
             return False
-        return self.get_x() == other.get_x() and self.get_y() == other.get_y()
+        return self.__x == other.__x and self.__y == other.__y
 
     def __lt__(self, other: "Coordinate") -> bool:
         """
         Less than comparison between two coordinates. (Symbol: <)
 
         Is less than all the coordinates where the following conditions are all true:
-        - self.get_x() is less than other.get_x()
-        - self.get_y() is less than other.get_y()
+        - self.__x is less than other.__x
+        - self.__y is less than other.__y
 
         :param other: The other coordinate.
         :type other: Coordinate
@@ -129,15 +208,15 @@ class Coordinate:
         """
         if not isinstance(other, Coordinate):
             return False
-        return self.get_x() < other.get_x() and self.get_y() < other.get_y()
+        return self.__x < other.__x and self.__y < other.__y
 
     def __le__(self, other: "Coordinate") -> bool:
         """
         Less than or equal to comparison between two coordinates. (Symbol: <=)
 
         Is less than or equal to all the coordinates where the following conditions are all true:
-        - self.get_x() is less than or equal to other.get_x()
-        - self.get_y() is less than or equal to other.get_y()
+        - self.__x is less than or equal to other.__x
+        - self.__y is less than or equal to other.__y
 
         :param other: The other coordinate.
         :type other: Coordinate
@@ -146,15 +225,15 @@ class Coordinate:
         """
         if not isinstance(other, Coordinate):
             return False
-        return self.get_x() <= other.get_x() and self.get_y() <= other.get_y()
+        return self.__x <= other.__x and self.__y <= other.__y
 
     def __gt__(self, other: "Coordinate") -> bool:
         """
         Less than or equal to comparison between two coordinates. (Symbol: <=)
 
         Is less than or equal to all the coordinates where the following conditions are all true:
-        - self.get_x() is less than or equal to other.get_x()
-        - self.get_y() is less than or equal to other.get_y()
+        - self.__x is less than or equal to other.__x
+        - self.__y is less than or equal to other.__y
 
         :param other: The other coordinate.
         :type other: Coordinate
@@ -163,15 +242,15 @@ class Coordinate:
         """
         if not isinstance(other, Coordinate):
             return False
-        return self.get_x() > other.get_x() and self.get_y() > other.get_y()
+        return self.__x > other.__x and self.__y > other.__y
 
     def __ge__(self, other: "Coordinate") -> bool:
         """
         Greater than or equal to comparison between two coordinates. (Symbol: >=)
 
         Is greater than or equal to all the coordinates where the following conditions are all true:
-        - self.get_x() is greater than or equal to other.get_x()
-        - self.get_y() is greater than or equal to other.get_y()
+        - self.__x is greater than or equal to other.__x
+        - self.__y is greater than or equal to other.__y
 
         :param other: The other coordinate.
         :type other: Coordinate
@@ -180,37 +259,41 @@ class Coordinate:
         """
         if not isinstance(other, Coordinate):
             return False
-        return self.get_x() >= other.get_x() and self.get_y() >= other.get_y()
+        return self.__x >= other.__x and self.__y >= other.__y
 
     def __add__(self, other: "Coordinate") -> "Coordinate":
         """
-        Addition of a coordinate with another coordinate or an integer.
+        Addition of a coordinate with another coordinate, an integer or an (x, y) pair of integers.
 
-        :param other: The other coordinate or integer.
-        :type other: Coordinate or int
+        :param other: The other coordinate, integer or pair.
+        :type other: Coordinate or int or tuple[int, int]
         :return: The resulting coordinate.
         :rtype: Coordinate
         """
+        if isinstance(other, Coordinate):
+            return Coordinate.of(self.__x + other.__x, self.__y + other.__y)
         if isinstance(other, int):
-            return Coordinate(self.get_x() + other, self.get_y() + other)
-        if not isinstance(other, Coordinate):
-            return None
-        return Coordinate(self.get_x() + other.get_x(), self.get_y() + other.get_y())
+            return Coordinate.of(self.__x + other, self.__y + other)
+        if isinstance(other, tuple) and len(other) == 2:
+            return Coordinate.of(self.__x + other[0], self.__y + other[1])
+        return None
 
     def __sub__(self, other: "Coordinate") -> "Coordinate":
         """
-        Subtraction of a coordinate with another coordinate or an integer.
+        Subtraction of a coordinate with another coordinate, an integer or an (x, y) pair of integers.
 
-        :param other: The other coordinate or integer.
-        :type other: Coordinate or int
+        :param other: The other coordinate, integer or pair.
+        :type other: Coordinate or int or tuple[int, int]
         :return: The resulting coordinate.
         :rtype: Coordinate
         """
+        if isinstance(other, Coordinate):
+            return Coordinate.of(self.__x - other.__x, self.__y - other.__y)
         if isinstance(other, int):
-            return Coordinate(self.get_x() - other, self.get_y() - other)
-        if not isinstance(other, Coordinate):
-            return None
-        return Coordinate(self.get_x() - other.get_x(), self.get_y() - other.get_y())
+            return Coordinate.of(self.__x - other, self.__y - other)
+        if isinstance(other, tuple) and len(other) == 2:
+            return Coordinate.of(self.__x - other[0], self.__y - other[1])
+        return None
 
     def __mul__(self, other: "Coordinate") -> "Coordinate":
         """
@@ -222,10 +305,10 @@ class Coordinate:
         :rtype: Coordinate
         """
         if isinstance(other, int):
-            return Coordinate(self.get_x() * other, self.get_y() * other)
+            return Coordinate(self.__x * other, self.__y * other)
         if not isinstance(other, Coordinate):
             return None
-        return Coordinate(self.get_x() * other.get_x(), self.get_y() * other.get_y())
+        return Coordinate(self.__x * other.__x, self.__y * other.__y)
 
     def __truediv__(self, other: "Coordinate") -> "Coordinate":
         """
@@ -237,10 +320,10 @@ class Coordinate:
         :rtype: Coordinate
         """
         if isinstance(other, int):
-            return Coordinate(self.get_x() / other, self.get_y() / other)
+            return Coordinate(self.__x / other, self.__y / other)
         if not isinstance(other, Coordinate):
             return None
-        return Coordinate(self.get_x() / other.get_x(), self.get_y() / other.get_y())
+        return Coordinate(self.__x / other.__x, self.__y / other.__y)
 
     def __floordiv__(self, other: "Coordinate") -> "Coordinate":
         """
@@ -252,10 +335,10 @@ class Coordinate:
         :rtype: Coordinate
         """
         if isinstance(other, int):
-            return Coordinate(self.get_x() // other, self.get_y() // other)
+            return Coordinate(self.__x // other, self.__y // other)
         if not isinstance(other, Coordinate):
             return None
-        return Coordinate(self.get_x() // other.get_x(), self.get_y() // other.get_y())
+        return Coordinate(self.__x // other.__x, self.__y // other.__y)
 
     def __mod__(self, other: "Coordinate") -> "Coordinate":
         """
@@ -267,10 +350,10 @@ class Coordinate:
         :rtype: Coordinate
         """
         if isinstance(other, int):
-            return Coordinate(self.get_x() % other, self.get_y() % other)
+            return Coordinate(self.__x % other, self.__y % other)
         if not isinstance(other, Coordinate):
             return None
-        return Coordinate(self.get_x() % other.get_x(), self.get_y() % other.get_y())
+        return Coordinate(self.__x % other.__x, self.__y % other.__y)
 
     def __pow__(self, other: "Coordinate") -> "Coordinate":
         """
@@ -282,10 +365,10 @@ class Coordinate:
         :rtype: Coordinate
         """
         if isinstance(other, int):
-            return Coordinate(self.get_x() ** other, self.get_y() ** other)
+            return Coordinate(self.__x**other, self.__y**other)
         if not isinstance(other, Coordinate):
             return None
-        return Coordinate(self.get_x() ** other.get_x(), self.get_y() ** other.get_y())
+        return Coordinate(self.__x**other.__x, self.__y**other.__y)
 
     def __lshift__(self, other: "Coordinate") -> "Coordinate":
         """
@@ -297,10 +380,10 @@ class Coordinate:
         :rtype: Coordinate
         """
         if isinstance(other, int):
-            return Coordinate(self.get_x() << other, self.get_y() << other)
+            return Coordinate(self.__x << other, self.__y << other)
         if not isinstance(other, Coordinate):
             return None
-        return Coordinate(self.get_x() << other.get_x(), self.get_y() << other.get_y())
+        return Coordinate(self.__x << other.__x, self.__y << other.__y)
 
     def __rshift__(self, other: "Coordinate") -> "Coordinate":
         """
@@ -312,10 +395,10 @@ class Coordinate:
         :rtype: Coordinate
         """
         if isinstance(other, int):
-            return Coordinate(self.get_x() >> other, self.get_y() >> other)
+            return Coordinate(self.__x >> other, self.__y >> other)
         if not isinstance(other, Coordinate):
             return None
-        return Coordinate(self.get_x() >> other.get_x(), self.get_y() >> other.get_y())
+        return Coordinate(self.__x >> other.__x, self.__y >> other.__y)
 
     def __and__(self, other: "Coordinate") -> "Coordinate":
         """
@@ -327,10 +410,10 @@ class Coordinate:
         :rtype: Coordinate
         """
         if isinstance(other, int):
-            return Coordinate(self.get_x() & other, self.get_y() & other)
+            return Coordinate(self.__x & other, self.__y & other)
         if not isinstance(other, Coordinate):
             return None
-        return Coordinate(self.get_x() & other.get_x(), self.get_y() & other.get_y())
+        return Coordinate(self.__x & other.__x, self.__y & other.__y)
 
     def __xor__(self, other: "Coordinate") -> "Coordinate":
         """
@@ -342,10 +425,10 @@ class Coordinate:
         :rtype: Coordinate
         """
         if isinstance(other, int):
-            return Coordinate(self.get_x() ^ other, self.get_y() ^ other)
+            return Coordinate(self.__x ^ other, self.__y ^ other)
         if not isinstance(other, Coordinate):
             return None
-        return Coordinate(self.get_x() ^ other.get_x(), self.get_y() ^ other.get_y())
+        return Coordinate(self.__x ^ other.__x, self.__y ^ other.__y)
 
     def __or__(self, other: "Coordinate") -> "Coordinate":
         """
@@ -357,10 +440,10 @@ class Coordinate:
         :rtype: Coordinate
         """
         if isinstance(other, int):
-            return Coordinate(self.get_x() | other, self.get_y() | other)
+            return Coordinate(self.__x | other, self.__y | other)
         if not isinstance(other, Coordinate):
             return None
-        return Coordinate(self.get_x() | other.get_x(), self.get_y() | other.get_y())
+        return Coordinate(self.__x | other.__x, self.__y | other.__y)
 
     def __neg__(self) -> "Coordinate":
         """
@@ -369,7 +452,7 @@ class Coordinate:
         :return: The negated coordinate.
         :rtype: Coordinate
         """
-        return Coordinate(-self.get_x(), -self.get_y())
+        return Coordinate(-self.__x, -self.__y)
 
     def __pos__(self) -> "Coordinate":
         """
@@ -378,7 +461,7 @@ class Coordinate:
         :return: The positive coordinate.
         :rtype: Coordinate
         """
-        return Coordinate(+self.get_x(), +self.get_y())
+        return Coordinate(+self.__x, +self.__y)
 
     def __abs__(self) -> "Coordinate":
         """
@@ -387,7 +470,7 @@ class Coordinate:
         :return: The absolute coordinate.
         :rtype: Coordinate
         """
-        return Coordinate(abs(self.get_x()), abs(self.get_y()))
+        return Coordinate(abs(self.__x), abs(self.__y))
 
     def __invert__(self) -> "Coordinate":
         """
@@ -396,7 +479,7 @@ class Coordinate:
         :return: The inverted coordinate.
         :rtype: Coordinate
         """
-        return Coordinate(~self.get_x(), ~self.get_y())
+        return Coordinate(~self.__x, ~self.__y)
 
     def __str__(self) -> str:
         """
@@ -405,7 +488,7 @@ class Coordinate:
         :return: The string representation.
         :rtype: str
         """
-        return f"({self.get_x()},{self.get_y()})"
+        return f"({self.__x},{self.__y})"
 
     def __repr__(self) -> str:
         """
@@ -414,4 +497,27 @@ class Coordinate:
         :return: The representation.
         :rtype: str
         """
-        return f"Coordinate({self.get_x()}, {self.get_y()})"
+        return f"Coordinate({self.__x}, {self.__y})"
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle the coordinate as a call to the constructor, which is smaller than the state of its slots.
+
+        :return: The constructor and its arguments.
+        :rtype: tuple
+        """
+        return Coordinate, (self.__x, self.__y)
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore a coordinate pickled before it used slots, whose state is the dictionary of its attributes.
+
+        :param state: The attributes of the coordinate.
+        :type state: dict
+        """
+        if isinstance(state, tuple):
+            state = {**(state[0] or {}), **(state[1] or {})}
+        Coordinate.__init__(self, state["_Coordinate__x"], state["_Coordinate__y"])
+
+
+_interned: dict[int, Coordinate] = {}
@@ -0,0 +1,257 @@
+import threading
+import typing
+from collections import Counter, OrderedDict, deque
+from heapq import heappop, heappush
+
+from util.pathfinder import SQRT2, Pathfinder
+
+if typing.TYPE_CHECKING:
+    from util.map import Map
+
+"""
+This file contains the FlowField class, a distance field towards a goal shared by every unit going there,
+and the FlowFieldService class which keeps the fields of the popular goals.
+"""
+
+
+class FlowField:
+    """
+    Integration field of the distances to a goal, computed by a Dijkstra search started from the goal.
+
+    The search is resumed on demand: a query only expands it until the distances around the querying tile are final,
+    so the units close to the goal do not pay for the whole map. Any unit then reads its next step in constant time.
+    The search uses the walkability of the map when it started, while steps are only taken to tiles free right now.
+    The goal tile is always considered walkable, like the end of a path.
+    The search never leaves the square of RADIUS tiles around the goal, so its buffers do not grow with the map.
+    It is meant for the units close to the goal, which may still go around obstacles as large as the square.
+    """
+
+    EXPAND_BATCH: int = 1024
+    RADIUS: int = 128
+
+    def __init__(self, game_map: "Map", goal: tuple[int, int]) -> None:
+        """
+        Create the field of a goal. Nothing is computed until the first query.
+
+        :param game_map: The map the field is computed on.
+        :type game_map: Map
+        :param goal: The (x, y) goal tile.
+        :type goal: tuple[int, int]
+        """
+        self.__map: "Map" = game_map
+        self.__size: int = game_map.get_size()
+        self.__goal: tuple[int, int] = goal
+        # The (min_x, min_y, max_x, max_y) square of the search, bounds included
+        self.__window: tuple[int, int, int, int] = (
+            max(goal[0] - FlowField.RADIUS, 0),
+            max(goal[1] - FlowField.RADIUS, 0),
+            min(goal[0] + FlowField.RADIUS, self.__size - 1),
+            min(goal[1] + FlowField.RADIUS, self.__size - 1),
+        )
+        self.__width: int = self.__window[2] - self.__window[0] + 3
+        self.__steps: list[tuple[int, int, float]] = [
+            (dx, dy, SQRT2 if dx and dy else 1.0)
+            for dx, dy in Pathfinder.DIAGONAL_DIRECTIONS
+        ]
+        self.__offsets: list[tuple[int, float]] = [
+            (dy * self.__width + dx, cost) for dx, dy, cost in self.__steps
+        ]
+        self.__lock: threading.Lock = threading.Lock()
+        self.__reset()
+
+    def get_goal(self) -> tuple[int, int]:
+        """
+        Get the goal of the field.
+
+        :return: The (x, y) goal tile.
+        :rtype: tuple[int, int]
+        """
+        return self.__goal
+
+    def __index(self, x: int, y: int) -> int:
+        """
+        Get the index of a tile of the window in the padded buffers.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :return: The index of the tile.
+        :rtype: int
+        """
+        return (y - self.__window[1] + 1) * self.__width + x - self.__window[0] + 1
+
+    def __reset(self) -> None:
+        """
+        Restart the search from the goal. The walkability of the window is copied into a buffer padded with a blocked border,
+        so the search never needs bounds checks.
+        """
+        size, width = self.__size, self.__width
+        min_x, min_y, max_x, max_y = self.__window
+        cells = width * (max_y - min_y + 3)
+        self.__versions: list[int] = self.__map.get_chunk_versions().copy()
+        walkable = self.__map.get_walkable()
+        self.__walkable: bytearray = bytearray(cells)
+        for y in range(min_y, max_y + 1):
+            row = self.__index(min_x, y)
+            self.__walkable[row : row + width - 2] = walkable[
+                y * size + min_x : y * size + max_x + 1
+            ]
+        goal = self.__index(*self.__goal)
+        self.__walkable[goal] = 1
+        self.__distances: list[float] = [float("inf")] * cells
+        self.__distances[goal] = 0.0
+        self.__heap: list[tuple[float, int]] = [(0.0, goal)]
+
+    def __expand(self, limit: float) -> None:
+        """
+        Settle at most EXPAND_BATCH tiles whose distance is below a limit.
+
+        :param limit: The distance under which tiles are settled.
+        :type limit: float
+        """
+        heap, distances, walkable = self.__heap, self.__distances, self.__walkable
+        steps = self.__offsets
+        count = FlowField.EXPAND_BATCH
+        while heap and heap[0][0] < limit and count:
+            distance, current = heappop(heap)
+            count -= 1
+            if distance > distances[current]:
+                continue
+            for offset, cost in steps:
+                neighbour = current + offset
+                new_distance = distance + cost
+                if walkable[neighbour] and new_distance < distances[neighbour]:
+                    distances[neighbour] = new_distance
+                    heappush(heap, (new_distance, neighbour))
+
+    def __next_step(self, x: int, y: int) -> typing.Optional[tuple[int, int]]:
+        """
+        Get the free neighbour of a tile that is the closest to the goal, expanding the search as much as needed.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :return: The (x, y) next tile, None if no free neighbour gets closer to the goal.
+        :rtype: tuple[int, int]
+        """
+        size, distances = self.__size, self.__distances
+        min_x, min_y, max_x, max_y = self.__window
+        walkable = self.__map.get_walkable()
+        while True:
+            # The potential of the tile is its distance to the goal through its best neighbour, free or not
+            potential, best, best_distance = float("inf"), None, float("inf")
+            for dx, dy, cost in self.__steps:
+                nx, ny = x + dx, y + dy
+                if min_x <= nx <= max_x and min_y <= ny <= max_y:
+                    distance = distances[self.__index(nx, ny)] + cost
+                    potential = min(potential, distance)
+                    free = walkable[ny * size + nx] or (nx, ny) == self.__goal
+                    if free and distance < best_distance:
+                        best, best_distance = (nx, ny), distance
+            # A neighbour can only improve with a tile settled under potential - 1
+            if not self.__heap or self.__heap[0][0] >= potential - 1:
+                break
+            self.__expand(potential - 1)
+        if best is None or distances[self.__index(*best)] >= potential:
+            return None
+        return best
+
+    def next_step(self, x: int, y: int) -> typing.Optional[tuple[int, int]]:
+        """
+        Get the next tile to go to from a tile, in constant time once the search reached it.
+        If no step is found and the map changed since the search started, the field is recomputed once.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :return: The (x, y) next tile, None if the goal is reached or cannot be approached inside the square of the search.
+        :rtype: tuple[int, int]
+        """
+        min_x, min_y, max_x, max_y = self.__window
+        if (x, y) == self.__goal or not (
+            min_x - 1 <= x <= max_x + 1 and min_y - 1 <= y <= max_y + 1
+        ):
+            return None
+        with self.__lock:
+            step = self.__next_step(x, y)
+            if step is None and self.__versions != self.__map.get_chunk_versions():
+                self.__reset()
+                step = self.__next_step(x, y)
+            return step
+
+
+class FlowFieldService:
+    """
+    Shared flow fields of the popular goals of a map.
+
+    Every move towards a goal is recorded, and a goal becomes popular once it was requested POPULAR_REQUESTS times
+    among the last HISTORY requests. The fields are kept in an LRU of MAX_FIELDS entries.
+    """
+
+    POPULAR_REQUESTS: int = 3
+    HISTORY: int = 64
+    MAX_FIELDS: int = 8
+
+    def __init__(self, game_map: "Map") -> None:
+        """
+        Create the service of a map.
+
+        :param game_map: The map the fields are computed on.
+        :type game_map: Map
+        """
+        self.__map: "Map" = game_map
+        self.__history: deque[tuple[int, int]] = deque()
+        self.__requests: Counter[tuple[int, int]] = Counter()
+        self.__fields: OrderedDict[tuple[int, int], FlowField] = OrderedDict()
+        self.__lock: threading.Lock = threading.Lock()
+
+    def get_field_count(self) -> int:
+        """
+        Get the number of fields kept.
+
+        :return: The number of fields.
+        :rtype: int
+        """
+        return len(self.__fields)
+
+    def get_field(self, goal: tuple[int, int]) -> FlowField:
+        """
+        Get the field of a goal, creating it if needed.
+
+        :param goal: The (x, y) goal tile.
+        :type goal: tuple[int, int]
+        :return: The shared field of the goal.
+        :rtype: FlowField
+        """
+        with self.__lock:
+            field = self.__fields.get(goal)
+            if field is None:
+                field = FlowField(self.__map, goal)
+                self.__fields[goal] = field
+                if len(self.__fields) > FlowFieldService.MAX_FIELDS:
+                    self.__fields.popitem(last=False)
+            self.__fields.move_to_end(goal)
+            return field
+
+    def request(self, goal: tuple[int, int]) -> typing.Optional[FlowField]:
+        """
+        Record a move towards a goal and get the shared field of the goal if it is popular.
+
+        :param goal: The (x, y) goal tile.
+        :type goal: tuple[int, int]
+        :return: The field of the goal, None if the goal is not popular.
+        :rtype: FlowField
+        """
+        with self.__lock:
+            self.__history.append(goal)
+            self.__requests[goal] += 1
+            if len(self.__history) > FlowFieldService.HISTORY:
+                oldest = self.__history.popleft()
+                self.__requests[oldest] -= 1
+                if not self.__requests[oldest]:
+                    del self.__requests[oldest]
+            popular = self.__requests[goal] >= FlowFieldService.POPULAR_REQUESTS
+        return self.get_field(goal) if popular else None
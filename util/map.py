@@ -1,15 +1,22 @@
+import random
+import threading
 import typing
-from collections import defaultdict
-
-from pathfinding.core.diagonal_movement import DiagonalMovement
-from pathfinding.core.grid import Grid
-from pathfinding.finder.a_star import AStarFinder
+from collections import defaultdict, deque
+from itertools import accumulate, compress, islice
+from operator import add
 
 from model.buildings.farm import Farm
 from model.entity import Entity
 from model.game_object import GameObject
 from model.resources.resource import Resource
+from util.cluster_graph import ClusterGraph
 from util.coordinate import Coordinate
+from util.flow_field import FlowFieldService
+from util.path_cache import PathCache
+from util.pathfinder import Pathfinder
+from util.spatial_index import SpatialIndex
+from util.storage.grid_storage import GridStorage
+from util.storage.map_storage import MapStorage
 
 if typing.TYPE_CHECKING:
     from model.player.player import Player
@@ -22,19 +29,41 @@ It serves as the heart of the model-the representation of datas
 
 class Map:
     DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
+    CHUNK_SIZE = 16
+    HIERARCHICAL_DISTANCE = 64
+    JOURNAL_CAPACITY = 65536
     """
     The Map class is used to represent the map of the game. It contains the matrix of the map and the methods associated with it.
     """
 
-    def __init__(self, size: int):
+    def __init__(self, size: int, storage: type[MapStorage] = GridStorage):
         """
         Create a map with a certain size.
 
         :param size: The size of the map.
         :type size: int
+        :param storage: The storage backend class used to keep the tiles.
+        :type storage: type[MapStorage]
         """
         self.__size: int = size
-        self.__matrix: defaultdict[Coordinate, GameObject] = defaultdict(lambda: None)
+        self.__storage: MapStorage = storage(size)
+        self.__walkable: bytearray = bytearray(b"\x01") * (size * size)
+        self.__chunks: int = -(-size // Map.CHUNK_SIZE)
+        self.__chunk_versions: list[int] = [0] * (self.__chunks * self.__chunks)
+        self.__cluster_graph: ClusterGraph = None
+        self.__path_cache: PathCache = PathCache(Map.CHUNK_SIZE, self.__chunks)
+        self.__flow_fields: FlowFieldService = FlowFieldService(self)
+        self.__spatial_index: SpatialIndex = SpatialIndex(size, Map.CHUNK_SIZE)
+        self.__registry: dict[int, tuple[GameObject, set[tuple[int, int]]]] = {}
+        self.__integrals: dict[int, tuple[int, list[int]]] = {}
+        self.__lock: threading.RLock = threading.RLock()
+        self.__version: int = 0
+        self.__journal: deque[tuple[int, int, int, GameObject, GameObject]] = deque(
+            maxlen=Map.JOURNAL_CAPACITY
+        )
+        self.__chunk_stamps: list[int] = [0] * (self.__chunks * self.__chunks)
+        self.__snapshot: "Map" = None
+        self.__snapshot_version: int = 0
 
     def get_size(self) -> int:
         """
@@ -45,6 +74,357 @@ class Map:
         """
         return self.__size
 
+    def get_storage(self) -> MapStorage:
+        """
+        Get the storage backend holding the tiles of the map.
+
+        :return: The storage backend.
+        :rtype: MapStorage
+        """
+        return self.__storage
+
+    def get_walkable(self) -> bytearray:
+        """
+        Get the walkability grid of the map, indexed by y * size + x.
+        A tile is walkable (1) when it is empty and blocked (0) otherwise.
+        The grid is kept up to date by the map and must not be modified by the caller.
+
+        :return: The walkability grid.
+        :rtype: bytearray
+        """
+        return self.__walkable
+
+    def get_chunk_versions(self) -> list[int]:
+        """
+        Get the version counters of the chunks of the map, indexed by chunk_y * chunk_count + chunk_x.
+        A chunk is a square of CHUNK_SIZE tiles, and its counter grows every time one of its tiles becomes walkable or blocked.
+
+        :return: The version counters of the chunks.
+        :rtype: list[int]
+        """
+        return self.__chunk_versions
+
+    def get_path_cache(self) -> PathCache:
+        """
+        Get the cache of the paths found on the map, with its hit and miss counters.
+
+        :return: The path cache.
+        :rtype: PathCache
+        """
+        return self.__path_cache
+
+    def get_flow_fields(self) -> FlowFieldService:
+        """
+        Get the service keeping the flow fields of the popular destinations of the map.
+
+        :return: The flow field service.
+        :rtype: FlowFieldService
+        """
+        return self.__flow_fields
+
+    def get_spatial_index(self) -> SpatialIndex:
+        """
+        Get the spatial index of the resources, buildings and units of the map.
+
+        :return: The spatial index.
+        :rtype: SpatialIndex
+        """
+        return self.__spatial_index
+
+    def reindex(self, object: GameObject) -> None:
+        """
+        Index the tiles of an object again, after a change of its category such as a new owner.
+
+        :param object: The game object on the map.
+        :type object: GameObject
+        """
+        with self.__lock:
+            coordinate = object.get_coordinate()
+            if coordinate is None:
+                return
+            for x in range(coordinate.get_x(), coordinate.get_x() + object.get_size()):
+                for y in range(
+                    coordinate.get_y(), coordinate.get_y() + object.get_size()
+                ):
+                    if self.get_xy(x, y) is object:
+                        self.__spatial_index.add(x, y, object)
+                        self.__record(x, y, object, object)
+
+    def get_chunk_count(self) -> int:
+        """
+        Get the number of chunks on each side of the map.
+
+        :return: The number of chunks per side.
+        :rtype: int
+        """
+        return self.__chunks
+
+    def __set_tile(self, x: int, y: int, object: GameObject) -> None:
+        """
+        Store an object on a tile and update the walkability grid, the spatial index and the id registry accordingly.
+        The change is recorded in the journal.
+        The version of the chunk is only bumped when the walkability of the tile changes.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :param object: The game object to store, or None to empty the tile.
+        :type object: GameObject
+        """
+        previous = self.__storage.get(x, y)
+        if previous is not object:
+            if previous is not None:
+                self.__unregister(x, y, previous)
+            if object is not None:
+                self.__register(x, y, object)
+        if object is None:
+            self.__spatial_index.remove(x, y)
+        else:
+            self.__spatial_index.add(x, y, object)
+        self.__storage.set(x, y, object)
+        self.__record(x, y, previous, object)
+        index = y * self.__size + x
+        walkable = object is None
+        if self.__walkable[index] != walkable:
+            self.__walkable[index] = walkable
+            self.__chunk_versions[
+                (y // Map.CHUNK_SIZE) * self.__chunks + x // Map.CHUNK_SIZE
+            ] += 1
+
+    def __record(self, x: int, y: int, old: GameObject, new: GameObject) -> None:
+        """
+        Record a change of a tile in the journal under a new version, and stamp its chunk with it.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :param old: The game object on the tile before the change, or None.
+        :type old: GameObject
+        :param new: The game object on the tile after the change, or None.
+        :type new: GameObject
+        """
+        self.__version += 1
+        self.__journal.append((self.__version, x, y, old, new))
+        self.__chunk_stamps[
+            (y // Map.CHUNK_SIZE) * self.__chunks + x // Map.CHUNK_SIZE
+        ] = self.__version
+
+    def get_version(self) -> int:
+        """
+        Get the version of the map, increased by every change of a tile.
+
+        :return: The version of the map.
+        :rtype: int
+        """
+        return self.__version
+
+    def changes_since(
+        self, version: int
+    ) -> typing.Optional[list[tuple[int, Coordinate, GameObject, GameObject]]]:
+        """
+        Get the changes of the tiles made after a version, oldest first.
+        The journal only keeps the last JOURNAL_CAPACITY changes: a consumer further behind has to resynchronise from the whole map.
+        A change whose old and new objects are the same is an object indexed again, such as a new owner.
+
+        :param version: The version the consumer is up to date with.
+        :type version: int
+        :return: The (version, coordinate, old, new) changes, None if some of them are no longer in the journal.
+        :rtype: list[tuple[int, Coordinate, GameObject, GameObject]]
+        """
+        with self.__lock:
+            if version >= self.__version:
+                return []
+            if not self.__journal or self.__journal[0][0] > version + 1:
+                return None
+            start = version + 1 - self.__journal[0][0]
+            return [
+                (change, Coordinate.of(x, y), old, new)
+                for change, x, y, old, new in islice(self.__journal, start, None)
+            ]
+
+    def get_dirty_chunks(self, version: int) -> list[int]:
+        """
+        Get the chunks where a tile changed after a version.
+
+        :param version: The version the consumer is up to date with.
+        :type version: int
+        :return: The indices (chunk_y * chunk_count + chunk_x) of the changed chunks.
+        :rtype: list[int]
+        """
+        return [
+            index for index, stamp in enumerate(self.__chunk_stamps) if stamp > version
+        ]
+
+    def is_dirty(
+        self, version: int, from_coord: Coordinate, to_coord: Coordinate
+    ) -> bool:
+        """
+        Check if a tile may have changed in a rectangle after a version, at the granularity of the chunks.
+
+        :param version: The version the consumer is up to date with.
+        :type version: int
+        :param from_coord: The top left coordinate of the rectangle.
+        :type from_coord: Coordinate
+        :param to_coord: The bottom right coordinate of the rectangle, included.
+        :type to_coord: Coordinate
+        :return: True if a chunk overlapping the rectangle changed, False otherwise.
+        :rtype: bool
+        """
+        last = self.__chunks - 1
+        from_x = min(max(from_coord.get_x() // Map.CHUNK_SIZE, 0), last)
+        from_y = min(max(from_coord.get_y() // Map.CHUNK_SIZE, 0), last)
+        to_x = min(max(to_coord.get_x() // Map.CHUNK_SIZE, 0), last)
+        to_y = min(max(to_coord.get_y() // Map.CHUNK_SIZE, 0), last)
+        for chunk_y in range(from_y, to_y + 1):
+            row = chunk_y * self.__chunks
+            if max(self.__chunk_stamps[row + from_x : row + to_x + 1]) > version:
+                return True
+        return False
+
+    def __register(self, x: int, y: int, object: GameObject) -> None:
+        """
+        Record a tile in the footprint of an object in the id registry. Objects without an id are not registered.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :param object: The game object on the tile.
+        :type object: GameObject
+        """
+        id = object.get_id()
+        if id is None:
+            return
+        entry = self.__registry.get(id)
+        if entry is None or entry[0] is not object:
+            entry = (object, set())
+            self.__registry[id] = entry
+        entry[1].add((x, y))
+
+    def __unregister(self, x: int, y: int, object: GameObject) -> None:
+        """
+        Remove a tile from the footprint of an object in the id registry, and the object once its footprint is empty.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :param object: The game object leaving the tile.
+        :type object: GameObject
+        """
+        id = object.get_id()
+        entry = self.__registry.get(id)
+        if entry is None or entry[0] is not object:
+            return
+        entry[1].discard((x, y))
+        if not entry[1]:
+            del self.__registry[id]
+
+    def __build_registry(self) -> None:
+        """
+        Rebuild the id registry from the storage.
+        """
+        self.__registry = {}
+        for x, y, obj in self.__storage.items():
+            self.__register(x, y, obj)
+
+    def __build_walkable(self) -> None:
+        """
+        Rebuild the walkability grid from the storage.
+        """
+        self.__walkable = bytearray(b"\x01") * (self.__size * self.__size)
+        for x, y, _ in self.__storage.items():
+            self.__walkable[y * self.__size + x] = 0
+
+    def __get_integral(self, chunk_x: int, chunk_y: int) -> list[int]:
+        """
+        Get the summed-area table of the walkable tiles of a chunk, built on its first query and rebuilt when its version changed.
+        The entry (y * (CHUNK_SIZE + 1) + x) is the number of walkable tiles of the chunk in the rectangle from its top left tile
+        to (x - 1, y - 1). Only the chunks queried so far have a table.
+
+        :param chunk_x: The x coordinate of the chunk.
+        :type chunk_x: int
+        :param chunk_y: The y coordinate of the chunk.
+        :type chunk_y: int
+        :return: The summed-area table of the chunk.
+        :rtype: list[int]
+        """
+        chunk = chunk_y * self.__chunks + chunk_x
+        version = self.__chunk_versions[chunk]
+        entry = self.__integrals.get(chunk)
+        if entry is None or entry[0] != version:
+            size, side = self.__size, Map.CHUNK_SIZE
+            x0, y0 = chunk_x * side, chunk_y * side
+            x1 = min(x0 + side, size)
+            row = [0] * (side + 1)
+            integral = row.copy()
+            for y in range(y0, min(y0 + side, size)):
+                line = [0, *accumulate(self.__walkable[y * size + x0 : y * size + x1])]
+                # The columns past the edge of the map add no walkable tile
+                line.extend([line[-1]] * (side + 1 - len(line)))
+                row = list(map(add, row, line))
+                integral.extend(row)
+            entry = self.__integrals[chunk] = (version, integral)
+        return entry[1]
+
+    def is_empty_zone(self, x: int, y: int, size: int) -> bool:
+        """
+        Check in constant time if a square of tiles is inside the map and empty.
+
+        :param x: The x coordinate of the top left tile.
+        :type x: int
+        :param y: The y coordinate of the top left tile.
+        :type y: int
+        :param size: The size of the square.
+        :type size: int
+        :return: True if every tile of the square is empty, False otherwise.
+        :rtype: bool
+        """
+        return self.__is_empty(x, y, size)
+
+    def __is_empty(self, x: int, y: int, size: int) -> bool:
+        """
+        Check if a square of tiles is inside the map and empty with the summed-area tables of the chunks it covers.
+
+        :param x: The x coordinate of the top left tile.
+        :type x: int
+        :param y: The y coordinate of the top left tile.
+        :type y: int
+        :param size: The size of the square.
+        :type size: int
+        :return: True if every tile of the square is empty, False otherwise.
+        :rtype: bool
+        """
+        if x < 0 or y < 0 or x + size > self.__size or y + size > self.__size:
+            return False
+        side, width = Map.CHUNK_SIZE, Map.CHUNK_SIZE + 1
+        for chunk_y in range(y // side, (y + size - 1) // side + 1):
+            top = max(y - chunk_y * side, 0)
+            bottom = min(y + size - chunk_y * side, side)
+            for chunk_x in range(x // side, (x + size - 1) // side + 1):
+                left = max(x - chunk_x * side, 0)
+                right = min(x + size - chunk_x * side, side)
+                integral = self.__get_integral(chunk_x, chunk_y)
+                free = (
+                    integral[bottom * width + right]
+                    - integral[bottom * width + left]
+                    - integral[top * width + right]
+                    + integral[top * width + left]
+                )
+                if free != (bottom - top) * (right - left):
+                    return False
+        return True
+
+    def __build_spatial_index(self) -> None:
+        """
+        Rebuild the spatial index from the storage.
+        """
+        self.__spatial_index = SpatialIndex(self.__size, Map.CHUNK_SIZE)
+        for x, y, obj in self.__storage.items():
+            self.__spatial_index.add(x, y, obj)
+
     def check_placement(self, object: GameObject, coordinate: Coordinate) -> bool:
         """
         Check if an entity can be placed at a certain coordinate.
@@ -56,18 +436,15 @@ class Map:
         :return: True if the object can be placed, False otherwise.
         :rtype: bool
         """
-        for x in range(object.get_size()):
-            for y in range(object.get_size()):
-                if coordinate is None or not (
-                    Coordinate(0, 0) <= coordinate
-                    and (coordinate + object.get_size() - 1)
-                    <= Coordinate(self.get_size() - 1, self.get_size() - 1)
-                ):
-                    return False
-                if (
-                    self.get(Coordinate(coordinate.get_x() + x, coordinate.get_y() + y))
-                    is not None
-                ):
+        if coordinate is None:
+            return False
+        x0, y0, size = coordinate.get_x(), coordinate.get_y(), object.get_size()
+        if x0 < 0 or y0 < 0 or x0 + size > self.__size or y0 + size > self.__size:
+            return False
+        get = self.__storage.get
+        for x in range(x0, x0 + size):
+            for y in range(y0, y0 + size):
+                if get(x, y) is not None:
                     return False
         return True
 
@@ -81,15 +458,55 @@ class Map:
         :type coordinate: Coordinate
         :raises ValueError: If the object cannot be placed at the given coordinate.
         """
-        if not self.check_placement(object, coordinate):
-            raise ValueError(
-                f"Cannot place object at the given coordinate {coordinate}."
-            )
-        for x in range(object.get_size()):
-            for y in range(object.get_size()):
-                self.__matrix[
-                    Coordinate(coordinate.get_x() + x, coordinate.get_y() + y)
-                ] = object
+        with self.__lock:
+            if not self.check_placement(object, coordinate):
+                raise ValueError(
+                    f"Cannot place object at the given coordinate {coordinate}."
+                )
+            x0, y0, size = coordinate.get_x(), coordinate.get_y(), object.get_size()
+            for x in range(x0, x0 + size):
+                for y in range(y0, y0 + size):
+                    self.__set_tile(x, y, object)
+
+    def bulk_place(
+        self,
+        factory: typing.Callable[[], GameObject],
+        count: int,
+        rng: random.Random = None,
+    ) -> list[Coordinate]:
+        """
+        Place many objects of size 1 on distinct empty tiles picked at random, in one pass.
+        The tiles are sampled without replacement from the empty tiles, so the cost does not depend on how full the map is.
+
+        :param factory: A function returning the object to place on each tile, which may return the same object every time.
+        :type factory: Callable[[], GameObject]
+        :param count: The number of objects to place.
+        :type count: int
+        :param rng: The random generator, the random module if None.
+        :type rng: random.Random
+        :return: The coordinates of the tiles, in the order the objects were placed.
+        :rtype: list[Coordinate]
+        :raises ValueError: If there are not enough empty tiles or the objects are larger than 1.
+        """
+        rng = random if rng is None else rng
+        size = self.__size
+        with self.__lock:
+            free = list(compress(range(size * size), self.__walkable))
+            if count > len(free):
+                raise ValueError(
+                    f"Cannot place {count} objects on {len(free)} empty tiles."
+                )
+            coordinates = []
+            for index in rng.sample(free, count):
+                object = factory()
+                if object.get_size() != 1:
+                    raise ValueError("Only objects of size 1 can be placed in bulk.")
+                y, x = divmod(index, size)
+                coordinate = Coordinate.of(x, y)
+                self.__set_tile(x, y, object)
+                object.set_coordinate(coordinate)
+                coordinates.append(coordinate)
+            return coordinates
 
     def __force_add(self, object: GameObject, coordinate: Coordinate):
         """
@@ -100,7 +517,7 @@ class Map:
         :param coordinate: The coordinate where the object is to be added.
         :type coordinate: Coordinate
         """
-        self.__matrix[coordinate] = object
+        self.__set_tile(coordinate.get_x(), coordinate.get_y(), object)
 
     def remove(self, coordinate: Coordinate) -> GameObject:
         """
@@ -112,21 +529,17 @@ class Map:
         :rtype: GameObject
         :raises ValueError: If the coordinate is out of bounds or there is no entity at the given coordinate.
         """
-        if not (
-            Coordinate(0, 0)
-            <= coordinate
-            <= Coordinate(self.get_size(), self.get_size())
-        ):
-            raise ValueError(f"Coordinate is out of bounds.{coordinate}")
-        object: GameObject = self.__matrix[coordinate]
-        if object is None:
-            raise ValueError(f"No entity at the given coordinate.{coordinate}")
-        for x in range(object.get_size()):
-            for y in range(object.get_size()):
-                self.__matrix[
-                    Coordinate(coordinate.get_x() + x, coordinate.get_y() + y)
-                ] = None
-        return object
+        with self.__lock:
+            if not self.is_inside(coordinate):
+                raise ValueError(f"Coordinate is out of bounds.{coordinate}")
+            x0, y0 = coordinate.get_x(), coordinate.get_y()
+            object: GameObject = self.__storage.get(x0, y0)
+            if object is None:
+                raise ValueError(f"No entity at the given coordinate.{coordinate}")
+            for x in range(x0, min(x0 + object.get_size(), self.__size)):
+                for y in range(y0, min(y0 + object.get_size(), self.__size)):
+                    self.__set_tile(x, y, None)
+            return object
 
     def __force_remove(self, coordinate: Coordinate) -> GameObject:
         """
@@ -137,8 +550,10 @@ class Map:
         :return: The removed game object.
         :rtype: GameObject
         """
-        object: GameObject = self.__matrix[coordinate]
-        self.__matrix[coordinate] = None
+        if not self.is_inside(coordinate):
+            return None
+        object: GameObject = self.__storage.get(coordinate.get_x(), coordinate.get_y())
+        self.__set_tile(coordinate.get_x(), coordinate.get_y(), None)
         return object
 
     def move(self, object: GameObject, new_coordinate: Coordinate):
@@ -151,15 +566,66 @@ class Map:
         :type new_coordinate: Coordinate
         :raises ValueError: If the new coordinate is not adjacent or not available.
         """
-        if not object.get_coordinate().is_adjacent(new_coordinate):
-            raise ValueError(
-                f"New coordinate {new_coordinate} is not adjacent to the entity's current coordinate { object.get_coordinate()}."
-            )
-        if not self.check_placement(object, new_coordinate):
-            raise ValueError("New coordinate is not available.")
-        if self.get(object.get_coordinate()):
-            self.remove(object.get_coordinate())
-        self.add(object, new_coordinate)
+        if object.get_size() == 1:
+            self.step(object, new_coordinate)
+            return
+        with self.__lock:
+            if not object.get_coordinate().is_adjacent(new_coordinate):
+                raise ValueError(
+                    f"New coordinate {new_coordinate} is not adjacent to the entity's current coordinate { object.get_coordinate()}."
+                )
+            if not self.check_placement(object, new_coordinate):
+                raise ValueError("New coordinate is not available.")
+            if self.get(object.get_coordinate()):
+                self.remove(object.get_coordinate())
+            self.add(object, new_coordinate)
+
+    def step(self, object: GameObject, new_coordinate: Coordinate):
+        """
+        Move an entity of size 1 to a new adjacent coordinate (8 surrounding coordinates).
+        The move is checked with integer maths on the walkability grid, then the two tiles are swapped in place:
+        the storage, the spatial index, the id registry and the journal are updated without going through remove and add.
+
+        :param object: The game object of size 1 to be moved.
+        :type object: GameObject
+        :param new_coordinate: The new coordinate where the object is to be moved.
+        :type new_coordinate: Coordinate
+        :raises ValueError: If the new coordinate is not adjacent or not available.
+        """
+        x1, y1 = new_coordinate.get_x(), new_coordinate.get_y()
+        size = self.__size
+        with self.__lock:
+            coordinate = object.get_coordinate()
+            x0, y0 = coordinate.get_x(), coordinate.get_y()
+            dx, dy = x1 - x0, y1 - y0
+            if not (-1 <= dx <= 1 and -1 <= dy <= 1) or dx == dy == 0:
+                raise ValueError(
+                    f"New coordinate {new_coordinate} is not adjacent to the entity's current coordinate {coordinate}."
+                )
+            new_index = y1 * size + x1
+            if (
+                not (0 <= x1 < size and 0 <= y1 < size)
+                or not self.__walkable[new_index]
+            ):
+                raise ValueError("New coordinate is not available.")
+            if self.__storage.get(x0, y0) is not object:
+                # The entity is not on its tile, it is only placed on the new one
+                self.__set_tile(x1, y1, object)
+                return
+            self.__storage.set(x0, y0, None)
+            self.__storage.set(x1, y1, object)
+            self.__spatial_index.move(x0, y0, x1, y1)
+            entry = self.__registry.get(object.get_id())
+            if entry is not None and entry[0] is object:
+                entry[1].discard((x0, y0))
+                entry[1].add((x1, y1))
+            self.__record(x0, y0, object, None)
+            self.__record(x1, y1, None, object)
+            self.__walkable[y0 * size + x0] = True
+            self.__walkable[new_index] = False
+            chunks, chunk_versions = self.__chunks, self.__chunk_versions
+            chunk_versions[(y0 // Map.CHUNK_SIZE) * chunks + x0 // Map.CHUNK_SIZE] += 1
+            chunk_versions[(y1 // Map.CHUNK_SIZE) * chunks + x1 // Map.CHUNK_SIZE] += 1
 
     def force_move(self, object: GameObject, new_coordinate: Coordinate):
         """
@@ -170,8 +636,24 @@ class Map:
         :param new_coordinate: The new coordinate where the object is to be moved.
         :type new_coordinate: Coordinate
         """
-        self.__force_remove(object.get_coordinate())
-        self.__force_add(object, new_coordinate)
+        with self.__lock:
+            self.__force_remove(object.get_coordinate())
+            self.__force_add(object, new_coordinate)
+
+    def is_inside(self, coordinate: Coordinate) -> bool:
+        """
+        Check if a coordinate is inside the map.
+
+        :param coordinate: The coordinate to check.
+        :type coordinate: Coordinate
+        :return: True if the coordinate is inside the map, False otherwise.
+        :rtype: bool
+        """
+        return (
+            coordinate is not None
+            and 0 <= coordinate.get_x() < self.__size
+            and 0 <= coordinate.get_y() < self.__size
+        )
 
     def get(self, coordinate: Coordinate) -> GameObject:
         """
@@ -179,10 +661,27 @@ class Map:
 
         :param coordinate: The coordinate from which the object is to be retrieved.
         :type coordinate: Coordinate
-        :return: The game object at the given coordinate.
+        :return: The game object at the given coordinate, None if the tile is empty or outside the map.
+        :rtype: GameObject
+        """
+        if coordinate is None:
+            return None
+        return self.get_xy(coordinate.get_x(), coordinate.get_y())
+
+    def get_xy(self, x: int, y: int) -> GameObject:
+        """
+        Get the entity on a tile given by its integer coordinates, without building a Coordinate.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :return: The game object on the tile, None if the tile is empty or outside the map.
         :rtype: GameObject
         """
-        return self.__matrix[coordinate]
+        if 0 <= x < self.__size and 0 <= y < self.__size:
+            return self.__storage.get(x, y)
+        return None
 
     def get_object_id(self, id: int) -> GameObject:
         """
@@ -190,13 +689,27 @@ class Map:
 
         :param id: The id of the object to be retrieved.
         :type id: int
-        :return: The game object with the given id.
+        :return: The game object with the given id, None if no object on the map has this id.
         :rtype: GameObject
         """
-        for obj in self.__matrix.values():
-            if obj is not None and obj.get_id() == id:
-                return obj
-        return None
+        entry = self.__registry.get(id)
+        return None if entry is None else entry[0]
+
+    def get_footprint(self, id: int) -> list[Coordinate]:
+        """
+        Get the tiles occupied by the object with a certain id.
+
+        :param id: The id of the object.
+        :type id: int
+        :return: The coordinates of the tiles of the object, sorted by row, empty if no object on the map has this id.
+        :rtype: list[Coordinate]
+        """
+        entry = self.__registry.get(id)
+        if entry is None:
+            return []
+        return [
+            Coordinate(x, y) for x, y in sorted(entry[1], key=lambda t: (t[1], t[0]))
+        ]
 
     def get_map(self) -> defaultdict[Coordinate, GameObject]:
         """
@@ -205,7 +718,10 @@ class Map:
         :return: The map as a matrix.
         :rtype: defaultdict[Coordinate, GameObject]
         """
-        return self.__matrix
+        matrix = defaultdict(lambda: None)
+        for x, y, obj in self.__storage.items():
+            matrix[Coordinate(x, y)] = obj
+        return matrix
 
     def get_map_list(self) -> list[list[GameObject]]:
         """
@@ -214,10 +730,11 @@ class Map:
         :return: The map as a list of lists.
         :rtype: list[list[GameObject]]
         """
-        return [
-            [self.__matrix[Coordinate(i, j)] for j in range(self.get_size())]
-            for i in range(self.get_size())
-        ]
+        size = self.get_size()
+        result = [[None] * size for _ in range(size)]
+        for x, y, obj in self.__storage.items():
+            result[x][y] = obj
+        return result
 
     def get_from_to(self, from_coord: Coordinate, to_coord: Coordinate) -> "Map":
         """
@@ -230,17 +747,18 @@ class Map:
         :return: A new map from the starting coordinate to the ending coordinate.
         :rtype: Map
         """
-        new_size = max(
-            to_coord.get_x() - from_coord.get_x(), to_coord.get_y() - from_coord.get_y()
+        new_size = (
+            max(
+                to_coord.get_x() - from_coord.get_x(),
+                to_coord.get_y() - from_coord.get_y(),
+            )
+            + 1
         )
         new_map = Map(new_size)
-        for x in range(from_coord.get_x(), to_coord.get_x() + 1):
-            for y in range(from_coord.get_y(), to_coord.get_y() + 1):
-                obj = self.get(Coordinate(x, y))
-                if obj is not None:
-                    new_map.__force_add(
-                        obj, Coordinate(x - from_coord.get_x(), y - from_coord.get_y())
-                    )
+        for x, y, obj in self.__storage.items_in(
+            from_coord.get_x(), from_coord.get_y(), to_coord.get_x(), to_coord.get_y()
+        ):
+            new_map.__set_tile(x - from_coord.get_x(), y - from_coord.get_y(), obj)
         return new_map
 
     def get_map_from_to(
@@ -257,11 +775,10 @@ class Map:
         :rtype: defaultdict[Coordinate, GameObject]
         """
         result = defaultdict(lambda: None)
-        for x in range(from_coord.get_x(), to_coord.get_x() + 1):
-            for y in range(from_coord.get_y(), to_coord.get_y() + 1):
-                obj = self.get(Coordinate(x, y))
-                if obj is not None:
-                    result[Coordinate(x, y)] = obj
+        for x, y, obj in self.__storage.items_in(
+            from_coord.get_x(), from_coord.get_y(), to_coord.get_x(), to_coord.get_y()
+        ):
+            result[Coordinate(x, y)] = obj
         return result
 
     def get_map_list_from_to(
@@ -278,10 +795,11 @@ class Map:
         :rtype: list[list[GameObject]]
         """
         size = self.get_size()
-        result = [[None for _ in range(size)] for _ in range(size)]
-        for x in range(from_coord.get_x(), to_coord.get_x() + 1):
-            for y in range(from_coord.get_y(), to_coord.get_y() + 1):
-                result[x][y] = self.get(Coordinate(x, y))
+        result = [[None] * size for _ in range(size)]
+        for x, y, obj in self.__storage.items_in(
+            from_coord.get_x(), from_coord.get_y(), to_coord.get_x(), to_coord.get_y()
+        ):
+            result[x][y] = obj
         return result
 
     def tabler_str(self) -> str:
@@ -299,7 +817,7 @@ class Map:
         for y in range(self.get_size()):
             row = []
             for x in range(self.get_size()):
-                object = self.get(Coordinate(x, y))
+                object = self.get_xy(x, y)
                 row.append(f" {object.get_letter() if object is not None else ' '} ")
             rows.append("│" + "│".join(row) + "│")
             if x < self.get_size() - 1:
@@ -318,7 +836,7 @@ class Map:
         for y in range(self.get_size()):
             row = []
             for x in range(self.get_size()):
-                obj = self.get(Coordinate(x, y))
+                obj = self.get_xy(x, y)
                 row.append(obj.get_letter() if obj else "·")
             rows.append("".join(row))
         return "\n".join(rows)
@@ -334,11 +852,54 @@ class Map:
         for y in range(self.get_size()):
             row = []
             for x in range(self.get_size()):
-                obj = self.get(Coordinate(x, y))
+                obj = self.get_xy(x, y)
                 row.append(obj.get_letter() if obj else "·")
             rows.append("".join(row))
         return "\n".join(rows)
 
+    def __find_path(
+        self,
+        start: Coordinate,
+        end: Coordinate,
+        diagonal: bool = True,
+        avoid_from: Coordinate = None,
+        avoid_to: Coordinate = None,
+    ) -> list[Coordinate]:
+        """
+        Run the pathfinder on the walkability grid of the map.
+
+        :param start: The starting coordinate.
+        :type start: Coordinate
+        :param end: The ending coordinate.
+        :type end: Coordinate
+        :param diagonal: Whether diagonal moves are allowed.
+        :type diagonal: bool
+        :param avoid_from: The starting coordinate of the area to avoid, if any.
+        :type avoid_from: Coordinate
+        :param avoid_to: The ending coordinate of the area to avoid, if any.
+        :type avoid_to: Coordinate
+        :return: A list of coordinates representing the path from start to end, start excluded.
+        :rtype: list[Coordinate]
+        """
+        avoid = None
+        if avoid_from is not None and avoid_to is not None:
+            avoid = (
+                avoid_from.get_x(),
+                avoid_from.get_y(),
+                avoid_to.get_x(),
+                avoid_to.get_y(),
+            )
+        source, target = (start.get_x(), start.get_y()), (end.get_x(), end.get_y())
+        key = (source, target, "diagonal" if diagonal else "straight", avoid)
+        path = self.__path_cache.get(key, self.__chunk_versions)
+        if path is None:
+            versions = self.__chunk_versions.copy()
+            path = Pathfinder.get_instance(self.__size).find_path(
+                self.__walkable, source, target, diagonal, avoid
+            )
+            self.__path_cache.put(key, path, versions)
+        return [Coordinate.of(x, y) for x, y in path[1:]]
+
     def path_finding(self, start: Coordinate, end: Coordinate) -> list[Coordinate]:
         """
         Find the path for a unit to go from start to end.
@@ -350,26 +911,32 @@ class Map:
         :return: A list of coordinates representing the path from start to end.
         :rtype: list[Coordinate]
         """
-        m = [
-            [
-                (
-                    1
-                    if self.get(Coordinate(x, y)) is None
-                    or Coordinate(x, y) == start
-                    or Coordinate(x, y) == end
-                    else 0
-                )
-                for x in range(self.get_size())
-            ]
-            for y in range(self.get_size())
-        ]
-        grid = Grid(matrix=m)
-        start_node = grid.node(start.get_x(), start.get_y())
-        end_node = grid.node(end.get_x(), end.get_y())
-        finder = AStarFinder(diagonal_movement=DiagonalMovement.always)
-        path, _ = finder.find_path(start_node, end_node, grid)
+        return self.__find_path(start, end)
+
+    def path_finding_hierarchical(
+        self, start: Coordinate, end: Coordinate
+    ) -> list[Coordinate]:
+        """
+        Find the path for a unit to go from start to end using the hierarchical pathfinding (HPA*).
+        It is meant for long distances on large maps: the path is near optimal, but much cheaper to find.
 
-        return [Coordinate(x, y) for x, y in path[1:]]
+        :param start: The starting coordinate.
+        :type start: Coordinate
+        :param end: The ending coordinate.
+        :type end: Coordinate
+        :return: A list of coordinates representing the path from start to end.
+        :rtype: list[Coordinate]
+        """
+        source, target = (start.get_x(), start.get_y()), (end.get_x(), end.get_y())
+        key = (source, target, "hierarchical", None)
+        path = self.__path_cache.get(key, self.__chunk_versions)
+        if path is None:
+            if self.__cluster_graph is None:
+                self.__cluster_graph = ClusterGraph(self)
+            versions = self.__chunk_versions.copy()
+            path = self.__cluster_graph.find_path(source, target)
+            self.__path_cache.put(key, path, versions)
+        return [Coordinate.of(x, y) for x, y in path[1:]]
 
     def path_finding_avoid(
         self,
@@ -392,35 +959,7 @@ class Map:
         :return: A list of coordinates representing the path from start to end while avoiding the specified area.
         :rtype: list[Coordinate]
         """
-
-        matrix = [
-            [
-                (
-                    1
-                    if self.get(Coordinate(x, y)) is None
-                    or Coordinate(x, y) == start
-                    or Coordinate(x, y) == end
-                    else 0
-                )
-                for x in range(self.get_size())
-            ]
-            for y in range(self.get_size())
-        ]
-
-        # Mark the avoid area as non-walkable
-        for x in range(avoid_from.get_x(), avoid_to.get_x() + 1):
-            for y in range(avoid_from.get_y(), avoid_to.get_y() + 1):
-                if 0 <= x < self.get_size() and 0 <= y < self.get_size():
-                    matrix[y][x] = 0
-        matrix[end.get_y()][end.get_x()] = 1
-
-        grid = Grid(matrix=matrix)
-        start_node = grid.node(start.get_x(), start.get_y())
-        end_node = grid.node(end.get_x(), end.get_y())
-        finder = AStarFinder(diagonal_movement=DiagonalMovement.always)
-        path, _ = finder.find_path(start_node, end_node, grid)
-
-        return [Coordinate(x, y) for x, y in path[1:]]
+        return self.__find_path(start, end, True, avoid_from, avoid_to)
 
     def path_finding_non_diagonal(
         self, start: Coordinate, end: Coordinate
@@ -435,122 +974,94 @@ class Map:
         :return: A list of coordinates representing the path from start to end without diagonal movement.
         :rtype: list[Coordinate]
         """
-        m = [
-            [
-                (
-                    1
-                    if self.get(Coordinate(x, y)) is None
-                    or Coordinate(x, y) == start
-                    or Coordinate(x, y) == end
-                    else 0
-                )
-                for x in range(self.get_size())
-            ]
-            for y in range(self.get_size())
-        ]
-        grid = Grid(matrix=m)
-        start_node = grid.node(start.get_x(), start.get_y())
-        end_node = grid.node(end.get_x(), end.get_y())
-        finder = AStarFinder(diagonal_movement=DiagonalMovement.never)
-        path, _ = finder.find_path(start_node, end_node, grid)
-
-        return [Coordinate(x, y) for x, y in path[1:]]
+        return self.__find_path(start, end, False)
 
     def find_nearest_empty_zones(
-        self, coordinate: Coordinate, size: int
+        self, coordinate: Coordinate, size: int, count: int = None
     ) -> list[Coordinate]:
         """
         Find the nearest empty zone to a given coordinate.
+        Squares of size + 1 tiles are looked for ring by ring, and the zones found never overlap each other.
 
         :param coordinate: The starting coordinate.
         :type coordinate: Coordinate
         :param size: The size of the zone.
         :type size: int
+        :param count: The maximum number of zones, None to look over the whole map.
+        :type count: int
         :return: The nearest empty coordinate.
         :rtype: list[Coordinate]
         """
-        map = self.capture()
+        map_size = self.__size
         zone_list = []
-        radius = 1
         size += 1
-        size_checker = GameObject("", "", 1)
-        size_checker.set_size(size)
-        while radius < map.get_size():
-            for x in range(
-                coordinate.get_x() - radius, coordinate.get_x() + radius + 1
-            ):
-                if map.check_placement(
-                    size_checker, Coordinate(x, coordinate.get_y() - radius)
-                ):
-                    current = Coordinate(x, coordinate.get_y() - radius)
-                    zone_list.append(current + 1)
-                    map.add(size_checker, current)
-                if map.check_placement(
-                    size_checker, Coordinate(x, coordinate.get_y() + radius)
-                ):
-                    current = Coordinate(x, coordinate.get_y() + radius)
-                    zone_list.append(current + 1)
-                    map.add(size_checker, current)
+        # Scratch bitmap of the corners whose square would overlap a zone already found
+        claimed = bytearray(map_size * map_size)
+        cx, cy = coordinate.get_x(), coordinate.get_y()
+
+        def claim(x: int, y: int) -> None:
+            if count is not None and len(zone_list) >= count:
+                return
+            if not self.__is_empty(x, y, size) or claimed[y * map_size + x]:
+                return
+            x0, x1 = max(x - size + 1, 0), min(x + size, map_size)
+            for row in range(max(y - size + 1, 0), min(y + size, map_size)):
+                claimed[row * map_size + x0 : row * map_size + x1] = b"\x01" * (x1 - x0)
+            zone_list.append(Coordinate.of(x + 1, y + 1))
 
-            for y in range(
-                coordinate.get_y() - radius, coordinate.get_y() + radius + 1
-            ):
-                if map.check_placement(
-                    size_checker, Coordinate(coordinate.get_x() - radius, y)
-                ):
-                    current = Coordinate(coordinate.get_x() - radius, y)
-                    zone_list.append(current + 1)
-                    map.add(size_checker, current)
-                if map.check_placement(
-                    size_checker, Coordinate(coordinate.get_x() + radius, y)
-                ):
-                    current = Coordinate(coordinate.get_x() + radius, y)
-                    zone_list.append(current + 1)
-                    map.add(size_checker, current)
+        radius = 1
+        while radius < map_size:
+            for x in range(cx - radius, cx + radius + 1):
+                claim(x, cy - radius)
+                claim(x, cy + radius)
+            for y in range(cy - radius, cy + radius + 1):
+                claim(cx - radius, y)
+                claim(cx + radius, y)
             radius += 1
             if size == 2 and len(zone_list) > 0:
                 break
+            if count is not None and len(zone_list) >= count:
+                break
         return zone_list
 
     def find_nearest_objects(
-        self, coordinate: Coordinate, object_type: type
+        self,
+        coordinate: Coordinate,
+        object_type: type,
+        count: int = None,
+        radius: int = None,
     ) -> list[Coordinate]:
         """
-        Find the nearest object of the same type to a given coordinate.
+        Find the nearest tiles occupied by objects of a type, farms being included when searching for resources.
+        Only resources, buildings and units are looked for, through the spatial index.
 
         :param coordinate: The starting coordinate.
         :type coordinate: Coordinate
         :param object_type: The type of the object to find.
         :type object_type: type
-        :return: The list of coordinate of nearest objects of the same type.
+        :param count: The maximum number of coordinates, None for every object of the map.
+        :type count: int
+        :param radius: The maximum distance, in tiles, None for no limit.
+        :type radius: int
+        :return: The list of coordinate of nearest objects of the same type, nearest first.
         :rtype: List[Coordinate]
         """
-        visited = set()
-        queue = [coordinate]
-        list_of_objects = []
-        while queue:
-            current = queue.pop(0)
-            if current in visited:
-                continue
-            visited.add(current)
-            if isinstance(self.get(current), object_type):
-                list_of_objects.append(current)
-            # Include farms when searching for resources
-            if object_type == Resource and isinstance(self.get(current), Farm):
-                list_of_objects.append(current)
-            for dx, dy in Map.DIRECTIONS:
-                neighbor = Coordinate(current.get_x() + dx, current.get_y() + dy)
-                if (
-                    Coordinate(0, 0)
-                    <= neighbor
-                    <= Coordinate(self.get_size() - 1, self.get_size() - 1)
-                ):
-                    queue.append(neighbor)
 
-        return list_of_objects
+        def accept(x: int, y: int) -> bool:
+            obj = self.get_xy(x, y)
+            return isinstance(obj, object_type) or (
+                object_type == Resource and isinstance(obj, Farm)
+            )
+
+        keys = self.__spatial_index.get_keys(object_type)
+        return self.__find_nearest(coordinate, keys, count, radius, accept)
 
     def find_nearest_enemies(
-        self, coordinate: Coordinate, player: "Player"
+        self,
+        coordinate: Coordinate,
+        player: "Player",
+        count: int = None,
+        radius: int = None,
     ) -> list[Coordinate]:
         """
         Find the nearest enemies to a given coordinate.
@@ -559,15 +1070,48 @@ class Map:
         :type coordinate: Coordinate
         :param player: The player to find the nearest enemy of.
         :type player: Player
+        :param count: The maximum number of coordinates, None for every entity of the player.
+        :type count: int
+        :param radius: The maximum distance, in tiles, None for no limit.
+        :type radius: int
         :return: A list of coordinates of the nearest enemies.
         :rtype: list[Coordinate]
         """
-        list_of_enemies_coordinate = [
-            coord
-            for coord in self.find_nearest_objects(coordinate, Entity)
-            if self.get(coord).get_player() == player
-        ]
-        return list_of_enemies_coordinate
+        owner = SpatialIndex.get_player_key(player)
+        keys = [(SpatialIndex.BUILDING, owner), (SpatialIndex.UNIT, owner)]
+        return self.__find_nearest(coordinate, keys, count, radius)
+
+    def __find_nearest(
+        self,
+        coordinate: Coordinate,
+        keys: list[tuple],
+        count: int = None,
+        radius: int = None,
+        accept: typing.Callable[[int, int], bool] = None,
+    ) -> list[Coordinate]:
+        """
+        Query the spatial index around a coordinate.
+
+        :param coordinate: The starting coordinate.
+        :type coordinate: Coordinate
+        :param keys: The categories of the spatial index to search.
+        :type keys: list[tuple]
+        :param count: The maximum number of coordinates, None for no limit.
+        :type count: int
+        :param radius: The maximum distance, in tiles, None for no limit.
+        :type radius: int
+        :param accept: A filter on the (x, y) tiles found, if any.
+        :type accept: Callable[[int, int], bool]
+        :return: The coordinates found, nearest first.
+        :rtype: list[Coordinate]
+        """
+        x, y = coordinate.get_x(), coordinate.get_y()
+        if radius is None:
+            tiles = self.__spatial_index.k_nearest(x, y, keys, count, accept)
+        else:
+            tiles = self.__spatial_index.within_radius(x, y, keys, radius, accept)
+            tiles = tiles if count is None else tiles[:count]
+        return [Coordinate.of(tx, ty) for tx, ty in tiles]
 
     def capture(self) -> "Map":
         """
@@ -576,10 +1120,54 @@ class Map:
         :return: A copy of the map.
         :rtype: Map
         """
-        new_map = Map(self.__size)
-        new_map.__matrix = self.__matrix.copy()
+        new_map = Map.__new__(Map)
+        new_map.__size = self.__size
+        new_map.__storage = self.__storage.copy()
+        new_map.__walkable = self.__walkable.copy()
+        new_map.__chunks = self.__chunks
+        new_map.__chunk_versions = self.__chunk_versions.copy()
+        new_map.__cluster_graph = None
+        new_map.__path_cache = PathCache(Map.CHUNK_SIZE, self.__chunks)
+        new_map.__flow_fields = FlowFieldService(new_map)
+        new_map.__spatial_index = self.__spatial_index.copy()
+        new_map.__registry = {
+            id: (obj, tiles.copy()) for id, (obj, tiles) in self.__registry.items()
+        }
+        # The summed-area tables are never modified in place, so the copy can share them
+        new_map.__integrals = self.__integrals.copy()
+        new_map.__lock = threading.RLock()
+        new_map.__version = self.__version
+        new_map.__journal = deque(maxlen=Map.JOURNAL_CAPACITY)
+        new_map.__chunk_stamps = self.__chunk_stamps.copy()
+        new_map.__snapshot = None
+        new_map.__snapshot_version = 0
         return new_map
 
+    def snapshot(self) -> "Map":
+        """
+        Get a read-only view of the map, shared by every caller.
+        The first call captures the map; the next calls only replay the changes journaled since,
+        so they cost the number of tiles changed instead of the size of the map.
+        When the journal no longer holds every change since the last call, the map is captured again.
+        The view is consistent, as operations are never replayed halfway, and it does not change until the next call.
+
+        :return: The snapshot of the map.
+        :rtype: Map
+        """
+        with self.__lock:
+            version = self.__snapshot_version
+            behind = self.__version > version and (
+                not self.__journal or self.__journal[0][0] > version + 1
+            )
+            if self.__snapshot is None or behind:
+                self.__snapshot = self.capture()
+            elif self.__version > version:
+                start = version + 1 - self.__journal[0][0]
+                for _, x, y, _, new in islice(self.__journal, start, None):
+                    self.__snapshot.__set_tile(x, y, new)
+            self.__snapshot_version = self.__version
+            return self.__snapshot
+
     def indicate_color(self, coordinate: Coordinate) -> str:
         """
         Get the color of the object coordinate.
@@ -603,12 +1191,45 @@ class Map:
     def __getstate__(self):
         # Méthode spéciale pour la sérialisation
         state = self.__dict__.copy()
-        state["_Map__matrix"] = dict(
-            self.__matrix
-        )  # Convertir defaultdict en dict pour la sérialisation
+        state["_Map__cluster_graph"] = None
+        del state["_Map__path_cache"]
+        del state["_Map__flow_fields"]
+        state["_Map__integrals"] = {}
+        del state["_Map__lock"]
+        del state["_Map__journal"]
+        state["_Map__snapshot"] = None
         return state
 
     def __setstate__(self, state):
         # Méthode spéciale pour la désérialisation
+        # Older saves kept the tiles in a defaultdict under "_Map__matrix"
+        matrix = state.pop("_Map__matrix", None)
+        # Older saves kept a single summed-area table of the whole map
+        state.pop("_Map__integral", None)
+        state.pop("_Map__integral_versions", None)
         self.__dict__.update(state)
-        self.__matrix = defaultdict(lambda: None, state["_Map__matrix"])
+        if matrix is not None:
+            self.__storage = GridStorage(self.__size)
+            for coordinate, obj in matrix.items():
+                if obj is not None:
+                    self.__storage.set(coordinate.get_x(), coordinate.get_y(), obj)
+        if matrix is not None or "_Map__walkable" not in state:
+            self.__build_walkable()
+        if "_Map__chunk_versions" not in state:
+            self.__chunks = -(-self.__size // Map.CHUNK_SIZE)
+            self.__chunk_versions = [0] * (self.__chunks * self.__chunks)
+            self.__cluster_graph = None
+        self.__path_cache = PathCache(Map.CHUNK_SIZE, self.__chunks)
+        self.__flow_fields = FlowFieldService(self)
+        if matrix is not None or "_Map__spatial_index" not in state:
+            self.__build_spatial_index()
+        if matrix is not None or "_Map__registry" not in state:
+            self.__build_registry()
+        self.__integrals = {}
+        self.__lock = threading.RLock()
+        if "_Map__version" not in state:
+            self.__version = 0
+            self.__chunk_stamps = [0] * (self.__chunks * self.__chunks)
+        self.__journal = deque(maxlen=Map.JOURNAL_CAPACITY)
+        self.__snapshot = None
+        self.__snapshot_version = 0
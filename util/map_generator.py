@@ -0,0 +1,306 @@
+import os
+import pickle
+import random
+import typing
+
+from model.buildings.town_center import TownCenter
+from model.game_object import GameObject
+from model.resources.gold import Gold
+from model.resources.wood import Wood
+from util.coordinate import Coordinate
+from util.map import Map
+from util.state_manager import MapSize, MapType, StartingCondition
+from util.storage.chunked_storage import ChunkedStorage
+from util.storage.grid_storage import GridStorage
+
+"""
+This file contains the MapGenerator class, which generates the resources of a map and the start of the first player
+from an explicit seed, and keeps the generated maps in a cache on disk.
+"""
+
+
+class MapGenerator:
+    """
+    Seeded generator of the maps of the game.
+
+    The same seed, map type and map size always give the same map. The generator places the resources
+    and picks the tiles of the town center and of the villagers of the first player, which are left empty
+    for the game to place the entities of the player.
+    RICH maps dot the resources across the map, GOLD_CENTER maps gather the gold in a disc at the centre,
+    and CLUSTERED maps grow forests and gold veins out of value noise.
+    The cache is kept in the cache directory of the user, outside the working tree. Its files are pickled maps, so
+    CACHE_VERSION is part of their names and must be raised whenever the generation or the pickled classes change:
+    the files of the older versions are then never read again.
+    """
+
+    CACHE_DIRECTORY: str = os.path.join(
+        os.environ.get("XDG_CACHE_HOME")
+        or os.path.join(os.path.expanduser("~"), ".cache"),
+        "aige-of-networks",
+        "maps",
+    )
+    CACHE_VERSION: int = 1
+    WOOD_SHARE: float = 0.05
+    GOLD_SHARE: float = 0.005
+    START_DISTANCE: float = 0.3
+    VILLAGERS: int = 3
+    FOREST_CELLS: tuple[int, ...] = (24, 8)
+    VEIN_CELLS: tuple[int, ...] = (6, 3)
+
+    def __init__(
+        self,
+        seed: int,
+        map_type: MapType,
+        map_size: MapSize,
+        starting_condition: StartingCondition,
+        cache_directory: typing.Optional[str] = CACHE_DIRECTORY,
+    ) -> None:
+        """
+        Create a generator.
+
+        :param seed: The seed of the map.
+        :type seed: int
+        :param map_type: The type of the map.
+        :type map_type: MapType
+        :param map_size: The size of the map.
+        :type map_size: MapSize
+        :param starting_condition: The starting condition of the game, part of the key of the cache.
+        :type starting_condition: StartingCondition
+        :param cache_directory: The directory of the cache, None to disable it.
+        :type cache_directory: str
+        """
+        self.__seed: int = seed
+        self.__map_type: MapType = MapType(map_type)
+        self.__map_size: MapSize = MapSize(map_size)
+        self.__starting_condition: StartingCondition = StartingCondition(
+            starting_condition
+        )
+        self.__cache_directory: typing.Optional[str] = cache_directory
+
+    def get_seed(self) -> int:
+        """
+        Get the seed of the map.
+
+        :return: The seed.
+        :rtype: int
+        """
+        return self.__seed
+
+    def get_cache_path(self) -> typing.Optional[str]:
+        """
+        Get the file caching the map, named after the version of the cache and the (seed, type, size, starting condition)
+        key of the map.
+
+        :return: The path of the cache file, None if the cache is disabled.
+        :rtype: str
+        """
+        if self.__cache_directory is None:
+            return None
+        name = (
+            f"v{MapGenerator.CACHE_VERSION}_{self.__seed}_{self.__map_type.name}"
+            f"_{self.__map_size.value}"
+            f"_{self.__starting_condition.name}.pkl"
+        )
+        return os.path.join(self.__cache_directory, name)
+
+    def generate(self) -> tuple[Map, Coordinate, list[Coordinate]]:
+        """
+        Generate the map, or load it from the cache when it was already generated.
+
+        :return: The map, the coordinate of the town center of the first player and the coordinates of its villagers.
+        :rtype: tuple[Map, Coordinate, list[Coordinate]]
+        """
+        path = self.get_cache_path()
+        if path is not None and os.path.exists(path):
+            try:
+                with open(path, "rb") as file:
+                    return pickle.load(file)
+            except (
+                OSError,
+                pickle.PickleError,
+                EOFError,
+                AttributeError,
+                ImportError,
+                TypeError,
+            ):
+                pass
+        generated = self.__generate()
+        if path is not None:
+            try:
+                os.makedirs(self.__cache_directory, exist_ok=True)
+                with open(path, "wb") as file:
+                    pickle.dump(generated, file)
+            except (OSError, pickle.PickleError):
+                pass
+        return generated
+
+    def __generate(self) -> tuple[Map, Coordinate, list[Coordinate]]:
+        """
+        Generate the map from the seed. The tiles of the first player are reserved with place holders during the generation.
+
+        :return: The map, the coordinate of the town center of the first player and the coordinates of its villagers.
+        :rtype: tuple[Map, Coordinate, list[Coordinate]]
+        """
+        rng = random.Random(self.__seed)
+        size = self.__map_size.value
+        # Maps larger than LARGE are mostly empty, so their tiles are stored in chunks allocated on demand
+        storage = ChunkedStorage if size > MapSize.LARGE.value else GridStorage
+        game_map = Map(size, storage)
+
+        town_center, villagers = self.__pick_start(game_map, rng)
+        reserved = [(town_center, TownCenter.TYPE.get_size())]
+        reserved += [(villager, 1) for villager in villagers]
+        for coordinate, object_size in reserved:
+            place_holder = GameObject(GameObject.PLACE_HOLDER)
+            place_holder.set_size(object_size)
+            game_map.add(place_holder, coordinate)
+
+        wood_count = int(size**2 * MapGenerator.WOOD_SHARE)
+        gold_count = int(size**2 * MapGenerator.GOLD_SHARE)
+        if self.__map_type == MapType.RICH:
+            # The wood of a RICH map is a single shared resource, as it always was
+            wood = Wood()
+            game_map.bulk_place(lambda: wood, wood_count, rng)
+            game_map.bulk_place(Gold, gold_count, rng)
+        elif self.__map_type == MapType.GOLD_CENTER:
+            self.__place_gold_center(game_map)
+            game_map.bulk_place(Wood, wood_count, rng)
+        elif self.__map_type == MapType.CLUSTERED:
+            self.__place_clusters(
+                game_map, rng, MapGenerator.FOREST_CELLS, Wood, wood_count
+            )
+            self.__place_clusters(
+                game_map, rng, MapGenerator.VEIN_CELLS, Gold, gold_count
+            )
+
+        for coordinate, _ in reserved:
+            game_map.remove(coordinate)
+        return game_map, town_center, villagers
+
+    def __pick_start(
+        self, game_map: Map, rng: random.Random
+    ) -> tuple[Coordinate, list[Coordinate]]:
+        """
+        Pick the tile of the town center of the first player, far from the centre of the map,
+        and the tiles of its villagers around it.
+
+        :param game_map: The empty map.
+        :type game_map: Map
+        :param rng: The random generator.
+        :type rng: random.Random
+        :return: The coordinate of the town center and the coordinates of the villagers.
+        :rtype: tuple[Coordinate, list[Coordinate]]
+        """
+        size = game_map.get_size()
+        town_center_size = TownCenter.TYPE.get_size()
+        center_size = 2 if size % 2 == 0 else 1
+        center = Coordinate((size - center_size) // 2, (size - center_size) // 2)
+        min_distance = int(size * MapGenerator.START_DISTANCE)
+        while True:
+            coordinate = Coordinate(rng.randint(0, size - 1), rng.randint(0, size - 1))
+            if coordinate.distance(center) >= min_distance and game_map.is_empty_zone(
+                coordinate.get_x(), coordinate.get_y(), town_center_size
+            ):
+                break
+        x0, y0 = coordinate.get_x(), coordinate.get_y()
+        around = [
+            Coordinate(x, y)
+            for x in range(x0 - 1, x0 + town_center_size + 1)
+            for y in range(y0 - 1, y0 + town_center_size + 1)
+            if 0 <= x < size
+            and 0 <= y < size
+            and not (
+                x0 <= x < x0 + town_center_size and y0 <= y < y0 + town_center_size
+            )
+        ]
+        return coordinate, rng.sample(around, MapGenerator.VILLAGERS)
+
+    def __place_gold_center(self, game_map: Map) -> None:
+        """
+        Fill a disc at the centre of the map with gold.
+
+        :param game_map: The map.
+        :type game_map: Map
+        """
+        size = game_map.get_size()
+        center_x = center_y = size // 2
+        radius = int(size * 0.05)
+        for x in range(center_x - radius, center_x + radius + 1):
+            for y in range(center_y - radius, center_y + radius + 1):
+                if (x - center_x) ** 2 + (y - center_y) ** 2 <= radius**2:
+                    coordinate = Coordinate.of(x, y)
+                    gold = Gold()
+                    game_map.add(gold, coordinate)
+                    gold.set_coordinate(coordinate)
+
+    def __place_clusters(
+        self,
+        game_map: Map,
+        rng: random.Random,
+        cells: tuple[int, ...],
+        resource: type,
+        count: int,
+    ) -> None:
+        """
+        Place a resource on the empty tiles where a value noise is the highest, which gathers it in clusters.
+
+        :param game_map: The map.
+        :type game_map: Map
+        :param rng: The random generator.
+        :type rng: random.Random
+        :param cells: The sizes of the cells of the octaves of the noise, the first one giving the size of the clusters.
+        :type cells: tuple[int, ...]
+        :param resource: The class of the resource.
+        :type resource: type
+        :param count: The number of tiles to fill.
+        :type count: int
+        """
+        size = game_map.get_size()
+        noise = [0.0] * (size * size)
+        weight = 1.0
+        for cell in cells:
+            octave = MapGenerator.value_noise(size, cell, rng)
+            noise = [a + weight * b for a, b in zip(noise, octave)]
+            weight /= 2
+        walkable = game_map.get_walkable()
+        free = [value for value, empty in zip(noise, walkable) if empty]
+        if not free or count <= 0:
+            return
+        threshold = sorted(free, reverse=True)[min(count, len(free)) - 1]
+        placed = 0
+        for index, value in enumerate(noise):
+            if value >= threshold and walkable[index] and placed < count:
+                y, x = divmod(index, size)
+                coordinate = Coordinate.of(x, y)
+                object = resource()
+                game_map.add(object, coordinate)
+                object.set_coordinate(coordinate)
+                placed += 1
+
+    @staticmethod
+    def value_noise(size: int, cell: int, rng: random.Random) -> list[float]:
+        """
+        Compute a value noise: random values on a lattice of square cells, smoothly interpolated on every tile.
+        The lattice rows are interpolated first, then every tile of a row reads the interpolated row.
+
+        :param size: The size of the map.
+        :type size: int
+        :param cell: The size of a cell of the lattice, in tiles.
+        :type cell: int
+        :param rng: The random generator.
+        :type rng: random.Random
+        :return: The noise of the tiles, between 0 and 1, indexed by y * size + x.
+        :rtype: list[float]
+        """
+        points = size // cell + 2
+        lattice = [rng.random() for _ in range(points * points)]
+        smooth = [(t * t * (3 - 2 * t)) for t in (i / cell for i in range(cell))]
+        columns = [(x // cell, smooth[x % cell]) for x in range(size)]
+        noise = []
+        for y in range(size):
+            top, t = y // cell, smooth[y % cell]
+            upper = lattice[top * points : (top + 1) * points]
+            lower = lattice[(top + 1) * points : (top + 2) * points]
+            row = [a + (b - a) * t for a, b in zip(upper, lower)]
+            noise.extend(row[i] + (row[i + 1] - row[i]) * u for i, u in columns)
+        return noise
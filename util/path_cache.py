@@ -0,0 +1,140 @@
+import threading
+import typing
+from collections import OrderedDict
+
+"""
+This file contains the PathCache class, an LRU cache of paths invalidated by the chunk versions of the map.
+"""
+
+
+class PathCache:
+    """
+    LRU cache of paths, keyed by (start, end, mode, avoid rectangle).
+
+    Every entry remembers the chunks its path crosses with their versions at the time of the search,
+    and it is only reused while none of these chunks changed. Empty paths are never cached, as they depend on the whole map.
+    """
+
+    DEFAULT_CAPACITY: int = 512
+
+    def __init__(
+        self, chunk_size: int, chunk_count: int, capacity: int = DEFAULT_CAPACITY
+    ) -> None:
+        """
+        Create an empty cache.
+
+        :param chunk_size: The size of a chunk of the map, in tiles.
+        :type chunk_size: int
+        :param chunk_count: The number of chunks on each side of the map.
+        :type chunk_count: int
+        :param capacity: The maximum number of paths kept.
+        :type capacity: int
+        """
+        self.__chunk_size: int = chunk_size
+        self.__chunk_count: int = chunk_count
+        self.__capacity: int = capacity
+        self.__entries: OrderedDict[
+            tuple, tuple[tuple[tuple[int, int], ...], tuple[int, ...], tuple[int, ...]]
+        ] = OrderedDict()
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__lock: threading.Lock = threading.Lock()
+
+    def get_hits(self) -> int:
+        """
+        Get the number of lookups answered by the cache.
+
+        :return: The number of hits.
+        :rtype: int
+        """
+        return self.__hits
+
+    def get_misses(self) -> int:
+        """
+        Get the number of lookups that found no valid path.
+
+        :return: The number of misses.
+        :rtype: int
+        """
+        return self.__misses
+
+    def get_capacity(self) -> int:
+        """
+        Get the maximum number of paths kept.
+
+        :return: The capacity of the cache.
+        :rtype: int
+        """
+        return self.__capacity
+
+    def __len__(self) -> int:
+        """
+        Get the number of paths kept.
+
+        :return: The number of entries.
+        :rtype: int
+        """
+        return len(self.__entries)
+
+    def clear(self) -> None:
+        """
+        Remove every path and reset the counters.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+    def get(
+        self, key: tuple, versions: list[int]
+    ) -> typing.Optional[tuple[tuple[int, int], ...]]:
+        """
+        Get a cached path if none of the chunks it crosses changed since it was found.
+        A stale entry is dropped.
+
+        :param key: The (start, end, mode, avoid) key of the search.
+        :type key: tuple
+        :param versions: The current chunk versions of the map.
+        :type versions: list[int]
+        :return: The (x, y) tiles of the path, None if there is no valid entry.
+        :rtype: tuple[tuple[int, int], ...]
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                path, chunks, stamps = entry
+                if all(
+                    versions[chunk] == stamp for chunk, stamp in zip(chunks, stamps)
+                ):
+                    self.__entries.move_to_end(key)
+                    self.__hits += 1
+                    return path
+                del self.__entries[key]
+            self.__misses += 1
+            return None
+
+    def put(
+        self, key: tuple, path: typing.Sequence[tuple[int, int]], versions: list[int]
+    ) -> None:
+        """
+        Store a path, evicting the least recently used one if the cache is full.
+
+        :param key: The (start, end, mode, avoid) key of the search.
+        :type key: tuple
+        :param path: The (x, y) tiles of the path.
+        :type path: Sequence[tuple[int, int]]
+        :param versions: The chunk versions of the map when the search started.
+        :type versions: list[int]
+        """
+        if not path:
+            return
+        chunk_size, chunk_count = self.__chunk_size, self.__chunk_count
+        chunks = tuple(
+            sorted({(y // chunk_size) * chunk_count + x // chunk_size for x, y in path})
+        )
+        stamps = tuple(versions[chunk] for chunk in chunks)
+        with self.__lock:
+            self.__entries[key] = (tuple(path), chunks, stamps)
+            self.__entries.move_to_end(key)
+            if len(self.__entries) > self.__capacity:
+                self.__entries.popitem(last=False)
@@ -0,0 +1,530 @@
+import threading
+from heapq import heappop, heappush
+from typing import Optional
+
+"""
+This file contains the Pathfinder class, the A* and Jump Point Search engine used by the Map.
+It works directly on the walkability grid of the map (a bytearray indexed by y * size + x).
+"""
+
+SQRT2: float = 2**0.5
+
+
+class Pathfinder:
+    """
+    Find paths on a square walkability grid.
+
+    A search only covers a window around the start and the end, WINDOW_MARGIN tiles wider than the rectangle between them.
+    The window is doubled until the path found in it is shorter than any path leaving it, so the path is still a shortest one,
+    and only the searches around an obstacle as large as the map pay for the whole map.
+    The window of the grid is copied into a buffer padded with a blocked border, so neighbours never need bounds checks.
+    The g-scores, parents and closed flags live in buffers that only grow to the largest window searched so far.
+    Every search stamps the cells it touches with its own search number, so the buffers never need to be cleared.
+    """
+
+    STRAIGHT_DIRECTIONS = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+    DIAGONAL_DIRECTIONS = STRAIGHT_DIRECTIONS + [(-1, -1), (1, -1), (1, 1), (-1, 1)]
+    WINDOW_MARGIN = 16
+
+    _local = threading.local()
+
+    @staticmethod
+    def get_instance(size: int) -> "Pathfinder":
+        """
+        Get the pathfinder of the current thread for a map size.
+        The buffers are not shared between threads, so the game loop and the AI loop can search at the same time.
+
+        :param size: The size of the map.
+        :type size: int
+        :return: The pathfinder for this size.
+        :rtype: Pathfinder
+        """
+        pathfinders = getattr(Pathfinder._local, "pathfinders", None)
+        if pathfinders is None:
+            pathfinders = Pathfinder._local.pathfinders = {}
+        if size not in pathfinders:
+            pathfinders[size] = Pathfinder(size)
+        return pathfinders[size]
+
+    def __init__(self, size: int) -> None:
+        """
+        Create the pathfinder of a map size. The buffers are allocated by the searches, at the size of their window.
+
+        :param size: The size of the map.
+        :type size: int
+        """
+        self.__size: int = size
+        self.__width: int = 0
+        self.__min_x: int = 0
+        self.__min_y: int = 0
+        self.__walkable: bytearray = bytearray()
+        self.__g: list[float] = []
+        self.__parent: list[int] = []
+        self.__seen: list[int] = []
+        self.__closed: list[int] = []
+        self.__search: int = 0
+        self.__straight_steps: list[tuple[int, float]] = []
+        self.__diagonal_steps: list[tuple[int, float]] = []
+
+    def get_size(self) -> int:
+        """
+        Get the size of the map the pathfinder searches.
+
+        :return: The size of the map.
+        :rtype: int
+        """
+        return self.__size
+
+    def find_path(
+        self,
+        walkable: bytearray,
+        start: tuple[int, int],
+        end: tuple[int, int],
+        diagonal: bool = True,
+        avoid: Optional[tuple[int, int, int, int]] = None,
+        jump_point: bool = True,
+    ) -> list[tuple[int, int]]:
+        """
+        Find a shortest path between two tiles.
+
+        The start and end tiles are always considered walkable. The avoid rectangle, if given, is blocked except for the end tile.
+
+        :param walkable: The walkability grid, indexed by y * size + x. It is not modified.
+        :type walkable: bytearray
+        :param start: The (x, y) starting tile.
+        :type start: tuple[int, int]
+        :param end: The (x, y) ending tile.
+        :type end: tuple[int, int]
+        :param diagonal: Whether diagonal moves are allowed.
+        :type diagonal: bool
+        :param avoid: The (from_x, from_y, to_x, to_y) rectangle to avoid, bounds included.
+        :type avoid: tuple[int, int, int, int]
+        :param jump_point: Whether to use Jump Point Search instead of plain A* when diagonal moves are allowed.
+        :type jump_point: bool
+        :return: The list of (x, y) tiles from start to end, both included. Empty if there is no path.
+        :rtype: list[tuple[int, int]]
+        :raises ValueError: If the start or the end is outside the map.
+        """
+        size = self.__size
+        for x, y in (start, end):
+            if not (0 <= x < size and 0 <= y < size):
+                raise ValueError(f"Tile ({x},{y}) is outside the map.")
+        (start_x, start_y), (end_x, end_y) = start, end
+        margin = Pathfinder.WINDOW_MARGIN
+        while True:
+            window = (
+                max(min(start_x, end_x) - margin, 0),
+                max(min(start_y, end_y) - margin, 0),
+                min(max(start_x, end_x) + margin, size - 1),
+                min(max(start_y, end_y) + margin, size - 1),
+            )
+            path = self.__search_window(
+                walkable, window, start, end, diagonal, avoid, jump_point
+            )
+            if window == (0, 0, size - 1, size - 1):
+                return path
+            # A path found in the window is a shortest one if no path leaving the window can be shorter
+            if path and self.__g[self.__index(*end)] <= self.__leave_cost(
+                size, window, start, end, diagonal
+            ):
+                return path
+            margin *= 2
+
+    def __search_window(
+        self,
+        walkable: bytearray,
+        window: tuple[int, int, int, int],
+        start: tuple[int, int],
+        end: tuple[int, int],
+        diagonal: bool,
+        avoid: Optional[tuple[int, int, int, int]],
+        jump_point: bool,
+    ) -> list[tuple[int, int]]:
+        """
+        Find a shortest path between two tiles without leaving a window of the grid.
+
+        :param walkable: The walkability grid, indexed by y * size + x.
+        :type walkable: bytearray
+        :param window: The (min_x, min_y, max_x, max_y) window, bounds included.
+        :type window: tuple[int, int, int, int]
+        :param start: The (x, y) starting tile, inside the window.
+        :type start: tuple[int, int]
+        :param end: The (x, y) ending tile, inside the window.
+        :type end: tuple[int, int]
+        :param diagonal: Whether diagonal moves are allowed.
+        :type diagonal: bool
+        :param avoid: The (from_x, from_y, to_x, to_y) rectangle to avoid, bounds included.
+        :type avoid: tuple[int, int, int, int]
+        :param jump_point: Whether to use Jump Point Search instead of plain A* when diagonal moves are allowed.
+        :type jump_point: bool
+        :return: The list of (x, y) tiles from start to end, both included. Empty if there is no path in the window.
+        :rtype: list[tuple[int, int]]
+        """
+        size = self.__size
+        min_x, min_y, max_x, max_y = window
+        columns = max_x - min_x + 1
+        width = columns + 2
+        cells = width * (max_y - min_y + 3)
+        self.__prepare(width, cells, min_x, min_y)
+        grid = self.__walkable = bytearray(cells)
+        for y in range(min_y, max_y + 1):
+            row = self.__index(min_x, y)
+            grid[row : row + columns] = walkable[
+                y * size + min_x : y * size + max_x + 1
+            ]
+        start_index = self.__index(*start)
+        end_index = self.__index(*end)
+        grid[start_index] = 1
+        if avoid is not None:
+            from_x, from_y = max(avoid[0], min_x), max(avoid[1], min_y)
+            to_x, to_y = min(avoid[2], max_x), min(avoid[3], max_y)
+            if from_x <= to_x:
+                for y in range(from_y, to_y + 1):
+                    row = self.__index(from_x, y)
+                    grid[row : row + to_x - from_x + 1] = bytes(to_x - from_x + 1)
+        grid[end_index] = 1
+        if diagonal and jump_point:
+            return self.__jump_point_search(start_index, end_index)
+        return self.__a_star(start_index, end_index, diagonal)
+
+    def __prepare(self, width: int, cells: int, min_x: int, min_y: int) -> None:
+        """
+        Set up the buffers and the neighbour offsets for a window, growing the buffers if it is larger than the previous ones.
+
+        :param width: The width of the padded window.
+        :type width: int
+        :param cells: The number of cells of the padded window.
+        :type cells: int
+        :param min_x: The x coordinate of the left column of the window.
+        :type min_x: int
+        :param min_y: The y coordinate of the top row of the window.
+        :type min_y: int
+        """
+        missing = cells - len(self.__g)
+        if missing > 0:
+            self.__g.extend([0.0] * missing)
+            self.__parent.extend([-1] * missing)
+            self.__seen.extend([0] * missing)
+            self.__closed.extend([0] * missing)
+        self.__min_x, self.__min_y = min_x, min_y
+        if width != self.__width:
+            self.__width = width
+            self.__straight_steps = [
+                (dy * width + dx, 1.0) for dx, dy in Pathfinder.STRAIGHT_DIRECTIONS
+            ]
+            self.__diagonal_steps = [
+                (dy * width + dx, SQRT2 if dx and dy else 1.0)
+                for dx, dy in Pathfinder.DIAGONAL_DIRECTIONS
+            ]
+
+    @staticmethod
+    def __leave_cost(
+        size: int,
+        window: tuple[int, int, int, int],
+        start: tuple[int, int],
+        end: tuple[int, int],
+        diagonal: bool,
+    ) -> float:
+        """
+        Get a lower bound of the cost of the paths from start to end that leave a window through a side not on the edge of the map.
+        Such a path goes to the row or column just past the side and back, on top of its moves on the other axis.
+
+        :param size: The size of the map.
+        :type size: int
+        :param window: The (min_x, min_y, max_x, max_y) window, bounds included.
+        :type window: tuple[int, int, int, int]
+        :param start: The (x, y) starting tile.
+        :type start: tuple[int, int]
+        :param end: The (x, y) ending tile.
+        :type end: tuple[int, int]
+        :param diagonal: Whether diagonal moves are allowed.
+        :type diagonal: bool
+        :return: The lower bound, infinite if the window covers the whole map.
+        :rtype: float
+        """
+        min_x, min_y, max_x, max_y = window
+        (start_x, start_y), (end_x, end_y) = start, end
+        dx, dy = abs(start_x - end_x), abs(start_y - end_y)
+        detours = []
+        if min_x > 0:
+            detours.append((start_x + end_x - 2 * (min_x - 1), dy))
+        if min_y > 0:
+            detours.append((dx, start_y + end_y - 2 * (min_y - 1)))
+        if max_x < size - 1:
+            detours.append((2 * (max_x + 1) - start_x - end_x, dy))
+        if max_y < size - 1:
+            detours.append((dx, 2 * (max_y + 1) - start_y - end_y))
+        cost = float("inf")
+        for hx, hy in detours:
+            if diagonal:
+                cost = min(cost, hx + hy + (SQRT2 - 2) * min(hx, hy))
+            else:
+                cost = min(cost, hx + hy)
+        return cost
+
+    def __index(self, x: int, y: int) -> int:
+        """
+        Get the index of a tile in the padded buffers.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :return: The index of the tile.
+        :rtype: int
+        """
+        return (y - self.__min_y + 1) * self.__width + x - self.__min_x + 1
+
+    def __start_search(self, start: int) -> int:
+        """
+        Begin a new search from a cell and return its search number.
+
+        :param start: The index of the starting cell.
+        :type start: int
+        :return: The search number.
+        :rtype: int
+        """
+        self.__search += 1
+        self.__g[start] = 0.0
+        self.__parent[start] = -1
+        self.__seen[start] = self.__search
+        return self.__search
+
+    def __a_star(self, start: int, end: int, diagonal: bool) -> list[tuple[int, int]]:
+        """
+        Run A* with an octile (diagonal) or Manhattan (straight) heuristic.
+
+        :param start: The index of the starting cell.
+        :type start: int
+        :param end: The index of the ending cell.
+        :type end: int
+        :param diagonal: Whether diagonal moves are allowed.
+        :type diagonal: bool
+        :return: The path from start to end, empty if there is none.
+        :rtype: list[tuple[int, int]]
+        """
+        width = self.__width
+        walkable = self.__walkable
+        g, parent, seen, closed = self.__g, self.__parent, self.__seen, self.__closed
+        search = self.__start_search(start)
+        end_y, end_x = divmod(end, width)
+        steps = self.__diagonal_steps if diagonal else self.__straight_steps
+        heap = [(0.0, start)]
+        while heap:
+            _, current = heappop(heap)
+            if closed[current] == search:
+                continue
+            closed[current] = search
+            if current == end:
+                return self.__build_path(end)
+            current_g = g[current]
+            for offset, cost in steps:
+                neighbour = current + offset
+                if not walkable[neighbour] or closed[neighbour] == search:
+                    continue
+                new_g = current_g + cost
+                if seen[neighbour] != search or new_g < g[neighbour]:
+                    seen[neighbour] = search
+                    g[neighbour] = new_g
+                    parent[neighbour] = current
+                    y, x = divmod(neighbour, width)
+                    hx, hy = abs(x - end_x), abs(y - end_y)
+                    if diagonal:
+                        h = hx + hy + (SQRT2 - 2) * min(hx, hy)
+                    else:
+                        h = hx + hy
+                    heappush(heap, (new_g + h, neighbour))
+        return []
+
+    def __jump_point_search(self, start: int, end: int) -> list[tuple[int, int]]:
+        """
+        Run Jump Point Search on the 8-connected grid, diagonal moves being allowed between two blocked tiles.
+
+        :param start: The index of the starting cell.
+        :type start: int
+        :param end: The index of the ending cell.
+        :type end: int
+        :return: The path from start to end, every tile included, empty if there is none.
+        :rtype: list[tuple[int, int]]
+        """
+        width = self.__width
+        g, parent, seen, closed = self.__g, self.__parent, self.__seen, self.__closed
+        search = self.__start_search(start)
+        end_y, end_x = divmod(end, width)
+        heap = [(0.0, start)]
+        while heap:
+            _, current = heappop(heap)
+            if closed[current] == search:
+                continue
+            closed[current] = search
+            if current == end:
+                return self.__expand(self.__build_path(end))
+            y, x = divmod(current, width)
+            current_g = g[current]
+            for dx, dy in self.__pruned_directions(current, parent[current]):
+                jump = self.__jump(current, dx, dy, end)
+                if jump < 0 or closed[jump] == search:
+                    continue
+                jy, jx = divmod(jump, width)
+                hx, hy = abs(jx - x), abs(jy - y)
+                new_g = current_g + max(hx, hy) + (SQRT2 - 1) * min(hx, hy)
+                if seen[jump] != search or new_g < g[jump]:
+                    seen[jump] = search
+                    g[jump] = new_g
+                    parent[jump] = current
+                    hx, hy = abs(jx - end_x), abs(jy - end_y)
+                    h = hx + hy + (SQRT2 - 2) * min(hx, hy)
+                    heappush(heap, (new_g + h, jump))
+        return []
+
+    def __pruned_directions(self, current: int, parent: int) -> list[tuple[int, int]]:
+        """
+        Get the directions worth exploring from a jump point, given the direction it was reached from.
+
+        :param current: The index of the jump point.
+        :type current: int
+        :param parent: The index of the parent jump point, -1 for the start.
+        :type parent: int
+        :return: The list of (dx, dy) directions.
+        :rtype: list[tuple[int, int]]
+        """
+        if parent < 0:
+            return Pathfinder.DIAGONAL_DIRECTIONS
+        width = self.__width
+        free = self.__walkable
+        y, x = divmod(current, width)
+        py, px = divmod(parent, width)
+        dx = (x > px) - (x < px)
+        dy = (y > py) - (y < py)
+        if dx and dy:
+            directions = [(0, dy), (dx, 0), (dx, dy)]
+            if not free[current - dx]:
+                directions.append((-dx, dy))
+            if not free[current - dy * width]:
+                directions.append((dx, -dy))
+        elif dx:
+            directions = [(dx, 0)]
+            if not free[current + width]:
+                directions.append((dx, 1))
+            if not free[current - width]:
+                directions.append((dx, -1))
+        else:
+            directions = [(0, dy)]
+            if not free[current + 1]:
+                directions.append((1, dy))
+            if not free[current - 1]:
+                directions.append((-1, dy))
+        return directions
+
+    def __jump(self, current: int, dx: int, dy: int, end: int) -> int:
+        """
+        Walk from a cell in a direction until a jump point, the end or an obstacle is met.
+
+        :param current: The index of the cell to walk from, excluded.
+        :type current: int
+        :param dx: The x direction.
+        :type dx: int
+        :param dy: The y direction.
+        :type dy: int
+        :param end: The index of the ending cell.
+        :type end: int
+        :return: The index of the jump point, -1 if an obstacle was met first.
+        :rtype: int
+        """
+        if not (dx and dy):
+            return self.__jump_straight(current + dy * self.__width + dx, dx, dy, end)
+        free = self.__walkable
+        vertical = dy * self.__width
+        step = vertical + dx
+        current += step
+        while free[current]:
+            if current == end:
+                return current
+            if (free[current - dx + vertical] and not free[current - dx]) or (
+                free[current + dx - vertical] and not free[current - vertical]
+            ):
+                return current
+            if (
+                self.__jump_straight(current + dx, dx, 0, end) >= 0
+                or self.__jump_straight(current + vertical, 0, dy, end) >= 0
+            ):
+                return current
+            current += step
+        return -1
+
+    def __jump_straight(self, current: int, dx: int, dy: int, end: int) -> int:
+        """
+        Walk horizontally or vertically from a cell until a jump point, the end or an obstacle is met.
+
+        :param current: The index of the first cell to check.
+        :type current: int
+        :param dx: The x direction.
+        :type dx: int
+        :param dy: The y direction.
+        :type dy: int
+        :param end: The index of the ending cell.
+        :type end: int
+        :return: The index of the jump point, -1 if an obstacle was met first.
+        :rtype: int
+        """
+        free = self.__walkable
+        width = self.__width
+        if dx:
+            while free[current]:
+                if current == end:
+                    return current
+                if (free[current + dx + width] and not free[current + width]) or (
+                    free[current + dx - width] and not free[current - width]
+                ):
+                    return current
+                current += dx
+        else:
+            vertical = dy * width
+            while free[current]:
+                if current == end:
+                    return current
+                if (free[current + 1 + vertical] and not free[current + 1]) or (
+                    free[current - 1 + vertical] and not free[current - 1]
+                ):
+                    return current
+                current += vertical
+        return -1
+
+    def __build_path(self, end: int) -> list[tuple[int, int]]:
+        """
+        Follow the parents from the end cell back to the start.
+
+        :param end: The index of the ending cell.
+        :type end: int
+        :return: The list of (x, y) tiles from start to end.
+        :rtype: list[tuple[int, int]]
+        """
+        width, min_x, min_y = self.__width, self.__min_x, self.__min_y
+        path = []
+        current = end
+        while current >= 0:
+            y, x = divmod(current, width)
+            path.append((x - 1 + min_x, y - 1 + min_y))
+            current = self.__parent[current]
+        path.reverse()
+        return path
+
+    @staticmethod
+    def __expand(jump_points: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        """
+        Fill the straight or diagonal segments between consecutive jump points, so units can walk the path tile by tile.
+
+        :param jump_points: The list of (x, y) jump points.
+        :type jump_points: list[tuple[int, int]]
+        :return: The list of every (x, y) tile of the path.
+        :rtype: list[tuple[int, int]]
+        """
+        path = jump_points[:1]
+        for (x, y), (to_x, to_y) in zip(jump_points, jump_points[1:]):
+            dx = (to_x > x) - (to_x < x)
+            dy = (to_y > y) - (to_y < y)
+            while (x, y) != (to_x, to_y):
+                x += dx
+                y += dy
+                path.append((x, y))
+        return path
@@ -13,6 +13,8 @@ class Settings:
     :vartype starting_condition: StartingCondition
     :ivar fps: The frames per second setting.
     :vartype fps: int
+    :ivar seed: The seed of the map, None for a random map that is not cached.
+    :vartype seed: int
     """
 
     def __init__(self) -> None:
@@ -21,3 +23,4 @@ class Settings:
         self.map_size: MapSize = MapSize.SMALL
         self.starting_condition: StartingCondition = StartingCondition.LEAN
         self.fps: int = FPS.FPS_60
+        self.seed: int = None
@@ -0,0 +1,319 @@
+import typing
+
+from model.buildings.building import Building
+from model.buildings.farm import Farm
+from model.entity import Entity
+from model.game_object import GameObject
+from model.resources.resource import Resource
+from model.units.unit import Unit
+
+if typing.TYPE_CHECKING:
+    from model.player.player import Player
+
+"""
+This file contains the SpatialIndex class, which keeps the tiles of each category of objects in square buckets
+to answer nearest and within-radius queries without scanning the map.
+"""
+
+Category = tuple[str, typing.Optional[tuple[str, str]]]
+
+
+class SpatialIndex:
+    """
+    Bucketed index of the tiles occupied by resources (farms included), and by the buildings and the units of each player.
+
+    The map is cut into square buckets, and every category keeps the occupied tiles of each non-empty bucket.
+    The categories of a tile are those of its object when it was added, so an entity changing owner must be indexed again.
+    Queries visit the buckets ring by ring around the query tile and stop as soon as the result cannot change,
+    distances being Chebyshev distances, like the moves of the units.
+    """
+
+    RESOURCE: str = "resource"
+    BUILDING: str = "building"
+    UNIT: str = "unit"
+    KINDS: dict[str, type] = {RESOURCE: Resource, BUILDING: Building, UNIT: Unit}
+
+    def __init__(self, size: int, bucket_size: int) -> None:
+        """
+        Create an empty index.
+
+        :param size: The size of the map.
+        :type size: int
+        :param bucket_size: The size of a bucket, in tiles.
+        :type bucket_size: int
+        """
+        self.__size: int = size
+        self.__bucket_size: int = bucket_size
+        self.__buckets: int = -(-size // bucket_size)
+        self.__categories: dict[Category, dict[int, set[int]]] = {}
+        self.__tiles: dict[int, tuple[Category, ...]] = {}
+
+    @staticmethod
+    def get_player_key(player: "Player") -> typing.Optional[tuple[str, str]]:
+        """
+        Get the key identifying a player in the categories, players being compared by name and color.
+
+        :param player: The player, or None.
+        :type player: Player
+        :return: The (name, color) key of the player, None if there is no player.
+        :rtype: tuple[str, str]
+        """
+        if player is None:
+            return None
+        return player.get_name(), player.get_color()
+
+    @staticmethod
+    def get_categories(object: GameObject) -> list[Category]:
+        """
+        Get the categories an object belongs to. A farm is both a building and a resource.
+
+        :param object: The game object.
+        :type object: GameObject
+        :return: The categories of the object, empty if it is not indexed.
+        :rtype: list[Category]
+        """
+        if isinstance(object, Resource):
+            return [(SpatialIndex.RESOURCE, None)]
+        if not isinstance(object, Entity):
+            return []
+        kind = SpatialIndex.UNIT if isinstance(object, Unit) else SpatialIndex.BUILDING
+        categories = [(kind, SpatialIndex.get_player_key(object.get_player()))]
+        if isinstance(object, Farm):
+            categories.append((SpatialIndex.RESOURCE, None))
+        return categories
+
+    def get_keys(self, object_type: type) -> list[Category]:
+        """
+        Get the categories that may contain objects of a type.
+
+        :param object_type: The type of the objects.
+        :type object_type: type
+        :return: The non-empty categories that may contain such objects.
+        :rtype: list[Category]
+        """
+        keys = []
+        for key in self.__categories:
+            base = SpatialIndex.KINDS[key[0]]
+            if issubclass(object_type, base) or issubclass(base, object_type):
+                keys.append(key)
+        return keys
+
+    def add(self, x: int, y: int, object: GameObject) -> None:
+        """
+        Index a tile occupied by an object.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :param object: The game object on the tile.
+        :type object: GameObject
+        """
+        tile = y * self.__size + x
+        if tile in self.__tiles:
+            self.remove(x, y)
+        categories = tuple(SpatialIndex.get_categories(object))
+        if not categories:
+            return
+        self.__tiles[tile] = categories
+        bucket = (y // self.__bucket_size) * self.__buckets + x // self.__bucket_size
+        for category in categories:
+            buckets = self.__categories.setdefault(category, {})
+            buckets.setdefault(bucket, set()).add(tile)
+
+    def remove(self, x: int, y: int) -> None:
+        """
+        Remove a tile from the index, if it is indexed.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        """
+        tile = y * self.__size + x
+        bucket = (y // self.__bucket_size) * self.__buckets + x // self.__bucket_size
+        for category in self.__tiles.pop(tile, ()):
+            buckets = self.__categories[category]
+            buckets[bucket].discard(tile)
+            if not buckets[bucket]:
+                del buckets[bucket]
+                if not buckets:
+                    del self.__categories[category]
+
+    def move(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        """
+        Move the categories of an indexed tile to another tile, as an object of size 1 steps to it.
+        The destination tile must not be indexed.
+
+        :param x0: The x coordinate of the tile left.
+        :type x0: int
+        :param y0: The y coordinate of the tile left.
+        :type y0: int
+        :param x1: The x coordinate of the tile reached.
+        :type x1: int
+        :param y1: The y coordinate of the tile reached.
+        :type y1: int
+        """
+        size, bucket_size, buckets_per_row = (
+            self.__size,
+            self.__bucket_size,
+            self.__buckets,
+        )
+        categories = self.__tiles.pop(y0 * size + x0, None)
+        if categories is None:
+            return
+        tile = y1 * size + x1
+        self.__tiles[tile] = categories
+        bucket = (y0 // bucket_size) * buckets_per_row + x0 // bucket_size
+        new_bucket = (y1 // bucket_size) * buckets_per_row + x1 // bucket_size
+        for category in categories:
+            buckets = self.__categories[category]
+            tiles = buckets[bucket]
+            tiles.discard(y0 * size + x0)
+            if new_bucket != bucket:
+                if not tiles:
+                    del buckets[bucket]
+                tiles = buckets.setdefault(new_bucket, set())
+            tiles.add(tile)
+
+    def copy(self) -> "SpatialIndex":
+        """
+        Copy the index.
+
+        :return: An independent copy of the index.
+        :rtype: SpatialIndex
+        """
+        new_index = SpatialIndex.__new__(SpatialIndex)
+        new_index.__size = self.__size
+        new_index.__bucket_size = self.__bucket_size
+        new_index.__buckets = self.__buckets
+        new_index.__categories = {
+            category: {bucket: tiles.copy() for bucket, tiles in buckets.items()}
+            for category, buckets in self.__categories.items()
+        }
+        new_index.__tiles = self.__tiles.copy()
+        return new_index
+
+    def k_nearest(
+        self,
+        x: int,
+        y: int,
+        keys: list[Category],
+        count: typing.Optional[int] = None,
+        accept: typing.Callable[[int, int], bool] = None,
+    ) -> list[tuple[int, int]]:
+        """
+        Get the nearest tiles of some categories.
+
+        :param x: The x coordinate of the query tile.
+        :type x: int
+        :param y: The y coordinate of the query tile.
+        :type y: int
+        :param keys: The categories to search.
+        :type keys: list[Category]
+        :param count: The maximum number of tiles, None for every tile.
+        :type count: int
+        :param accept: A filter on the (x, y) tiles found, if any.
+        :type accept: Callable[[int, int], bool]
+        :return: The (x, y) tiles, nearest first.
+        :rtype: list[tuple[int, int]]
+        """
+        return self.__search(x, y, keys, count, None, accept)
+
+    def within_radius(
+        self,
+        x: int,
+        y: int,
+        keys: list[Category],
+        radius: int,
+        accept: typing.Callable[[int, int], bool] = None,
+    ) -> list[tuple[int, int]]:
+        """
+        Get the tiles of some categories within a Chebyshev distance.
+
+        :param x: The x coordinate of the query tile.
+        :type x: int
+        :param y: The y coordinate of the query tile.
+        :type y: int
+        :param keys: The categories to search.
+        :type keys: list[Category]
+        :param radius: The maximum distance.
+        :type radius: int
+        :param accept: A filter on the (x, y) tiles found, if any.
+        :type accept: Callable[[int, int], bool]
+        :return: The (x, y) tiles, nearest first.
+        :rtype: list[tuple[int, int]]
+        """
+        return self.__search(x, y, keys, None, radius, accept)
+
+    def __search(
+        self,
+        x: int,
+        y: int,
+        keys: list[Category],
+        count: typing.Optional[int],
+        radius: typing.Optional[int],
+        accept: typing.Optional[typing.Callable[[int, int], bool]],
+    ) -> list[tuple[int, int]]:
+        """
+        Visit the buckets ring by ring around the query tile.
+        After ring r, every tile not visited yet is further than r * bucket_size, so the results up to that distance are final.
+
+        :param x: The x coordinate of the query tile.
+        :type x: int
+        :param y: The y coordinate of the query tile.
+        :type y: int
+        :param keys: The categories to search.
+        :type keys: list[Category]
+        :param count: The maximum number of tiles, None for no limit.
+        :type count: int
+        :param radius: The maximum distance, None for no limit.
+        :type radius: int
+        :param accept: A filter on the (x, y) tiles found, if any.
+        :type accept: Callable[[int, int], bool]
+        :return: The (x, y) tiles, sorted by distance, then by Euclidean distance.
+        :rtype: list[tuple[int, int]]
+        """
+        size, bucket_size, buckets = self.__size, self.__bucket_size, self.__buckets
+        categories = [
+            self.__categories[key] for key in keys if key in self.__categories
+        ]
+        if count is not None and count <= 0:
+            return []
+        bx, by = x // bucket_size, y // bucket_size
+        found = []
+        ring = 0
+        while ring <= buckets:
+            for ny in range(by - ring, by + ring + 1):
+                if not 0 <= ny < buckets:
+                    continue
+                edge = ny in (by - ring, by + ring)
+                for nx in (
+                    range(bx - ring, bx + ring + 1) if edge else (bx - ring, bx + ring)
+                ):
+                    if not 0 <= nx < buckets:
+                        continue
+                    bucket = ny * buckets + nx
+                    for category in categories:
+                        for tile in category.get(bucket, ()):
+                            ty, tx = divmod(tile, size)
+                            distance = max(abs(tx - x), abs(ty - y))
+                            if radius is not None and distance > radius:
+                                continue
+                            if accept is None or accept(tx, ty):
+                                found.append(
+                                    (distance, (tx - x) ** 2 + (ty - y) ** 2, ty, tx)
+                                )
+            final = ring * bucket_size
+            if radius is not None and final >= radius:
+                break
+            if (
+                count is not None
+                and sum(1 for item in found if item[0] <= final) >= count
+            ):
+                break
+            ring += 1
+        found.sort()
+        if count is not None:
+            found = found[:count]
+        return [(tx, ty) for _, _, ty, tx in found]
@@ -9,11 +9,13 @@ class MapType(Enum):
 
     :cvar RICH: Represents the map type with generous resources dotted across the map.
     :cvar GOLD_CENTER: Represents the map type with all the gold at the centre of the map.
+    :cvar CLUSTERED: Represents the map type with the wood in forests and the gold in veins.
     :cvar TEST: Represents the map type for testing purposes.
     """
 
     RICH = 1
     GOLD_CENTER = 2
+    CLUSTERED = 3
     TEST = 9
 
 
@@ -24,11 +26,15 @@ class MapSize(Enum):
     This Enum class defines the various sizes that the map can be.
 
     :cvar SMALL: Represents the small map size of 120x120.
+    :cvar HUGE: Represents the huge map size of 1000x1000, stored in chunks.
+    :cvar GIANT: Represents the giant map size of 2000x2000, stored in chunks.
     """
 
     SMALL = 120
     MEDIUM = 240
     LARGE = 480
+    HUGE = 1000
+    GIANT = 2000
 
 
 class StartingCondition(Enum):
@@ -0,0 +1,217 @@
+import typing
+
+from util.storage.map_storage import MapStorage
+
+if typing.TYPE_CHECKING:
+    from model.game_object import GameObject
+
+
+class ChunkedStorage(MapStorage):
+    """
+    Storage backend for very large and mostly empty maps, keeping the tiles in square chunks allocated on first write.
+
+    Every chunk counts its occupied tiles: a chunk is freed once it is empty again, and the iterators skip the empty chunks,
+    so their cost follows the number of occupied chunks instead of the size of the map.
+    An object table counts how many tiles each object claims, like in the grid storage.
+    """
+
+    CHUNK_SHIFT: int = 5
+    CHUNK_SIZE: int = 1 << CHUNK_SHIFT
+
+    def __init__(self, size: int) -> None:
+        """
+        Create an empty chunked storage. No chunk is allocated.
+
+        :param size: The size of the map.
+        :type size: int
+        """
+        self.__size: int = size
+        self.__chunk_count: int = -(-size // ChunkedStorage.CHUNK_SIZE)
+        self.__chunks: list[typing.Optional[list["GameObject"]]] = [None] * (
+            self.__chunk_count * self.__chunk_count
+        )
+        self.__counts: list[int] = [0] * (self.__chunk_count * self.__chunk_count)
+        self.__objects: dict[int, list] = {}
+
+    def get_size(self) -> int:
+        """
+        Get the size of the stored map.
+
+        :return: The size of the map.
+        :rtype: int
+        """
+        return self.__size
+
+    def get_allocated_chunks(self) -> int:
+        """
+        Get the number of chunks currently allocated, that is holding at least one object.
+
+        :return: The number of allocated chunks.
+        :rtype: int
+        """
+        return sum(1 for chunk in self.__chunks if chunk is not None)
+
+    def get(self, x: int, y: int) -> "GameObject":
+        """
+        Get the object stored on a tile.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :return: The game object on the tile, None if the tile is empty.
+        :rtype: GameObject
+        """
+        shift = ChunkedStorage.CHUNK_SHIFT
+        chunk = self.__chunks[(y >> shift) * self.__chunk_count + (x >> shift)]
+        if chunk is None:
+            return None
+        mask = ChunkedStorage.CHUNK_SIZE - 1
+        return chunk[((y & mask) << shift) + (x & mask)]
+
+    def set(self, x: int, y: int, object: "GameObject") -> None:
+        """
+        Store an object on a tile. Storing None empties the tile.
+        The chunk of the tile is allocated by its first object and freed with its last one.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :param object: The game object to store, or None.
+        :type object: GameObject
+        """
+        shift, mask = ChunkedStorage.CHUNK_SHIFT, ChunkedStorage.CHUNK_SIZE - 1
+        index = (y >> shift) * self.__chunk_count + (x >> shift)
+        chunk = self.__chunks[index]
+        if chunk is None:
+            if object is None:
+                return
+            chunk = [None] * (ChunkedStorage.CHUNK_SIZE * ChunkedStorage.CHUNK_SIZE)
+            self.__chunks[index] = chunk
+        tile = ((y & mask) << shift) + (x & mask)
+        previous = chunk[tile]
+        if previous is object:
+            return
+        if previous is not None:
+            entry = self.__objects[id(previous)]
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self.__objects[id(previous)]
+            self.__counts[index] -= 1
+        if object is not None:
+            entry = self.__objects.get(id(object))
+            if entry is None:
+                self.__objects[id(object)] = [object, 1]
+            else:
+                entry[1] += 1
+            self.__counts[index] += 1
+        chunk[tile] = object
+        if self.__counts[index] == 0:
+            self.__chunks[index] = None
+
+    def items(self) -> typing.Iterator[tuple[int, int, "GameObject"]]:
+        """
+        Iterate over the tiles that are not empty, row by row, skipping the empty chunks.
+
+        :return: An iterator of (x, y, object) tuples.
+        :rtype: Iterator[tuple[int, int, GameObject]]
+        """
+        return self.items_in(0, 0, self.__size - 1, self.__size - 1)
+
+    def items_in(
+        self, from_x: int, from_y: int, to_x: int, to_y: int
+    ) -> typing.Iterator[tuple[int, int, "GameObject"]]:
+        """
+        Iterate over the tiles of a rectangle that are not empty, row by row, skipping the empty chunks.
+
+        :param from_x: The x coordinate of the top left tile.
+        :type from_x: int
+        :param from_y: The y coordinate of the top left tile.
+        :type from_y: int
+        :param to_x: The x coordinate of the bottom right tile, included.
+        :type to_x: int
+        :param to_y: The y coordinate of the bottom right tile, included.
+        :type to_y: int
+        :return: An iterator of (x, y, object) tuples.
+        :rtype: Iterator[tuple[int, int, GameObject]]
+        """
+        shift, size = ChunkedStorage.CHUNK_SHIFT, ChunkedStorage.CHUNK_SIZE
+        from_x, from_y = max(from_x, 0), max(from_y, 0)
+        to_x, to_y = min(to_x, self.__size - 1), min(to_y, self.__size - 1)
+        if from_x > to_x or from_y > to_y:
+            return
+        for chunk_y in range(from_y >> shift, (to_y >> shift) + 1):
+            row = [
+                (
+                    chunk_x << shift,
+                    self.__chunks[chunk_y * self.__chunk_count + chunk_x],
+                )
+                for chunk_x in range(from_x >> shift, (to_x >> shift) + 1)
+            ]
+            row = [(left, chunk) for left, chunk in row if chunk is not None]
+            if not row:
+                continue
+            top = chunk_y << shift
+            for y in range(max(from_y, top), min(to_y, top + size - 1) + 1):
+                offset = (y - top) << shift
+                for left, chunk in row:
+                    start = max(from_x, left) - left
+                    end = min(to_x, left + size - 1) - left
+                    for x, object in enumerate(
+                        chunk[offset + start : offset + end + 1], left + start
+                    ):
+                        if object is not None:
+                            yield x, y, object
+
+    def objects(self) -> list["GameObject"]:
+        """
+        Get every distinct object stored, whatever the number of tiles it covers.
+
+        :return: The list of stored objects.
+        :rtype: list[GameObject]
+        """
+        return [entry[0] for entry in self.__objects.values()]
+
+    def copy(self) -> "ChunkedStorage":
+        """
+        Copy the storage. The objects themselves are shared, not copied.
+
+        :return: A copy of the storage.
+        :rtype: ChunkedStorage
+        """
+        storage = ChunkedStorage.__new__(ChunkedStorage)
+        storage.__size = self.__size
+        storage.__chunk_count = self.__chunk_count
+        storage.__chunks = [
+            None if chunk is None else chunk.copy() for chunk in self.__chunks
+        ]
+        storage.__counts = self.__counts.copy()
+        storage.__objects = {
+            key: [object, count] for key, (object, count) in self.__objects.items()
+        }
+        return storage
+
+    def __getstate__(self) -> dict:
+        """
+        Get the state to pickle. The object table is keyed by id() and is rebuilt on load.
+
+        :return: The state of the storage.
+        :rtype: dict
+        """
+        state = self.__dict__.copy()
+        del state["_ChunkedStorage__objects"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore a pickled storage and rebuild its object table.
+
+        :param state: The state of the storage.
+        :type state: dict
+        """
+        self.__dict__.update(state)
+        self.__objects = {}
+        for _, _, object in self.items():
+            entry = self.__objects.setdefault(id(object), [object, 0])
+            entry[1] += 1
@@ -0,0 +1,92 @@
+import typing
+
+from util.coordinate import Coordinate
+from util.storage.map_storage import MapStorage
+
+if typing.TYPE_CHECKING:
+    from model.game_object import GameObject
+
+
+class DictStorage(MapStorage):
+    """
+    Storage backend keeping the tiles in a dictionary indexed by Coordinate.
+    This is the historical representation of the map, kept for comparison and small maps.
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Create an empty dictionary storage.
+
+        :param size: The size of the map.
+        :type size: int
+        """
+        self.__size: int = size
+        self.__tiles: dict[Coordinate, "GameObject"] = {}
+
+    def get_size(self) -> int:
+        """
+        Get the size of the stored map.
+
+        :return: The size of the map.
+        :rtype: int
+        """
+        return self.__size
+
+    def get(self, x: int, y: int) -> "GameObject":
+        """
+        Get the object stored on a tile.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :return: The game object on the tile, None if the tile is empty.
+        :rtype: GameObject
+        """
+        return self.__tiles.get(Coordinate(x, y))
+
+    def set(self, x: int, y: int, object: "GameObject") -> None:
+        """
+        Store an object on a tile. Storing None empties the tile.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :param object: The game object to store, or None.
+        :type object: GameObject
+        """
+        if object is None:
+            self.__tiles.pop(Coordinate(x, y), None)
+        else:
+            self.__tiles[Coordinate(x, y)] = object
+
+    def items(self) -> typing.Iterator[tuple[int, int, "GameObject"]]:
+        """
+        Iterate over the tiles that are not empty.
+
+        :return: An iterator of (x, y, object) tuples.
+        :rtype: Iterator[tuple[int, int, GameObject]]
+        """
+        for coordinate, object in list(self.__tiles.items()):
+            yield coordinate.get_x(), coordinate.get_y(), object
+
+    def objects(self) -> list["GameObject"]:
+        """
+        Get every distinct object stored, whatever the number of tiles it covers.
+
+        :return: The list of stored objects.
+        :rtype: list[GameObject]
+        """
+        return list({id(object): object for object in self.__tiles.values()}.values())
+
+    def copy(self) -> "DictStorage":
+        """
+        Copy the storage. The objects themselves are shared, not copied.
+
+        :return: A copy of the storage.
+        :rtype: DictStorage
+        """
+        storage = DictStorage(self.__size)
+        storage.__tiles = self.__tiles.copy()
+        return storage
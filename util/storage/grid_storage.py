@@ -0,0 +1,163 @@
+import typing
+
+from util.storage.map_storage import MapStorage
+
+if typing.TYPE_CHECKING:
+    from model.game_object import GameObject
+
+
+class GridStorage(MapStorage):
+    """
+    Storage backend keeping the tiles in a flat list indexed by y * size + x.
+
+    An object table counts how many tiles each object claims, so the stored objects can be listed without scanning the whole grid.
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Create an empty grid storage.
+
+        :param size: The size of the map.
+        :type size: int
+        """
+        self.__size: int = size
+        self.__tiles: list["GameObject"] = [None] * (size * size)
+        self.__objects: dict[int, list] = {}
+
+    def get_size(self) -> int:
+        """
+        Get the size of the stored map.
+
+        :return: The size of the map.
+        :rtype: int
+        """
+        return self.__size
+
+    def get(self, x: int, y: int) -> "GameObject":
+        """
+        Get the object stored on a tile.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :return: The game object on the tile, None if the tile is empty.
+        :rtype: GameObject
+        """
+        return self.__tiles[y * self.__size + x]
+
+    def set(self, x: int, y: int, object: "GameObject") -> None:
+        """
+        Store an object on a tile. Storing None empties the tile.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :param object: The game object to store, or None.
+        :type object: GameObject
+        """
+        index = y * self.__size + x
+        previous = self.__tiles[index]
+        if previous is object:
+            return
+        if previous is not None:
+            entry = self.__objects[id(previous)]
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self.__objects[id(previous)]
+        if object is not None:
+            entry = self.__objects.get(id(object))
+            if entry is None:
+                self.__objects[id(object)] = [object, 1]
+            else:
+                entry[1] += 1
+        self.__tiles[index] = object
+
+    def items(self) -> typing.Iterator[tuple[int, int, "GameObject"]]:
+        """
+        Iterate over the tiles that are not empty.
+
+        :return: An iterator of (x, y, object) tuples.
+        :rtype: Iterator[tuple[int, int, GameObject]]
+        """
+        size = self.__size
+        for index, object in enumerate(self.__tiles):
+            if object is not None:
+                yield index % size, index // size, object
+
+    def items_in(
+        self, from_x: int, from_y: int, to_x: int, to_y: int
+    ) -> typing.Iterator[tuple[int, int, "GameObject"]]:
+        """
+        Iterate over the tiles of a rectangle that are not empty, row by row, slicing the rows of the grid.
+
+        :param from_x: The x coordinate of the top left tile.
+        :type from_x: int
+        :param from_y: The y coordinate of the top left tile.
+        :type from_y: int
+        :param to_x: The x coordinate of the bottom right tile, included.
+        :type to_x: int
+        :param to_y: The y coordinate of the bottom right tile, included.
+        :type to_y: int
+        :return: An iterator of (x, y, object) tuples.
+        :rtype: Iterator[tuple[int, int, GameObject]]
+        """
+        size = self.__size
+        from_x, to_x = max(from_x, 0), min(to_x, size - 1)
+        for y in range(max(from_y, 0), min(to_y, size - 1) + 1):
+            row = y * size
+            for x, object in enumerate(
+                self.__tiles[row + from_x : row + to_x + 1], from_x
+            ):
+                if object is not None:
+                    yield x, y, object
+
+    def objects(self) -> list["GameObject"]:
+        """
+        Get every distinct object stored, whatever the number of tiles it covers.
+
+        :return: The list of stored objects.
+        :rtype: list[GameObject]
+        """
+        return [entry[0] for entry in self.__objects.values()]
+
+    def copy(self) -> "GridStorage":
+        """
+        Copy the storage. The objects themselves are shared, not copied.
+
+        :return: A copy of the storage.
+        :rtype: GridStorage
+        """
+        storage = GridStorage.__new__(GridStorage)
+        storage.__size = self.__size
+        storage.__tiles = self.__tiles.copy()
+        storage.__objects = {
+            key: [object, count] for key, (object, count) in self.__objects.items()
+        }
+        return storage
+
+    def __getstate__(self) -> dict:
+        """
+        Get the state to pickle. The object table is keyed by id() and is rebuilt on load.
+
+        :return: The state of the storage.
+        :rtype: dict
+        """
+        state = self.__dict__.copy()
+        del state["_GridStorage__objects"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore a pickled storage and rebuild its object table.
+
+        :param state: The state of the storage.
+        :type state: dict
+        """
+        self.__dict__.update(state)
+        self.__objects = {}
+        for object in self.__tiles:
+            if object is not None:
+                entry = self.__objects.setdefault(id(object), [object, 0])
+                entry[1] += 1
@@ -0,0 +1,107 @@
+import typing
+from abc import ABC, abstractmethod
+
+if typing.TYPE_CHECKING:
+    from model.game_object import GameObject
+
+
+class MapStorage(ABC):
+    """
+    Interface for the backends storing the tiles of a Map.
+
+    A storage only deals with integer coordinates that are already known to be inside the map.
+    Bounds checks, placement rules and everything else stay in the Map class.
+    """
+
+    @abstractmethod
+    def get_size(self) -> int:
+        """
+        Get the size of the stored map.
+
+        :return: The size of the map.
+        :rtype: int
+        """
+        pass
+
+    @abstractmethod
+    def get(self, x: int, y: int) -> "GameObject":
+        """
+        Get the object stored on a tile.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :return: The game object on the tile, None if the tile is empty.
+        :rtype: GameObject
+        """
+        pass
+
+    @abstractmethod
+    def set(self, x: int, y: int, object: "GameObject") -> None:
+        """
+        Store an object on a tile. Storing None empties the tile.
+
+        :param x: The x coordinate of the tile.
+        :type x: int
+        :param y: The y coordinate of the tile.
+        :type y: int
+        :param object: The game object to store, or None.
+        :type object: GameObject
+        """
+        pass
+
+    @abstractmethod
+    def items(self) -> typing.Iterator[tuple[int, int, "GameObject"]]:
+        """
+        Iterate over the tiles that are not empty.
+
+        :return: An iterator of (x, y, object) tuples.
+        :rtype: Iterator[tuple[int, int, GameObject]]
+        """
+        pass
+
+    def items_in(
+        self, from_x: int, from_y: int, to_x: int, to_y: int
+    ) -> typing.Iterator[tuple[int, int, "GameObject"]]:
+        """
+        Iterate over the tiles of a rectangle that are not empty, row by row.
+        Backends able to skip empty areas override it.
+
+        :param from_x: The x coordinate of the top left tile.
+        :type from_x: int
+        :param from_y: The y coordinate of the top left tile.
+        :type from_y: int
+        :param to_x: The x coordinate of the bottom right tile, included.
+        :type to_x: int
+        :param to_y: The y coordinate of the bottom right tile, included.
+        :type to_y: int
+        :return: An iterator of (x, y, object) tuples.
+        :rtype: Iterator[tuple[int, int, GameObject]]
+        """
+        size = self.get_size()
+        for y in range(max(from_y, 0), min(to_y, size - 1) + 1):
+            for x in range(max(from_x, 0), min(to_x, size - 1) + 1):
+                object = self.get(x, y)
+                if object is not None:
+                    yield x, y, object
+
+    @abstractmethod
+    def objects(self) -> list["GameObject"]:
+        """
+        Get every distinct object stored, whatever the number of tiles it covers.
+
+        :return: The list of stored objects.
+        :rtype: list[GameObject]
+        """
+        pass
+
+    @abstractmethod
+    def copy(self) -> "MapStorage":
+        """
+        Copy the storage. The objects themselves are shared, not copied.
+
+        :return: A copy of the storage.
+        :rtype: MapStorage
+        """
+        pass
@@ -0,0 +1,181 @@
+import math
+import time
+import typing
+from collections import deque
+
+"""
+This file contains the TickScheduler class, which runs the simulation at a fixed timestep whatever the frame rate,
+without depending on pygame.
+"""
+
+
+class TickScheduler:
+    """
+    Fixed-timestep scheduler of the ticks of the simulation.
+
+    Every frame, the real time elapsed since the previous frame, multiplied by the speed, is added to an accumulator,
+    and a tick is run for every whole timestep it holds, so the simulation catches up after a slow frame.
+    The accumulator counts ticks rather than seconds, so that whole ticks are subtracted from it without rounding errors.
+    At most MAX_STEPS ticks are run per frame: when the simulation cannot keep up, the rest of the late time is dropped
+    instead of piling up. The ticks always advance the simulated time by exactly one timestep, so the simulation only
+    depends on the number of ticks run, not on the frame rate.
+    The durations of the last HISTORY ticks are kept to report percentiles.
+    """
+
+    MAX_STEPS: int = 8
+    HISTORY: int = 1024
+    IDLE: float = 0.05
+
+    def __init__(
+        self,
+        tick_rate: float,
+        speed: float = 1,
+        max_steps: int = MAX_STEPS,
+        clock: typing.Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        Create a scheduler.
+
+        :param tick_rate: The number of ticks per second of simulated time.
+        :type tick_rate: float
+        :param speed: The number of seconds of simulated time per second of real time, 0 to pause.
+        :type speed: float
+        :param max_steps: The maximum number of ticks run per frame.
+        :type max_steps: int
+        :param clock: The real time clock, in seconds.
+        :type clock: Callable[[], float]
+        """
+        self.__tick_rate: float = tick_rate
+        self.__timestep: float = 1 / tick_rate
+        self.__speed: float = speed
+        self.__max_steps: int = max_steps
+        self.__clock: typing.Callable[[], float] = clock
+        self.__last: typing.Optional[float] = None
+        self.__accumulator: float = 0
+        self.__tick: int = 0
+        self.__dropped: int = 0
+        self.__durations: deque[float] = deque(maxlen=TickScheduler.HISTORY)
+
+    def get_timestep(self) -> float:
+        """
+        Get the simulated time advanced by a tick.
+
+        :return: The timestep, in seconds.
+        :rtype: float
+        """
+        return self.__timestep
+
+    def get_speed(self) -> float:
+        """
+        Get the speed multiplier of the simulated time.
+
+        :return: The speed, 0 if paused.
+        :rtype: float
+        """
+        return self.__speed
+
+    def set_speed(self, speed: float) -> None:
+        """
+        Set the speed multiplier of the simulated time. It applies from the next frame.
+
+        :param speed: The number of seconds of simulated time per second of real time, 0 to pause.
+        :type speed: float
+        """
+        self.__speed = speed
+
+    def get_tick(self) -> int:
+        """
+        Get the number of ticks run.
+
+        :return: The number of ticks.
+        :rtype: int
+        """
+        return self.__tick
+
+    def get_simulated_time(self) -> float:
+        """
+        Get the simulated time, which only depends on the number of ticks run.
+
+        :return: The simulated time, in seconds.
+        :rtype: float
+        """
+        return self.__tick * self.__timestep
+
+    def get_dropped(self) -> int:
+        """
+        Get the number of ticks dropped because a frame would have run more than the maximum number of ticks.
+
+        :return: The number of dropped ticks.
+        :rtype: int
+        """
+        return self.__dropped
+
+    def advance(self, step: typing.Callable[[], None]) -> int:
+        """
+        Run the ticks due since the previous frame.
+
+        :param step: The function running a tick of the simulation.
+        :type step: Callable[[], None]
+        :return: The number of ticks run.
+        :rtype: int
+        """
+        now = self.__clock()
+        if self.__last is not None:
+            self.__accumulator += (now - self.__last) * self.__speed * self.__tick_rate
+        self.__last = now
+        steps = 0
+        while self.__accumulator >= 1 and steps < self.__max_steps:
+            start = self.__clock()
+            step()
+            self.__durations.append(self.__clock() - start)
+            self.__accumulator -= 1
+            self.__tick += 1
+            steps += 1
+        if self.__accumulator >= 1:
+            late = int(self.__accumulator)
+            self.__dropped += late
+            self.__accumulator -= late
+        return steps
+
+    def get_wait(self) -> float:
+        """
+        Get the real time left before the next tick is due.
+
+        :return: The time to wait, in seconds, IDLE if paused.
+        :rtype: float
+        """
+        if self.__speed <= 0:
+            return TickScheduler.IDLE
+        due = (1 - self.__accumulator) * self.__timestep / self.__speed
+        if self.__last is not None:
+            due -= self.__clock() - self.__last
+        return max(due, 0)
+
+    def wait(self) -> None:
+        """
+        Sleep until the next tick is due.
+        """
+        time.sleep(self.get_wait())
+
+    def get_percentiles(
+        self, percentiles: typing.Iterable[float] = (50, 90, 99)
+    ) -> dict[float, float]:
+        """
+        Get percentiles of the durations of the last ticks, with the nearest-rank method.
+
+        :param percentiles: The percentiles, between 0 and 100.
+        :type percentiles: Iterable[float]
+        :return: The duration of each percentile, in milliseconds, empty if no tick was run.
+        :rtype: dict[float, float]
+        """
+        durations = sorted(self.__durations)
+        if not durations:
+            return {}
+        last = len(durations) - 1
+        return {
+            percentile: durations[
+                min(max(math.ceil(percentile * len(durations) / 100) - 1, 0), last)
+            ]
+            * 1000
+            for percentile in percentiles
+        }
@@ -39,6 +39,9 @@ class TerminalView(BaseView):
 
         self.__size()
         self.__map: Map = self._BaseView__controller.get_map()
+        self.__view_version: int = 0
+        self.__view_range: tuple[Coordinate, Coordinate] = None
+        self.__map_lines: list[str] = []
 
         self.__display_thread = threading.Thread(target=self.__display_loop)
         # self.__input_thread = threading.Thread(target=self.__input_loop)
@@ -85,8 +88,16 @@ class TerminalView(BaseView):
         map_width = min(self.__terminal_width - 2, self.__map.get_size())
         map_height = min(self.__terminal_height - 2, self.__map.get_size())
         self.__to_coord = self.__from_coord + Coordinate(map_width, map_height)
-        self.__view = self.__map.get_from_to(self.__from_coord, self.__to_coord)
-        map_lines = str(self.__view).split("\n")
+        # The part of the map is only cut again when the viewport moved or one of its chunks changed
+        view_range = (self.__from_coord, self.__to_coord)
+        if self.__view_range != view_range or self.__map.is_dirty(
+            self.__view_version, *view_range
+        ):
+            self.__view_version = self.__map.get_version()
+            self.__view_range = view_range
+            self.__view = self.__map.get_from_to(self.__from_coord, self.__to_coord)
+            self.__map_lines = str(self.__view).split("\n")
+        map_lines = self.__map_lines
         cropped_lines = [line[:map_width] for line in map_lines[:map_height]]
         return cropped_lines
 